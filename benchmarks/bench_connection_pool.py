@@ -0,0 +1,140 @@
+"""Benchmark per-request latency of the baseline client vs. per-host pools.
+
+Runs one local keep-alive HTTP server per API host (five distinct
+`host:port` origins), each charging a fixed setup cost for every new
+connection (standing in for the TCP + TLS handshake to the real hosts).
+Polling bursts hit all five hosts, with an idle gap between bursts:
+
+* baseline: `httpx.Client(timeout=30.0)`, the client the library built before
+  per-host pools, i.e. one shared pool with httpx's default limits (20
+  keep-alive connections in total, expiring after 5 seconds idle)
+* pooled: `OddsblazeClient` with its default per-host limits and `warmup()`
+  called once at startup
+
+With the default 6 second gap the baseline's idle connections expire between
+bursts; `--width` above 4 also overflows its 20 shared keep-alive slots.
+
+Usage:
+    python benchmarks/bench_connection_pool.py [--bursts 10] [--interval 6]
+"""
+
+import argparse
+import json
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+from oddsblaze import OddsblazeClient
+from oddsblaze.settings import OddsblazeSettings
+
+BODY = json.dumps([{"id": "nba", "name": "NBA", "sport": "Basketball"}]).encode()
+
+
+def make_handler(handshake_s: float) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def setup(self) -> None:
+            time.sleep(handshake_s)
+            super().setup()
+
+        def do_GET(self) -> None:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(BODY)))
+            self.end_headers()
+            self.wfile.write(BODY)
+
+        def do_HEAD(self) -> None:
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    return Handler
+
+
+def start_hosts(handshake_s: float) -> list[ThreadingHTTPServer]:
+    """One server, and so one distinct origin, per API host."""
+    servers = []
+    for _ in range(5):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(handshake_s))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+    return servers
+
+
+def make_client(bases: list[str]) -> OddsblazeClient:
+    class LocalClient(OddsblazeClient):
+        BASE_URL = f"{bases[0]}/v2"
+        ODDS_URL = f"{bases[1]}/odds"
+        HISTORICAL_URL = f"{bases[2]}/historical"
+        GRADER_URL = f"{bases[3]}/grader"
+        POLLED_URL = f"{bases[4]}/polled"
+
+    settings = OddsblazeSettings.model_construct(api_key="bench", price_format=None)
+    return LocalClient(settings=settings)
+
+
+def burst(http: httpx.Client, urls: list[str], width: int) -> list[float]:
+    targets = [url for url in urls for _ in range(width)]
+
+    def timed(url: str) -> float:
+        start = time.perf_counter()
+        http.get(url).raise_for_status()
+        return time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=len(targets)) as pool:
+        return list(pool.map(timed, targets))
+
+
+def run(
+    http: httpx.Client, urls: list[str], bursts: int, width: int, interval: float
+) -> list[float]:
+    samples: list[float] = []
+    for i in range(bursts):
+        if i:
+            time.sleep(interval)
+        samples += burst(http, urls, width)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bursts", type=int, default=10)
+    parser.add_argument("--width", type=int, default=8, help="requests per host")
+    parser.add_argument("--interval", type=float, default=6.0, help="idle seconds")
+    parser.add_argument("--handshake-ms", type=float, default=30.0)
+    args = parser.parse_args()
+
+    servers = start_hosts(args.handshake_ms / 1000)
+    bases = [f"http://127.0.0.1:{s.server_port}" for s in servers]
+    client = make_client(bases)
+    urls = client._host_urls()
+
+    baseline = httpx.Client(timeout=30.0)
+    baseline_samples = run(baseline, urls, args.bursts, args.width, args.interval)
+    baseline.close()
+
+    client.warmup(connections=args.width)
+    pooled_samples = run(client._client, urls, args.bursts, args.width, args.interval)
+    client.close()
+    for server in servers:
+        server.shutdown()
+
+    for name, samples in (("baseline", baseline_samples), ("pooled", pooled_samples)):
+        samples.sort()
+        p50 = statistics.median(samples) * 1000
+        p99 = samples[int(len(samples) * 0.99) - 1] * 1000
+        print(f"{name}: n={len(samples)} p50={p50:.2f}ms p99={p99:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
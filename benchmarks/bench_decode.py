@@ -0,0 +1,61 @@
+"""Benchmark two-pass vs. single-pass decoding of an odds board.
+
+Builds a large board by repeating the events of the recorded payload in
+tests/fixtures/odds.json, then times:
+
+* two-pass: `response.json()` followed by `OddsResponse.model_validate`
+* single-pass: `decode()`, which hands the bytes to pydantic-core directly
+
+Usage:
+    python benchmarks/bench_decode.py [--events 2000] [--repeat 5]
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Callable
+
+from oddsblaze.decoding import decode
+from oddsblaze.models import OddsResponse
+
+FIXTURE = Path(__file__).parent.parent / "tests" / "fixtures" / "odds.json"
+
+
+def build_board(n_events: int) -> bytes:
+    data = json.loads(FIXTURE.read_bytes())
+    template = data["events"]
+    data["events"] = [
+        {**template[i % len(template)], "id": f"event-{i}"} for i in range(n_events)
+    ]
+    return json.dumps(data).encode()
+
+
+def best_of(repeat: int, fn: Callable[[], object]) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    body = build_board(args.events)
+    two_pass = best_of(
+        args.repeat, lambda: OddsResponse.model_validate(json.loads(body))
+    )
+    single_pass = best_of(args.repeat, lambda: decode(body, OddsResponse))
+
+    print(f"payload: {len(body) / 1e6:.1f} MB, {args.events} events")
+    print(f"two-pass:    {two_pass * 1000:.1f} ms")
+    print(f"single-pass: {single_pass * 1000:.1f} ms ({two_pass / single_pass:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
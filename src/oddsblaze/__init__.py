@@ -3,7 +3,11 @@
 from importlib.metadata import version
 
 from .async_client import AsyncOddsblazeClient
+from .board import BookPrice, OddsBoard
+from .bulk import GradeResult, OddsResult
+from .cache import ResponseCache
 from .client import OddsblazeClient
+from .diff import Added, Changed, OddsDiffer, Removed
 from .exceptions import (
     AuthenticationError,
     EventNotFoundError,
@@ -11,7 +15,15 @@ from .exceptions import (
     OddsblazeError,
     PlayerNotFoundError,
 )
+from .grades import GradeCache
+from .hedging import HedgePolicy
+from .historical import HistoricalStore
+from .polling import AsyncPollingEngine, PollingEngine
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .scheduler import AsyncRefreshScheduler, RefreshScheduler
 from .settings import OddsblazeSettings, PriceFormat, get_settings
+from .tiered import AsyncTieredRefresher, TieredRefresher
 
 __version__ = version("oddsblaze")
 
@@ -19,6 +31,27 @@ __all__ = [
     # Client
     "OddsblazeClient",
     "AsyncOddsblazeClient",
+    "ResponseCache",
+    "OddsResult",
+    "GradeCache",
+    "GradeResult",
+    "HistoricalStore",
+    "RetryPolicy",
+    "RateLimiter",
+    "HedgePolicy",
+    "PollingEngine",
+    "AsyncPollingEngine",
+    "RefreshScheduler",
+    "AsyncRefreshScheduler",
+    "TieredRefresher",
+    "AsyncTieredRefresher",
+    # Indexes and diffs
+    "OddsBoard",
+    "BookPrice",
+    "OddsDiffer",
+    "Added",
+    "Changed",
+    "Removed",
     # Settings
     "OddsblazeSettings",
     "PriceFormat",
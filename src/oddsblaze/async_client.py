@@ -1,22 +1,65 @@
 """Async OddsBlaze API client."""
 
-from typing import Any, Optional
+import asyncio
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Hashable,
+    Iterable,
+    Literal,
+    Optional,
+    overload,
+)
 
 import httpx
 
-from .exceptions import AuthenticationError, raise_for_error_message
+from .bulk import GradeResult, OddsResult
+from .cache import (
+    ResponseCache,
+    Validators,
+    ValidatorStore,
+    body_digest,
+    cache_key,
+)
+from .chunking import (
+    DEFAULT_CHUNK_SIZE,
+    MAX_CHUNK_CONCURRENCY,
+    chunk_params,
+    merge_responses,
+)
+from .coalesce import AsyncSingleFlight
+from .decoding import decode, requested_price_format
+from .exceptions import AuthenticationError
+from .grades import GradeCache
+from .hedging import HedgePolicy
+from .historical import HistoricalStore, historical_key
 from .models import (
     ActiveMarketsResponse,
     ConsensusResponse,
+    Event,
     GraderResponse,
     HistoricalResponse,
+    LazyConsensusResponse,
+    LazyHistoricalResponse,
+    LazyOddsResponse,
+    LazyPolledResponse,
     League,
     OddsResponse,
     PolledResponse,
     ScheduleResponse,
     Sportsbook,
 )
+from .models.base import price_format_context, set_price_format
+from .models.raw import RawOddsResponse
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
 from .settings import OddsblazeSettings, PriceFormat, get_settings
+from .streaming import EventStreamParser
+from .transport import build_async_mounts, host_of
+
+if TYPE_CHECKING:
+    from .columnar import HistoricalColumns
 
 
 class AsyncOddsblazeClient:
@@ -32,9 +75,81 @@ class AsyncOddsblazeClient:
         self,
         settings: Optional[OddsblazeSettings] = None,
         timeout: float = 30.0,
+        *,
+        limits: Optional[httpx.Limits] = None,
+        host_limits: Optional[dict[str, httpx.Limits]] = None,
+        http2: bool = False,
+        cache: Optional[ResponseCache] = None,
+        conditional: bool = False,
+        coalesce: bool = True,
+        grade_cache: Optional[GradeCache] = None,
+        historical_store: Optional[HistoricalStore] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        hedge: Optional[HedgePolicy] = None,
+        chunk_size: Optional[int] = DEFAULT_CHUNK_SIZE,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
     ):
+        """
+        Create an async client.
+
+        Each API host gets its own connection pool so a burst against one
+        host never queues behind another.
+
+        Args:
+            settings: Settings to use (defaults to env/file config)
+            timeout: Request timeout in seconds
+            limits: Pool limits applied to every host (see `DEFAULT_LIMITS`)
+            host_limits: Per-host pool limits keyed by URL or `https://host`
+            http2: Multiplex requests over HTTP/2 (requires `oddsblaze[http2]`)
+            cache: Opt-in cache for metadata endpoints (see `ResponseCache`)
+            conditional: Send ETag/If-Modified-Since validators and reuse the
+                previous result when the server answers 304 or the body is
+                unchanged
+            coalesce: Share one in-flight request (and its result) between
+                concurrent coroutines asking for the same URL and params
+            grade_cache: Persistent store of final grades (see `GradeCache`)
+            historical_store: Persistent store of closed historical odds (see
+                `HistoricalStore`)
+            retry: Retry 429s, 5xx and transport errors with backoff (see
+                `RetryPolicy`)
+            rate_limiter: Token bucket every request waits on, shared by all
+                endpoints (see `RateLimiter`)
+            hedge: Race a backup request against slow `get_odds` calls (see
+                `HedgePolicy`)
+            chunk_size: Most values of one list filter (`event`, `market`,
+                `team`, ...) per request; longer filters are split into
+                concurrent requests whose events are merged (None to disable)
+            transport: Custom transport for all hosts (e.g. `httpx.MockTransport`)
+        """
         self.settings = settings or get_settings()
-        self._client = httpx.AsyncClient(timeout=timeout)
+        self._cache = cache
+        self._grade_cache = grade_cache
+        self._historical_store = historical_store
+        self._retry = retry
+        self._rate_limiter = rate_limiter
+        self._chunk_size = chunk_size
+        self._hedge = hedge
+        self._validators = ValidatorStore() if conditional else None
+        self._inflight = AsyncSingleFlight() if coalesce else None
+        mounts = None
+        if transport is None:
+            mounts = build_async_mounts(
+                self._host_urls(), limits=limits, host_limits=host_limits, http2=http2
+            )
+        self._client = httpx.AsyncClient(
+            timeout=timeout, transport=transport, mounts=mounts
+        )
+
+    def _host_urls(self) -> list[str]:
+        """URLs of every API host this client talks to."""
+        return [
+            self.BASE_URL,
+            self.ODDS_URL,
+            self.HISTORICAL_URL,
+            self.GRADER_URL,
+            self.POLLED_URL,
+        ]
 
     def _require_api_key(self) -> str:
         """Get API key or raise AuthenticationError."""
@@ -67,26 +182,194 @@ class AsyncOddsblazeClient:
 
         return params
 
-    async def _request(self, url: str, params: dict[str, str]) -> Any:
-        """Make async GET request and handle errors."""
-        response = await self._client.get(url, params=params)
+    async def _request(
+        self,
+        url: str,
+        params: dict[str, str],
+        response_type: Any,
+        *,
+        endpoint: Optional[str] = None,
+    ) -> Any:
+        """Make async GET request, handle errors and validate the response."""
+        key = (cache_key(url, params), response_type)
+        ttl = self._cache.ttl(endpoint) if self._cache is not None else None
+        if ttl:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+
+        if self._inflight is None:
+            return await self._fetch(url, params, response_type, key, ttl)
+        return await self._inflight.do(
+            key, lambda: self._fetch(url, params, response_type, key, ttl)
+        )
+
+    async def _request_chunked(
+        self,
+        url: str,
+        params: dict[str, str],
+        response_type: Any,
+        keys: tuple[str, ...],
+        *,
+        endpoint: Optional[str] = None,
+    ) -> Any:
+        """Make the request, split into concurrent chunks if a filter is long."""
+        chunks = [params]
+        if self._chunk_size is not None:
+            chunks = chunk_params(params, keys, self._chunk_size)
+        if len(chunks) == 1:
+            return await self._request(url, params, response_type, endpoint=endpoint)
+        semaphore = asyncio.Semaphore(MAX_CHUNK_CONCURRENCY)
+
+        async def fetch(chunk: dict[str, str]) -> Any:
+            async with semaphore:
+                return await self._request(url, chunk, response_type, endpoint=endpoint)
+
+        return merge_responses(await asyncio.gather(*map(fetch, chunks)))
+
+    async def _fetch(
+        self,
+        url: str,
+        params: dict[str, str],
+        response_type: Any,
+        key: Hashable,
+        ttl: Optional[float],
+    ) -> Any:
+        """Send the request, reusing the last result if it is unchanged."""
+        seen = self._validators.get(key) if self._validators is not None else None
+        response = await self._send(url, params, seen.headers() if seen else None)
 
         if response.status_code == 401:
             raise AuthenticationError(
                 "Invalid or expired API key. Get a new key at oddsblaze.com"
             )
 
-        response.raise_for_status()
-        data = response.json()
+        if seen is not None and response.status_code == 304:
+            result, size = seen.result, seen.size
+        else:
+            response.raise_for_status()
+            size = len(response.content)
+            digest = b""
+            if self._validators is not None:
+                digest = body_digest(response.content)
+            if seen is not None and seen.digest == digest:
+                result = seen.result
+            else:
+                result = decode(
+                    response.content, response_type, requested_price_format(params)
+                )
+            if self._validators is not None:
+                self._validators.set(
+                    key,
+                    Validators(
+                        etag=response.headers.get("ETag"),
+                        last_modified=response.headers.get("Last-Modified"),
+                        digest=digest,
+                        size=size,
+                        result=result,
+                    ),
+                )
+
+        if ttl:
+            self._cache.set(key, result, size, ttl)
+        return result
+
+    async def _send(
+        self, url: str, params: dict[str, str], headers: Optional[dict[str, str]]
+    ) -> httpx.Response:
+        """GET through the rate limiter, retrying as the retry policy allows."""
+        attempt = 0
+        while True:
+            await self._throttle()
+            try:
+                response = await self._get(url, params, headers)
+            except Exception as e:
+                if self._retry is None or not isinstance(e, self._retry.exceptions):
+                    raise
+                delay = self._retry.delay(attempt)
+                if delay is None:
+                    raise
+            else:
+                if self._retry is None:
+                    return response
+                delay = self._retry.delay(attempt, response)
+                if delay is None:
+                    return response
+                if response.status_code == 429 and self._rate_limiter is not None:
+                    # Throttled: hold back every request of this client.
+                    self._rate_limiter.pause(delay)
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def _get(
+        self, url: str, params: dict[str, str], headers: Optional[dict[str, str]]
+    ) -> httpx.Response:
+        """GET, hedged with a backup request if odds are slow to arrive."""
+        hedge = self._hedge if url == self.ODDS_URL else None
+        if hedge is None:
+            return await self._client.get(url, params=params, headers=headers)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        primary = asyncio.ensure_future(
+            self._client.get(url, params=params, headers=headers)
+        )
+        tasks = {primary}
+        try:
+            delay = hedge.delay()
+            if delay is not None:
+                await asyncio.wait(tasks, timeout=delay)
+            if primary.done() or delay is None or not self._may_hedge(hedge):
+                response = await primary
+                hedge.record(loop.time() - started)
+                return response
+
+            backup_started = loop.time()
+            backup = asyncio.ensure_future(
+                self._client.get(url, params=params, headers=headers)
+            )
+            tasks.add(backup)
+            while True:
+                done, pending = await asyncio.wait(
+                    tasks, return_when=asyncio.FIRST_COMPLETED
+                )
+                # Prefer an answer; fall back to an error once both fail.
+                winner = next((t for t in done if t.exception() is None), None)
+                if winner is not None or not pending:
+                    winner = winner or done.pop()
+                    break
+                tasks = pending
+            response = winner.result()
+            hedge_won = winner is backup
+            hedge.record(
+                loop.time() - (backup_started if hedge_won else started), hedge_won
+            )
+            return response
+        finally:
+            for task in tasks:
+                task.cancel()
 
-        if isinstance(data, dict) and "message" in data and len(data) == 1:
-            raise_for_error_message(data["message"])
+    def _may_hedge(self, hedge: HedgePolicy) -> bool:
+        """Whether the hedge budget and rate limiter both allow a hedge now."""
+        if not hedge.try_spend():
+            return False
+        # Only take a limiter token for a hedge that will really be sent.
+        if self._rate_limiter is not None and not self._rate_limiter.try_acquire():
+            hedge.refund()
+            return False
+        return True
 
-        return data
+    async def _throttle(self) -> None:
+        """Wait for a rate limiter token, if rate limiting is on."""
+        if self._rate_limiter is not None:
+            wait = self._rate_limiter.reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
 
     # -------------------------------------------------------------------------
     # Odds API
     # -------------------------------------------------------------------------
+    @overload
     async def get_odds(
         self,
         sportsbook: str,
@@ -98,7 +381,56 @@ class AsyncOddsblazeClient:
         event: Optional[str | list[str]] = None,
         main: Optional[bool] = None,
         live: Optional[bool] = None,
-    ) -> OddsResponse:
+        validate: Literal[True] = True,
+        lazy: Literal[False] = False,
+    ) -> OddsResponse: ...
+
+    @overload
+    async def get_odds(
+        self,
+        sportsbook: str,
+        league: str,
+        *,
+        market: Optional[str | list[str]] = None,
+        market_contains: Optional[str | list[str]] = None,
+        price: Optional[PriceFormat] = None,
+        event: Optional[str | list[str]] = None,
+        main: Optional[bool] = None,
+        live: Optional[bool] = None,
+        validate: Literal[True] = True,
+        lazy: Literal[True],
+    ) -> LazyOddsResponse: ...
+
+    @overload
+    async def get_odds(
+        self,
+        sportsbook: str,
+        league: str,
+        *,
+        market: Optional[str | list[str]] = None,
+        market_contains: Optional[str | list[str]] = None,
+        price: Optional[PriceFormat] = None,
+        event: Optional[str | list[str]] = None,
+        main: Optional[bool] = None,
+        live: Optional[bool] = None,
+        validate: Literal[False],
+        lazy: bool = False,
+    ) -> RawOddsResponse: ...
+
+    async def get_odds(
+        self,
+        sportsbook: str,
+        league: str,
+        *,
+        market: Optional[str | list[str]] = None,
+        market_contains: Optional[str | list[str]] = None,
+        price: Optional[PriceFormat] = None,
+        event: Optional[str | list[str]] = None,
+        main: Optional[bool] = None,
+        live: Optional[bool] = None,
+        validate: bool = True,
+        lazy: bool = False,
+    ) -> OddsResponse | LazyOddsResponse | RawOddsResponse:
         """
         Get real-time odds for a sportsbook and league.
 
@@ -111,6 +443,10 @@ class AsyncOddsblazeClient:
             event: Event ID(s) to filter
             main: True for main lines only, False for alternates only
             live: True for live events only, False for pre-match only
+            validate: False to skip pydantic and return the decoded JSON as
+                plain dicts (see `RawOddsResponse` for guaranteed keys)
+            lazy: Return a `LazyOddsResponse` that validates each event's odds
+                only when they are first read
         """
         params = self._build_params(
             require_auth=True,
@@ -123,12 +459,131 @@ class AsyncOddsblazeClient:
             main=main,
             live=live,
         )
-        data = await self._request(self.ODDS_URL, params)
-        return OddsResponse.model_validate(data)
+        response_type: Any = None
+        if validate:
+            response_type = LazyOddsResponse if lazy else OddsResponse
+        return await self._request_chunked(
+            self.ODDS_URL, params, response_type, ("event", "market", "market_contains")
+        )
+
+    async def iter_odds(
+        self,
+        sportsbook: str,
+        league: str,
+        *,
+        market: Optional[str | list[str]] = None,
+        market_contains: Optional[str | list[str]] = None,
+        price: Optional[PriceFormat] = None,
+        event: Optional[str | list[str]] = None,
+        main: Optional[bool] = None,
+        live: Optional[bool] = None,
+        chunk_size: int = 64 * 1024,
+    ) -> AsyncIterator[Event]:
+        """
+        Stream odds for a sportsbook and league one event at a time.
+
+        The body is parsed incrementally as it downloads and each `Event` is
+        validated and yielded as soon as it is complete, so the first event
+        arrives before the board finishes downloading and memory use does
+        not grow with the size of the board.
+
+        Args:
+            sportsbook: Sportsbook ID (e.g., "draftkings")
+            league: League ID (e.g., "nfl")
+            market: Market ID(s) or name(s) to filter
+            market_contains: Filter markets containing these strings
+            price: Price format (defaults to settings)
+            event: Event ID(s) to filter
+            main: True for main lines only, False for alternates only
+            live: True for live events only, False for pre-match only
+            chunk_size: Bytes to read from the network per step
+        """
+        params = self._build_params(
+            require_auth=True,
+            sportsbook=sportsbook,
+            league=league,
+            market=market,
+            market_contains=market_contains,
+            price=price or self.settings.price_format,
+            event=event,
+            main=main,
+            live=live,
+        )
+        await self._throttle()
+        async with self._client.stream("GET", self.ODDS_URL, params=params) as response:
+            if response.status_code == 401:
+                raise AuthenticationError(
+                    "Invalid or expired API key. Get a new key at oddsblaze.com"
+                )
+            response.raise_for_status()
+
+            parser = EventStreamParser()
+            context = price_format_context(requested_price_format(params))
+            async for chunk in response.aiter_bytes(chunk_size):
+                for raw in parser.feed(chunk):
+                    event = Event.model_validate_json(raw, context=context)
+                    yield event
+            parser.close()
+
+    async def get_odds_many(
+        self,
+        pairs: Iterable[tuple[str, str]],
+        *,
+        concurrency: int = 10,
+        per_call_timeout: Optional[float] = None,
+        market: Optional[str | list[str]] = None,
+        price: Optional[PriceFormat] = None,
+        main: Optional[bool] = None,
+        live: Optional[bool] = None,
+    ) -> AsyncIterator[OddsResult]:
+        """
+        Get odds for many (sportsbook, league) pairs concurrently.
+
+        Results are yielded as each fetch finishes, not in input order. A
+        failing pair yields an `OddsResult` carrying the error instead of
+        aborting the rest, and duplicate pairs are fetched once.
+
+        Args:
+            pairs: (sportsbook, league) pairs to fetch
+            concurrency: Maximum requests in flight at once
+            per_call_timeout: Seconds before a single pair is abandoned
+            market: Market ID(s) or name(s) to filter
+            price: Price format (defaults to settings)
+            main: True for main lines only, False for alternates only
+            live: True for live events only, False for pre-match only
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(sportsbook: str, league: str) -> OddsResult:
+            async with semaphore:
+                try:
+                    response = await asyncio.wait_for(
+                        self.get_odds(
+                            sportsbook,
+                            league,
+                            market=market,
+                            price=price,
+                            main=main,
+                            live=live,
+                        ),
+                        per_call_timeout,
+                    )
+                except Exception as e:
+                    return OddsResult(sportsbook, league, error=e)
+            return OddsResult(sportsbook, league, response=response)
+
+        tasks = [asyncio.ensure_future(fetch(*pair)) for pair in dict.fromkeys(pairs)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
 
     # -------------------------------------------------------------------------
     # Historical Odds API
     # -------------------------------------------------------------------------
+    @overload
     async def get_historical(
         self,
         odds_id: str,
@@ -136,7 +591,29 @@ class AsyncOddsblazeClient:
         price: Optional[PriceFormat] = None,
         time_series: bool = False,
         locked: bool = False,
-    ) -> HistoricalResponse:
+        lazy: Literal[False] = False,
+    ) -> HistoricalResponse: ...
+
+    @overload
+    async def get_historical(
+        self,
+        odds_id: str,
+        *,
+        price: Optional[PriceFormat] = None,
+        time_series: bool = False,
+        locked: bool = False,
+        lazy: Literal[True],
+    ) -> LazyHistoricalResponse: ...
+
+    async def get_historical(
+        self,
+        odds_id: str,
+        *,
+        price: Optional[PriceFormat] = None,
+        time_series: bool = False,
+        locked: bool = False,
+        lazy: bool = False,
+    ) -> HistoricalResponse | LazyHistoricalResponse:
         """
         Get historical odds with CLV, OLV, and line movement.
 
@@ -145,7 +622,64 @@ class AsyncOddsblazeClient:
             price: Price format (defaults to settings)
             time_series: Include line movement history
             locked: Include locked odds in time series
+            lazy: Return a `LazyHistoricalResponse` that keeps timestamps as
+                epoch milliseconds and builds datetimes only when read
+        """
+        response_type = LazyHistoricalResponse if lazy else HistoricalResponse
+        return await self._get_historical(
+            odds_id, price, time_series, locked, response_type
+        )
+
+    async def get_historical_many(
+        self,
+        odds_ids: Iterable[str],
+        *,
+        concurrency: int = 10,
+        price: Optional[PriceFormat] = None,
+        time_series: bool = True,
+        locked: bool = False,
+    ) -> "HistoricalColumns":
+        """
+        Get line movement for many odds IDs as NumPy columns.
+
+        Responses are read straight into arrays (see `HistoricalColumns`)
+        without building a model per time-series entry. Duplicate IDs are
+        fetched once; IDs that fail are reported in `errors`. Requires
+        `pip install oddsblaze[numpy]`.
+
+        Args:
+            odds_ids: Odds IDs from previous odds responses
+            concurrency: Maximum requests in flight at once
+            price: Price format (defaults to settings)
+            time_series: Include line movement history
+            locked: Include locked odds in time series
         """
+        from .columnar import historical_columns
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(odds_id: str) -> Any:
+            async with semaphore:
+                try:
+                    return await self._get_historical(
+                        odds_id, price, time_series, locked, None
+                    )
+                except Exception as e:
+                    return e
+
+        ids = list(dict.fromkeys(odds_ids))
+        results = await asyncio.gather(*(fetch(odds_id) for odds_id in ids))
+        return historical_columns(zip(ids, results))
+
+    async def _get_historical(
+        self,
+        odds_id: str,
+        price: Optional[PriceFormat],
+        time_series: bool,
+        locked: bool,
+        response_type: Any,
+    ) -> Any:
+        """Fetch historical odds through the historical store, if any."""
         params = self._build_params(
             require_auth=True,
             id=odds_id,
@@ -156,12 +690,31 @@ class AsyncOddsblazeClient:
         if locked:
             params["locked"] = ""
 
-        data = await self._request(self.HISTORICAL_URL, params)
-        return HistoricalResponse.model_validate(data)
+        store = self._historical_store
+        if store is None:
+            return await self._request(self.HISTORICAL_URL, params, response_type)
+
+        key = historical_key(odds_id, params["price"], time_series, locked)
+        stored = await asyncio.to_thread(store.get, key, response_type)
+        if stored is not None:
+            price_format = requested_price_format(params)
+            if price_format is not None:
+                set_price_format(stored, price_format)
+            return stored
+
+        result = await self._request(self.HISTORICAL_URL, params, response_type)
+        if response_type is None:
+            if result.get("clv") is not None:
+                closed = LazyHistoricalResponse.model_validate(result)
+                await asyncio.to_thread(store.put, key, closed)
+        else:
+            await asyncio.to_thread(store.put, key, result)
+        return result
 
     # -------------------------------------------------------------------------
     # Consensus Odds API
     # -------------------------------------------------------------------------
+    @overload
     async def get_consensus(
         self,
         league: str,
@@ -172,7 +725,35 @@ class AsyncOddsblazeClient:
         sportsbooks: Optional[list[str]] = None,
         required_sportsbooks: Optional[list[str]] = None,
         weights: Optional[dict[str, float]] = None,
-    ) -> ConsensusResponse:
+        lazy: Literal[False] = False,
+    ) -> ConsensusResponse: ...
+
+    @overload
+    async def get_consensus(
+        self,
+        league: str,
+        market: str,
+        *,
+        price: Optional[PriceFormat] = None,
+        dedupe: Optional[bool] = None,
+        sportsbooks: Optional[list[str]] = None,
+        required_sportsbooks: Optional[list[str]] = None,
+        weights: Optional[dict[str, float]] = None,
+        lazy: Literal[True],
+    ) -> LazyConsensusResponse: ...
+
+    async def get_consensus(
+        self,
+        league: str,
+        market: str,
+        *,
+        price: Optional[PriceFormat] = None,
+        dedupe: Optional[bool] = None,
+        sportsbooks: Optional[list[str]] = None,
+        required_sportsbooks: Optional[list[str]] = None,
+        weights: Optional[dict[str, float]] = None,
+        lazy: bool = False,
+    ) -> ConsensusResponse | LazyConsensusResponse:
         """
         Get consensus odds across sportsbooks.
 
@@ -184,6 +765,9 @@ class AsyncOddsblazeClient:
             sportsbooks: Sportsbooks to include (at least one must have odds)
             required_sportsbooks: Sportsbooks that must all be present
             weights: Custom weights by sportsbook ID (e.g., {"draftkings": 1.5})
+            lazy: Return a `LazyConsensusResponse` that keeps sportsbook
+                timestamps as epoch milliseconds and builds datetimes only
+                when read
         """
         params = self._build_params(
             require_auth=True,
@@ -200,8 +784,8 @@ class AsyncOddsblazeClient:
                 params[f"weight-{book_id}"] = str(weight)
 
         url = f"{self.BASE_URL}/consensus/{league}/{market}.json"
-        data = await self._request(url, params)
-        return ConsensusResponse.model_validate(data)
+        response_type = LazyConsensusResponse if lazy else ConsensusResponse
+        return await self._request(url, params, response_type)
 
     # -------------------------------------------------------------------------
     # Grader API
@@ -219,12 +803,64 @@ class AsyncOddsblazeClient:
             odds_id: The odds ID to grade
             live: Grade while event is still in progress
         """
+        if self._grade_cache is not None:
+            cached = await asyncio.to_thread(self._grade_cache.get, odds_id)
+            if cached is not None:
+                return cached
+
         params = self._build_params(require_auth=True, id=odds_id)
         if live:
             params["live"] = ""
 
-        data = await self._request(self.GRADER_URL, params)
-        return GraderResponse.model_validate(data)
+        response = await self._request(self.GRADER_URL, params, GraderResponse)
+        if self._grade_cache is not None:
+            await asyncio.to_thread(self._grade_cache.put, odds_id, response)
+        return response
+
+    async def grade_many(
+        self,
+        odds_ids: Iterable[str],
+        *,
+        concurrency: int = 10,
+        live: bool = False,
+    ) -> AsyncIterator[GradeResult]:
+        """
+        Grade many bets concurrently.
+
+        Duplicate odds IDs are graded once. Grades already in the
+        `grade_cache` are yielded first without a request; the rest are
+        yielded as each request finishes. A failing ID yields a
+        `GradeResult` carrying the error instead of aborting the rest.
+
+        Args:
+            odds_ids: Odds IDs to grade
+            concurrency: Maximum requests in flight at once
+            live: Grade while events are still in progress
+        """
+        ids = list(dict.fromkeys(odds_ids))
+        if self._grade_cache is not None:
+            cached = await asyncio.to_thread(self._grade_cache.get_many, ids)
+            for odds_id, response in cached.items():
+                yield GradeResult(odds_id, response=response)
+            ids = [odds_id for odds_id in ids if odds_id not in cached]
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def grade(odds_id: str) -> GradeResult:
+            async with semaphore:
+                try:
+                    response = await self.grade_bet(odds_id, live=live)
+                except Exception as e:
+                    return GradeResult(odds_id, error=e)
+            return GradeResult(odds_id, response=response)
+
+        tasks = [asyncio.ensure_future(grade(odds_id)) for odds_id in ids]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
 
     async def grade_moneyline(
         self,
@@ -383,8 +1019,9 @@ class AsyncOddsblazeClient:
             live=live,
         )
         url = f"{self.BASE_URL}/schedule/{league}.json"
-        data = await self._request(url, params)
-        return ScheduleResponse.model_validate(data)
+        return await self._request_chunked(
+            url, params, ScheduleResponse, ("id", "team"), endpoint="schedule"
+        )
 
     # -------------------------------------------------------------------------
     # Leagues API (no auth required)
@@ -393,8 +1030,7 @@ class AsyncOddsblazeClient:
         """Get all available leagues."""
         params = self._build_params(require_auth=False)
         url = f"{self.BASE_URL}/leagues.json"
-        data = await self._request(url, params)
-        return [League.model_validate(item) for item in data]
+        return await self._request(url, params, list[League], endpoint="leagues")
 
     # -------------------------------------------------------------------------
     # Sportsbooks API (no auth required)
@@ -403,8 +1039,9 @@ class AsyncOddsblazeClient:
         """Get all available sportsbooks."""
         params = self._build_params(require_auth=False)
         url = f"{self.BASE_URL}/sportsbooks.json"
-        data = await self._request(url, params)
-        return [Sportsbook.model_validate(item) for item in data]
+        return await self._request(
+            url, params, list[Sportsbook], endpoint="sportsbooks"
+        )
 
     # -------------------------------------------------------------------------
     # Active Markets API (no auth required)
@@ -413,19 +1050,41 @@ class AsyncOddsblazeClient:
         """Get active markets across all leagues."""
         params = self._build_params(require_auth=False)
         url = f"{self.BASE_URL}/markets/active.json"
-        data = await self._request(url, params)
-        return ActiveMarketsResponse.model_validate(data)
+        return await self._request(
+            url, params, ActiveMarketsResponse, endpoint="active_markets"
+        )
 
     # -------------------------------------------------------------------------
     # Last Polled API
     # -------------------------------------------------------------------------
+    @overload
+    async def get_last_polled(
+        self,
+        *,
+        league: Optional[str | list[str]] = None,
+        sportsbook: Optional[str | list[str]] = None,
+        group: bool = False,
+        lazy: Literal[False] = False,
+    ) -> PolledResponse: ...
+
+    @overload
+    async def get_last_polled(
+        self,
+        *,
+        league: Optional[str | list[str]] = None,
+        sportsbook: Optional[str | list[str]] = None,
+        group: bool = False,
+        lazy: Literal[True],
+    ) -> LazyPolledResponse: ...
+
     async def get_last_polled(
         self,
         *,
         league: Optional[str | list[str]] = None,
         sportsbook: Optional[str | list[str]] = None,
         group: bool = False,
-    ) -> PolledResponse:
+        lazy: bool = False,
+    ) -> PolledResponse | LazyPolledResponse:
         """
         Get last polled timestamps for odds.
 
@@ -433,6 +1092,9 @@ class AsyncOddsblazeClient:
             league: League ID(s) to filter
             sportsbook: Sportsbook ID(s) to filter
             group: Group results by sportsbook
+            lazy: Return a `LazyPolledResponse` that keeps sportsbook poll
+                timestamps as epoch milliseconds and builds datetimes only
+                when read
         """
         params = self._build_params(
             require_auth=True,
@@ -442,8 +1104,44 @@ class AsyncOddsblazeClient:
         if group:
             params["group"] = ""
 
-        data = await self._request(self.POLLED_URL, params)
-        return PolledResponse.model_validate(data)
+        response_type = LazyPolledResponse if lazy else PolledResponse
+        return await self._request(self.POLLED_URL, params, response_type)
+
+    # -------------------------------------------------------------------------
+    # Connection management
+    # -------------------------------------------------------------------------
+    async def warmup(self, connections: int = 1) -> dict[str, bool]:
+        """
+        Open pooled connections to every API host ahead of real traffic.
+
+        Pays the DNS, TCP and TLS setup cost up front so the first requests
+        of a polling burst reuse warm keep-alive connections.
+
+        Args:
+            connections: Connections to open per host (at least 1)
+
+        Returns:
+            Whether each host answered, keyed by `https://host`
+        """
+        if connections < 1:
+            raise ValueError("connections must be at least 1")
+        hosts = list(dict.fromkeys(host_of(url) for url in self._host_urls()))
+
+        async def ping(host: str) -> bool:
+            try:
+                await self._client.head(host)
+            except httpx.HTTPError:
+                return False
+            return True
+
+        results = await asyncio.gather(
+            *(ping(host) for host in hosts for _ in range(connections))
+        )
+
+        return {
+            host: any(results[i * connections : (i + 1) * connections])
+            for i, host in enumerate(hosts)
+        }
 
     async def close(self) -> None:
         """Close the HTTP client."""
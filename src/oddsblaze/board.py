@@ -0,0 +1,137 @@
+"""Cross-sportsbook index of odds lines with ranked price ladders."""
+
+import math
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterator, Optional
+
+from .models import OddsResponse
+from .prices import to_decimal
+from .settings import PriceFormat
+
+# (event id, market, selection name), e.g. ("...", "Point Spread", "Celtics -4.5")
+SelectionKey = tuple[str, str, str]
+
+
+@dataclass(frozen=True, slots=True)
+class BookPrice:
+    """One sportsbook's price for a selection."""
+
+    sportsbook: str
+    price: str
+    decimal: float
+    odd_id: str
+    updated: Optional[datetime] = None
+
+
+def _rank(entry: BookPrice) -> tuple[float, str]:
+    """Ladder order: best payout first, unreadable prices last, ties by book."""
+    if math.isnan(entry.decimal):
+        return (math.inf, entry.sportsbook)
+    return (-entry.decimal, entry.sportsbook)
+
+
+class OddsBoard:
+    """
+    Index odds boards from many sportsbooks by selection.
+
+    Every (event id, market, selection name) keeps a ladder of book prices
+    sorted best first, so `best_price` is O(1) and re-ingesting a board only
+    re-ranks the entries of that board's (sportsbook, league) whose price
+    or update time moved.
+
+    Args:
+        price_format: Format of the prices being ingested
+    """
+
+    def __init__(self, price_format: PriceFormat = PriceFormat.AMERICAN):
+        self.price_format = price_format
+        self._ladders: dict[SelectionKey, list[BookPrice]] = {}
+        self._books: dict[tuple[str, str], dict[SelectionKey, BookPrice]] = {}
+
+    def __len__(self) -> int:
+        return len(self._ladders)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._ladders
+
+    def __iter__(self) -> Iterator[SelectionKey]:
+        return iter(self._ladders)
+
+    def ingest(self, response: OddsResponse) -> None:
+        """
+        Replace one (sportsbook, league) board in the index.
+
+        Args:
+            response: The latest odds board from one sportsbook
+        """
+        sportsbook = response.sportsbook.id
+        pair = (sportsbook, response.league.id)
+        old = self._books.get(pair, {})
+        new: dict[SelectionKey, BookPrice] = {}
+        for event in response.events:
+            for odd in event.odds:
+                new[(event.id, odd.market, odd.name)] = BookPrice(
+                    sportsbook,
+                    odd.price,
+                    to_decimal(odd.price, self.price_format),
+                    odd.id,
+                    odd.updated,
+                )
+
+        for key, entry in old.items():
+            if new.get(key) != entry:
+                self._unlink(key, entry)
+        for key, entry in new.items():
+            if old.get(key) != entry:
+                insort(self._ladders.setdefault(key, []), entry, key=_rank)
+        self._books[pair] = new
+
+    def remove(self, sportsbook: str, league: str) -> None:
+        """Drop every entry of one (sportsbook, league) board."""
+        for key, entry in self._books.pop((sportsbook, league), {}).items():
+            self._unlink(key, entry)
+
+    def _unlink(self, key: SelectionKey, entry: BookPrice) -> None:
+        ladder = self._ladders[key]
+        del ladder[bisect_left(ladder, _rank(entry), key=_rank)]
+        if not ladder:
+            del self._ladders[key]
+
+    def best_price(self, event_id: str, market: str, name: str) -> Optional[BookPrice]:
+        """
+        Best price offered for a selection, or None if no book offers it.
+
+        Args:
+            event_id: Event ID
+            market: Market name (e.g., 'Moneyline')
+            name: Selection name (e.g., 'Celtics -4.5')
+        """
+        ladder = self._ladders.get((event_id, market, name))
+        return ladder[0] if ladder else None
+
+    def all_prices(self, event_id: str, market: str, name: str) -> list[BookPrice]:
+        """
+        Every book's price for a selection, best first.
+
+        Args:
+            event_id: Event ID
+            market: Market name (e.g., 'Moneyline')
+            name: Selection name (e.g., 'Celtics -4.5')
+        """
+        return list(self._ladders.get((event_id, market, name), ()))
+
+    def books_offering(self, event_id: str, market: str, name: str) -> list[str]:
+        """
+        Sportsbooks offering a selection, best price first.
+
+        Args:
+            event_id: Event ID
+            market: Market name (e.g., 'Moneyline')
+            name: Selection name (e.g., 'Celtics -4.5')
+        """
+        return [
+            entry.sportsbook
+            for entry in self._ladders.get((event_id, market, name), ())
+        ]
@@ -0,0 +1,35 @@
+"""Result records for bulk (fan-out) requests."""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from .models import GraderResponse, OddsResponse
+
+
+@dataclass(frozen=True, slots=True)
+class OddsResult:
+    """Outcome of one (sportsbook, league) fetch in a bulk request."""
+
+    sportsbook: str
+    league: str
+    response: Optional[OddsResponse] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the fetch succeeded."""
+        return self.error is None
+
+
+@dataclass(frozen=True, slots=True)
+class GradeResult:
+    """Outcome of grading one odds ID in a bulk request."""
+
+    odds_id: str
+    response: Optional[GraderResponse] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the grade succeeded."""
+        return self.error is None
@@ -0,0 +1,169 @@
+"""In-memory response caching and conditional request bookkeeping."""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable, Optional
+
+# Seconds each endpoint's data may be served from cache. Endpoints missing
+# from the table are never cached.
+DEFAULT_TTLS: dict[str, float] = {
+    "leagues": 3600.0,
+    "sportsbooks": 3600.0,
+    "active_markets": 300.0,
+    "schedule": 60.0,
+}
+
+
+def cache_key(
+    url: str, params: dict[str, str]
+) -> tuple[str, tuple[tuple[str, str], ...]]:
+    """Build a cache key from a URL and its query params, minus the API key."""
+    return url, tuple(sorted((k, v) for k, v in params.items() if k != "key"))
+
+
+class ResponseCache:
+    """
+    TTL + LRU cache of validated responses with a byte budget.
+
+    Entries are sized by the length of the response body they were decoded
+    from. Cached objects are shared between callers and should be treated
+    as read-only.
+
+    Args:
+        ttls: Seconds to cache each endpoint (defaults to `DEFAULT_TTLS`)
+        max_bytes: Total body size to keep before evicting least recently used
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[dict[str, float]] = None,
+        max_bytes: int = 32 * 1024 * 1024,
+    ):
+        self.ttls = DEFAULT_TTLS if ttls is None else ttls
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[float, int, Any]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def ttl(self, endpoint: Optional[str]) -> Optional[float]:
+        """TTL for an endpoint, or None if it is not cached."""
+        return self.ttls.get(endpoint) if endpoint else None
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return a fresh cached value, or None on miss or expiry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires, size, value = entry
+            if expires <= time.monotonic():
+                del self._entries[key]
+                self._size -= size
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, size: int, ttl: float) -> None:
+        """Store a value, evicting least recently used entries over budget."""
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= old[1]
+            while self._entries and self._size + size > self.max_bytes:
+                _, (_, evicted, _) = self._entries.popitem(last=False)
+                self._size -= evicted
+            self._entries[key] = (time.monotonic() + ttl, size, value)
+            self._size += size
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@dataclass(frozen=True, slots=True)
+class Validators:
+    """What the last response for a request looked like, for conditional GETs."""
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+    digest: bytes
+    size: int
+    result: Any
+
+    def headers(self) -> dict[str, str]:
+        """Conditional request headers for the next poll."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def body_digest(content: bytes) -> bytes:
+    """Cheap fingerprint of a response body."""
+    return hashlib.blake2b(content, digest_size=16).digest()
+
+
+class ValidatorStore:
+    """
+    LRU map of request key to the `Validators` last seen for it.
+
+    Each entry holds the decoded result of its request, so the store is
+    bounded like `ResponseCache`: entries are sized by their body length
+    and the least recently used are evicted over `max_bytes`.
+
+    Args:
+        max_entries: Requests to remember before evicting least recently used
+        max_bytes: Total body size to keep before evicting least recently used
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, Validators] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Validators]:
+        """Validators for a request, if it has been seen."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: Hashable, entry: Validators) -> None:
+        """Remember the validators of the latest response for a request."""
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= old.size
+            if entry.size > self.max_bytes:
+                return
+            while self._entries and (
+                len(self._entries) >= self.max_entries
+                or self._size + entry.size > self.max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+            self._entries[key] = entry
+            self._size += entry.size
+
+    def __len__(self) -> int:
+        return len(self._entries)
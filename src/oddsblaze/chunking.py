@@ -0,0 +1,117 @@
+"""Splitting long list filters into several requests and merging the results."""
+
+from itertools import product
+from typing import Any, Iterable, Optional, Sequence
+
+# Most values of one list filter sent in a single request.
+DEFAULT_CHUNK_SIZE = 50
+
+# Most characters of one joined list filter sent in a single request, which
+# keeps URLs well under common server and proxy limits.
+DEFAULT_CHUNK_CHARS = 1500
+
+# Most chunks of one call in flight at once.
+MAX_CHUNK_CONCURRENCY = 10
+
+
+def _split(values: str, size: int, max_chars: int) -> list[str]:
+    """Comma-joined chunks of one filter's distinct values."""
+    chunks: list[list[str]] = [[]]
+    length = 0
+    for value in dict.fromkeys(values.split(",")):
+        current = chunks[-1]
+        if current and (len(current) >= size or length + len(value) > max_chars):
+            chunks.append([])
+            length = 0
+        chunks[-1].append(value)
+        length += len(value) + 1
+    return [",".join(chunk) for chunk in chunks]
+
+
+def chunk_params(
+    params: dict[str, str],
+    keys: Iterable[str],
+    size: int = DEFAULT_CHUNK_SIZE,
+    max_chars: int = DEFAULT_CHUNK_CHARS,
+) -> list[dict[str, str]]:
+    """
+    Split every over-long list filter so each request stays size-bounded.
+
+    Each filter with more than `size` values or `max_chars` characters is
+    split, and one request is made per combination of their chunks. Values
+    of one filter are alternatives and different filters must all match, so
+    the union of the combinations' results is the result of the original
+    request. Values are split on commas, exactly as the API reads them, and
+    duplicates are dropped.
+
+    Args:
+        params: Query parameters from `_build_params`
+        keys: Names of the list filters that may be split
+        size: Most values per chunk
+        max_chars: Most characters of the joined filter per chunk
+    """
+    splits = {}
+    for key in keys:
+        if key in params:
+            chunks = _split(params[key], size, max_chars)
+            if len(chunks) > 1:
+                splits[key] = chunks
+    if not splits:
+        return [params]
+    return [
+        {**params, **dict(zip(splits, combination))}
+        for combination in product(*splits.values())
+    ]
+
+
+def _get(item: Any, name: str) -> Any:
+    return item[name] if isinstance(item, dict) else getattr(item, name)
+
+
+def _odds_field(event: Any) -> Optional[str]:
+    """Name of an event's odds list (None for schedule events)."""
+    if isinstance(event, dict):
+        return "odds" if "odds" in event else None
+    fields = type(event).model_fields
+    return "raw_odds" if "raw_odds" in fields else "odds" if "odds" in fields else None
+
+
+def _merge_event(first: Any, second: Any) -> Any:
+    """One event seen in two chunks, with the odds of both."""
+    field = _odds_field(first)
+    if field is None:
+        return first
+    odds = list(_get(first, field))
+    seen = {_get(odd, "id") for odd in odds}
+    odds.extend(odd for odd in _get(second, field) if _get(odd, "id") not in seen)
+    if isinstance(first, dict):
+        return {**first, field: odds}
+    merged = first.model_copy(update={field: odds})
+    if field == "raw_odds":
+        # Drop lazily validated odds copied from `first`.
+        merged.__dict__.pop("odds", None)
+    return merged
+
+
+def merge_responses(responses: Sequence[Any]) -> Any:
+    """
+    Merge chunked responses into one, deduplicating events by ID.
+
+    An event returned by several chunks (e.g. when `market` was split) is
+    kept once with the odds of every chunk. Works on validated, lazy and
+    raw (`validate=False`) odds responses and on schedule responses.
+    """
+    first = responses[0]
+    events: dict[str, Any] = {}
+    for response in responses:
+        for event in _get(response, "events"):
+            event_id = _get(event, "id")
+            seen = events.get(event_id)
+            events[event_id] = event if seen is None else _merge_event(seen, event)
+    update = {
+        "updated": max(_get(response, "updated") for response in responses),
+        "events": list(events.values()),
+    }
+    if isinstance(first, dict):
+        return {**first, **update}
+    return first.model_copy(update=update)
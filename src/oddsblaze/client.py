@@ -1,22 +1,65 @@
 """OddsBlaze API client."""
 
-from typing import Any, Optional
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Hashable,
+    Iterable,
+    Iterator,
+    Literal,
+    Optional,
+    overload,
+)
 
 import httpx
 
-from .exceptions import AuthenticationError, raise_for_error_message
+from .bulk import GradeResult, OddsResult
+from .cache import (
+    ResponseCache,
+    Validators,
+    ValidatorStore,
+    body_digest,
+    cache_key,
+)
+from .chunking import (
+    DEFAULT_CHUNK_SIZE,
+    MAX_CHUNK_CONCURRENCY,
+    chunk_params,
+    merge_responses,
+)
+from .coalesce import SingleFlight
+from .decoding import decode, requested_price_format
+from .exceptions import AuthenticationError
+from .grades import GradeCache
+from .historical import HistoricalStore, historical_key
 from .models import (
     ActiveMarketsResponse,
     ConsensusResponse,
+    Event,
     GraderResponse,
     HistoricalResponse,
+    LazyConsensusResponse,
+    LazyHistoricalResponse,
+    LazyOddsResponse,
+    LazyPolledResponse,
     League,
     OddsResponse,
     PolledResponse,
     ScheduleResponse,
     Sportsbook,
 )
+from .models.base import price_format_context, set_price_format
+from .models.raw import RawOddsResponse
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
 from .settings import OddsblazeSettings, PriceFormat, get_settings
+from .streaming import EventStreamParser
+from .transport import build_mounts, host_of
+
+if TYPE_CHECKING:
+    from .columnar import HistoricalColumns
 
 
 class OddsblazeClient:
@@ -32,9 +75,75 @@ class OddsblazeClient:
         self,
         settings: Optional[OddsblazeSettings] = None,
         timeout: float = 30.0,
+        *,
+        limits: Optional[httpx.Limits] = None,
+        host_limits: Optional[dict[str, httpx.Limits]] = None,
+        http2: bool = False,
+        cache: Optional[ResponseCache] = None,
+        conditional: bool = False,
+        coalesce: bool = True,
+        grade_cache: Optional[GradeCache] = None,
+        historical_store: Optional[HistoricalStore] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        chunk_size: Optional[int] = DEFAULT_CHUNK_SIZE,
+        transport: Optional[httpx.BaseTransport] = None,
     ):
+        """
+        Create a client.
+
+        Each API host gets its own connection pool so a burst against one
+        host never queues behind another.
+
+        Args:
+            settings: Settings to use (defaults to env/file config)
+            timeout: Request timeout in seconds
+            limits: Pool limits applied to every host (see `DEFAULT_LIMITS`)
+            host_limits: Per-host pool limits keyed by URL or `https://host`
+            http2: Multiplex requests over HTTP/2 (requires `oddsblaze[http2]`)
+            cache: Opt-in cache for metadata endpoints (see `ResponseCache`)
+            conditional: Send ETag/If-Modified-Since validators and reuse the
+                previous result when the server answers 304 or the body is
+                unchanged
+            coalesce: Share one in-flight request (and its result) between
+                concurrent threads asking for the same URL and params
+            grade_cache: Persistent store of final grades (see `GradeCache`)
+            historical_store: Persistent store of closed historical odds (see
+                `HistoricalStore`)
+            retry: Retry 429s, 5xx and transport errors with backoff (see
+                `RetryPolicy`)
+            rate_limiter: Token bucket every request waits on, shared by all
+                endpoints (see `RateLimiter`)
+            chunk_size: Most values of one list filter (`event`, `market`,
+                `team`, ...) per request; longer filters are split into
+                concurrent requests whose events are merged (None to disable)
+            transport: Custom transport for all hosts (e.g. `httpx.MockTransport`)
+        """
         self.settings = settings or get_settings()
-        self._client = httpx.Client(timeout=timeout)
+        self._cache = cache
+        self._grade_cache = grade_cache
+        self._historical_store = historical_store
+        self._retry = retry
+        self._rate_limiter = rate_limiter
+        self._chunk_size = chunk_size
+        self._validators = ValidatorStore() if conditional else None
+        self._inflight = SingleFlight() if coalesce else None
+        mounts = None
+        if transport is None:
+            mounts = build_mounts(
+                self._host_urls(), limits=limits, host_limits=host_limits, http2=http2
+            )
+        self._client = httpx.Client(timeout=timeout, transport=transport, mounts=mounts)
+
+    def _host_urls(self) -> list[str]:
+        """URLs of every API host this client talks to."""
+        return [
+            self.BASE_URL,
+            self.ODDS_URL,
+            self.HISTORICAL_URL,
+            self.GRADER_URL,
+            self.POLLED_URL,
+        ]
 
     def _require_api_key(self) -> str:
         """Get API key or raise AuthenticationError."""
@@ -72,9 +181,67 @@ class OddsblazeClient:
 
         return params
 
-    def _request(self, url: str, params: dict[str, str]) -> Any:
-        """Make GET request and handle errors."""
-        response = self._client.get(url, params=params)
+    def _request(
+        self,
+        url: str,
+        params: dict[str, str],
+        response_type: Any,
+        *,
+        endpoint: Optional[str] = None,
+    ) -> Any:
+        """Make GET request, handle errors and validate the response."""
+        key = (cache_key(url, params), response_type)
+        ttl = self._cache.ttl(endpoint) if self._cache is not None else None
+        if ttl:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+
+        if self._inflight is None:
+            return self._fetch(url, params, response_type, key, ttl)
+        return self._inflight.do(
+            key, lambda: self._fetch(url, params, response_type, key, ttl)
+        )
+
+    def _request_chunked(
+        self,
+        url: str,
+        params: dict[str, str],
+        response_type: Any,
+        keys: tuple[str, ...],
+        *,
+        endpoint: Optional[str] = None,
+    ) -> Any:
+        """Make the request, split into concurrent chunks if a filter is long."""
+        chunks = [params]
+        if self._chunk_size is not None:
+            chunks = chunk_params(params, keys, self._chunk_size)
+        if len(chunks) == 1:
+            return self._request(url, params, response_type, endpoint=endpoint)
+        with ThreadPoolExecutor(
+            max_workers=min(len(chunks), MAX_CHUNK_CONCURRENCY)
+        ) as pool:
+            responses = list(
+                pool.map(
+                    lambda chunk: self._request(
+                        url, chunk, response_type, endpoint=endpoint
+                    ),
+                    chunks,
+                )
+            )
+        return merge_responses(responses)
+
+    def _fetch(
+        self,
+        url: str,
+        params: dict[str, str],
+        response_type: Any,
+        key: Hashable,
+        ttl: Optional[float],
+    ) -> Any:
+        """Send the request, reusing the last result if it is unchanged."""
+        seen = self._validators.get(key) if self._validators is not None else None
+        response = self._send(url, params, seen.headers() if seen else None)
 
         # Handle 401 as AuthenticationError
         if response.status_code == 401:
@@ -82,18 +249,74 @@ class OddsblazeClient:
                 "Invalid or expired API key. Get a new key at oddsblaze.com"
             )
 
-        response.raise_for_status()
-        data = response.json()
+        if seen is not None and response.status_code == 304:
+            result, size = seen.result, seen.size
+        else:
+            response.raise_for_status()
+            size = len(response.content)
+            digest = b""
+            if self._validators is not None:
+                digest = body_digest(response.content)
+            if seen is not None and seen.digest == digest:
+                result = seen.result
+            else:
+                result = decode(
+                    response.content, response_type, requested_price_format(params)
+                )
+            if self._validators is not None:
+                self._validators.set(
+                    key,
+                    Validators(
+                        etag=response.headers.get("ETag"),
+                        last_modified=response.headers.get("Last-Modified"),
+                        digest=digest,
+                        size=size,
+                        result=result,
+                    ),
+                )
 
-        # Check for API error messages
-        if isinstance(data, dict) and "message" in data and len(data) == 1:
-            raise_for_error_message(data["message"])
+        if ttl:
+            self._cache.set(key, result, size, ttl)
+        return result
 
-        return data
+    def _send(
+        self, url: str, params: dict[str, str], headers: Optional[dict[str, str]]
+    ) -> httpx.Response:
+        """GET through the rate limiter, retrying as the retry policy allows."""
+        attempt = 0
+        while True:
+            self._throttle()
+            try:
+                response = self._client.get(url, params=params, headers=headers)
+            except Exception as e:
+                if self._retry is None or not isinstance(e, self._retry.exceptions):
+                    raise
+                delay = self._retry.delay(attempt)
+                if delay is None:
+                    raise
+            else:
+                if self._retry is None:
+                    return response
+                delay = self._retry.delay(attempt, response)
+                if delay is None:
+                    return response
+                if response.status_code == 429 and self._rate_limiter is not None:
+                    # Throttled: hold back every request of this client.
+                    self._rate_limiter.pause(delay)
+            attempt += 1
+            time.sleep(delay)
+
+    def _throttle(self) -> None:
+        """Wait for a rate limiter token, if rate limiting is on."""
+        if self._rate_limiter is not None:
+            wait = self._rate_limiter.reserve()
+            if wait > 0:
+                time.sleep(wait)
 
     # -------------------------------------------------------------------------
     # Odds API
     # -------------------------------------------------------------------------
+    @overload
     def get_odds(
         self,
         sportsbook: str,
@@ -105,7 +328,56 @@ class OddsblazeClient:
         event: Optional[str | list[str]] = None,
         main: Optional[bool] = None,
         live: Optional[bool] = None,
-    ) -> OddsResponse:
+        validate: Literal[True] = True,
+        lazy: Literal[False] = False,
+    ) -> OddsResponse: ...
+
+    @overload
+    def get_odds(
+        self,
+        sportsbook: str,
+        league: str,
+        *,
+        market: Optional[str | list[str]] = None,
+        market_contains: Optional[str | list[str]] = None,
+        price: Optional[PriceFormat] = None,
+        event: Optional[str | list[str]] = None,
+        main: Optional[bool] = None,
+        live: Optional[bool] = None,
+        validate: Literal[True] = True,
+        lazy: Literal[True],
+    ) -> LazyOddsResponse: ...
+
+    @overload
+    def get_odds(
+        self,
+        sportsbook: str,
+        league: str,
+        *,
+        market: Optional[str | list[str]] = None,
+        market_contains: Optional[str | list[str]] = None,
+        price: Optional[PriceFormat] = None,
+        event: Optional[str | list[str]] = None,
+        main: Optional[bool] = None,
+        live: Optional[bool] = None,
+        validate: Literal[False],
+        lazy: bool = False,
+    ) -> RawOddsResponse: ...
+
+    def get_odds(
+        self,
+        sportsbook: str,
+        league: str,
+        *,
+        market: Optional[str | list[str]] = None,
+        market_contains: Optional[str | list[str]] = None,
+        price: Optional[PriceFormat] = None,
+        event: Optional[str | list[str]] = None,
+        main: Optional[bool] = None,
+        live: Optional[bool] = None,
+        validate: bool = True,
+        lazy: bool = False,
+    ) -> OddsResponse | LazyOddsResponse | RawOddsResponse:
         """
         Get real-time odds for a sportsbook and league.
 
@@ -118,6 +390,60 @@ class OddsblazeClient:
             event: Event ID(s) to filter
             main: True for main lines only, False for alternates only
             live: True for live events only, False for pre-match only
+            validate: False to skip pydantic and return the decoded JSON as
+                plain dicts (see `RawOddsResponse` for guaranteed keys)
+            lazy: Return a `LazyOddsResponse` that validates each event's odds
+                only when they are first read
+        """
+        params = self._build_params(
+            require_auth=True,
+            sportsbook=sportsbook,
+            league=league,
+            market=market,
+            market_contains=market_contains,
+            price=price or self.settings.price_format,
+            event=event,
+            main=main,
+            live=live,
+        )
+        response_type: Any = None
+        if validate:
+            response_type = LazyOddsResponse if lazy else OddsResponse
+        return self._request_chunked(
+            self.ODDS_URL, params, response_type, ("event", "market", "market_contains")
+        )
+
+    def iter_odds(
+        self,
+        sportsbook: str,
+        league: str,
+        *,
+        market: Optional[str | list[str]] = None,
+        market_contains: Optional[str | list[str]] = None,
+        price: Optional[PriceFormat] = None,
+        event: Optional[str | list[str]] = None,
+        main: Optional[bool] = None,
+        live: Optional[bool] = None,
+        chunk_size: int = 64 * 1024,
+    ) -> Iterator[Event]:
+        """
+        Stream odds for a sportsbook and league one event at a time.
+
+        The body is parsed incrementally as it downloads and each `Event` is
+        validated and yielded as soon as it is complete, so the first event
+        arrives before the board finishes downloading and memory use does
+        not grow with the size of the board.
+
+        Args:
+            sportsbook: Sportsbook ID (e.g., "draftkings")
+            league: League ID (e.g., "nfl")
+            market: Market ID(s) or name(s) to filter
+            market_contains: Filter markets containing these strings
+            price: Price format (defaults to settings)
+            event: Event ID(s) to filter
+            main: True for main lines only, False for alternates only
+            live: True for live events only, False for pre-match only
+            chunk_size: Bytes to read from the network per step
         """
         params = self._build_params(
             require_auth=True,
@@ -130,12 +456,114 @@ class OddsblazeClient:
             main=main,
             live=live,
         )
-        data = self._request(self.ODDS_URL, params)
-        return OddsResponse.model_validate(data)
+        self._throttle()
+        with self._client.stream("GET", self.ODDS_URL, params=params) as response:
+            if response.status_code == 401:
+                raise AuthenticationError(
+                    "Invalid or expired API key. Get a new key at oddsblaze.com"
+                )
+            response.raise_for_status()
+
+            parser = EventStreamParser()
+            context = price_format_context(requested_price_format(params))
+            for chunk in response.iter_bytes(chunk_size):
+                for raw in parser.feed(chunk):
+                    event = Event.model_validate_json(raw, context=context)
+                    yield event
+            parser.close()
+
+    def get_odds_many(
+        self,
+        pairs: Iterable[tuple[str, str]],
+        *,
+        concurrency: int = 10,
+        per_call_timeout: Optional[float] = None,
+        market: Optional[str | list[str]] = None,
+        price: Optional[PriceFormat] = None,
+        main: Optional[bool] = None,
+        live: Optional[bool] = None,
+    ) -> Iterator[OddsResult]:
+        """
+        Get odds for many (sportsbook, league) pairs on a thread pool.
+
+        Results are yielded as each fetch finishes, not in input order. A
+        failing pair yields an `OddsResult` carrying the error instead of
+        aborting the rest, and duplicate pairs are fetched once. A pair that
+        runs past `per_call_timeout` yields a `TimeoutError`; its thread
+        finishes in the background and the late result is dropped.
+
+        Args:
+            pairs: (sportsbook, league) pairs to fetch
+            concurrency: Maximum requests in flight at once
+            per_call_timeout: Seconds before a single pair is abandoned
+            market: Market ID(s) or name(s) to filter
+            price: Price format (defaults to settings)
+            main: True for main lines only, False for alternates only
+            live: True for live events only, False for pre-match only
+        """
+        started: dict[tuple[str, str], float] = {}
+
+        def fetch(sportsbook: str, league: str) -> OddsResponse:
+            started[(sportsbook, league)] = time.monotonic()
+            return self.get_odds(
+                sportsbook, league, market=market, price=price, main=main, live=live
+            )
+
+        pool = ThreadPoolExecutor(max_workers=concurrency)
+        pending = {pool.submit(fetch, *pair): pair for pair in dict.fromkeys(pairs)}
+        try:
+            while pending:
+                timeout = None
+                if per_call_timeout is not None:
+                    running = [started[p] for p in pending.values() if p in started]
+                    first = min(running, default=time.monotonic())
+                    timeout = max(first + per_call_timeout - time.monotonic(), 0.0)
+                done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    sportsbook, league = pending.pop(future)
+                    error = future.exception()
+                    if error is None:
+                        yield OddsResult(sportsbook, league, response=future.result())
+                    else:
+                        yield OddsResult(sportsbook, league, error=error)
+
+                if per_call_timeout is None:
+                    continue
+                now = time.monotonic()
+                for future, (sportsbook, league) in list(pending.items()):
+                    if now - started.get((sportsbook, league), now) >= per_call_timeout:
+                        del pending[future]
+                        error = TimeoutError(f"{sportsbook}/{league} timed out")
+                        yield OddsResult(sportsbook, league, error=error)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
 
     # -------------------------------------------------------------------------
     # Historical Odds API
     # -------------------------------------------------------------------------
+    @overload
+    def get_historical(
+        self,
+        odds_id: str,
+        *,
+        price: Optional[PriceFormat] = None,
+        time_series: bool = False,
+        locked: bool = False,
+        lazy: Literal[False] = False,
+    ) -> HistoricalResponse: ...
+
+    @overload
+    def get_historical(
+        self,
+        odds_id: str,
+        *,
+        price: Optional[PriceFormat] = None,
+        time_series: bool = False,
+        locked: bool = False,
+        lazy: Literal[True],
+    ) -> LazyHistoricalResponse: ...
+
     def get_historical(
         self,
         odds_id: str,
@@ -143,7 +571,8 @@ class OddsblazeClient:
         price: Optional[PriceFormat] = None,
         time_series: bool = False,
         locked: bool = False,
-    ) -> HistoricalResponse:
+        lazy: bool = False,
+    ) -> HistoricalResponse | LazyHistoricalResponse:
         """
         Get historical odds with CLV, OLV, and line movement.
 
@@ -152,7 +581,58 @@ class OddsblazeClient:
             price: Price format (defaults to settings)
             time_series: Include line movement history
             locked: Include locked odds in time series
+            lazy: Return a `LazyHistoricalResponse` that keeps timestamps as
+                epoch milliseconds and builds datetimes only when read
         """
+        response_type = LazyHistoricalResponse if lazy else HistoricalResponse
+        return self._get_historical(odds_id, price, time_series, locked, response_type)
+
+    def get_historical_many(
+        self,
+        odds_ids: Iterable[str],
+        *,
+        concurrency: int = 10,
+        price: Optional[PriceFormat] = None,
+        time_series: bool = True,
+        locked: bool = False,
+    ) -> "HistoricalColumns":
+        """
+        Get line movement for many odds IDs as NumPy columns.
+
+        Responses are read straight into arrays (see `HistoricalColumns`)
+        without building a model per time-series entry. Duplicate IDs are
+        fetched once; IDs that fail are reported in `errors`. Requires
+        `pip install oddsblaze[numpy]`.
+
+        Args:
+            odds_ids: Odds IDs from previous odds responses
+            concurrency: Maximum requests in flight at once
+            price: Price format (defaults to settings)
+            time_series: Include line movement history
+            locked: Include locked odds in time series
+        """
+        from .columnar import historical_columns
+
+        def fetch(odds_id: str) -> Any:
+            try:
+                return self._get_historical(odds_id, price, time_series, locked, None)
+            except Exception as e:
+                return e
+
+        ids = list(dict.fromkeys(odds_ids))
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(pool.map(fetch, ids))
+        return historical_columns(zip(ids, results))
+
+    def _get_historical(
+        self,
+        odds_id: str,
+        price: Optional[PriceFormat],
+        time_series: bool,
+        locked: bool,
+        response_type: Any,
+    ) -> Any:
+        """Fetch historical odds through the historical store, if any."""
         params = self._build_params(
             require_auth=True,
             id=odds_id,
@@ -163,12 +643,30 @@ class OddsblazeClient:
         if locked:
             params["locked"] = ""
 
-        data = self._request(self.HISTORICAL_URL, params)
-        return HistoricalResponse.model_validate(data)
+        store = self._historical_store
+        if store is None:
+            return self._request(self.HISTORICAL_URL, params, response_type)
+
+        key = historical_key(odds_id, params["price"], time_series, locked)
+        stored = store.get(key, response_type)
+        if stored is not None:
+            price_format = requested_price_format(params)
+            if price_format is not None:
+                set_price_format(stored, price_format)
+            return stored
+
+        result = self._request(self.HISTORICAL_URL, params, response_type)
+        if response_type is None:
+            if result.get("clv") is not None:
+                store.put(key, LazyHistoricalResponse.model_validate(result))
+        else:
+            store.put(key, result)
+        return result
 
     # -------------------------------------------------------------------------
     # Consensus Odds API
     # -------------------------------------------------------------------------
+    @overload
     def get_consensus(
         self,
         league: str,
@@ -179,7 +677,35 @@ class OddsblazeClient:
         sportsbooks: Optional[list[str]] = None,
         required_sportsbooks: Optional[list[str]] = None,
         weights: Optional[dict[str, float]] = None,
-    ) -> ConsensusResponse:
+        lazy: Literal[False] = False,
+    ) -> ConsensusResponse: ...
+
+    @overload
+    def get_consensus(
+        self,
+        league: str,
+        market: str,
+        *,
+        price: Optional[PriceFormat] = None,
+        dedupe: Optional[bool] = None,
+        sportsbooks: Optional[list[str]] = None,
+        required_sportsbooks: Optional[list[str]] = None,
+        weights: Optional[dict[str, float]] = None,
+        lazy: Literal[True],
+    ) -> LazyConsensusResponse: ...
+
+    def get_consensus(
+        self,
+        league: str,
+        market: str,
+        *,
+        price: Optional[PriceFormat] = None,
+        dedupe: Optional[bool] = None,
+        sportsbooks: Optional[list[str]] = None,
+        required_sportsbooks: Optional[list[str]] = None,
+        weights: Optional[dict[str, float]] = None,
+        lazy: bool = False,
+    ) -> ConsensusResponse | LazyConsensusResponse:
         """
         Get consensus odds across sportsbooks.
 
@@ -191,6 +717,9 @@ class OddsblazeClient:
             sportsbooks: Sportsbooks to include (at least one must have odds)
             required_sportsbooks: Sportsbooks that must all be present
             weights: Custom weights by sportsbook ID (e.g., {"draftkings": 1.5})
+            lazy: Return a `LazyConsensusResponse` that keeps sportsbook
+                timestamps as epoch milliseconds and builds datetimes only
+                when read
         """
         params = self._build_params(
             require_auth=True,
@@ -207,8 +736,8 @@ class OddsblazeClient:
                 params[f"weight-{book_id}"] = str(weight)
 
         url = f"{self.BASE_URL}/consensus/{league}/{market}.json"
-        data = self._request(url, params)
-        return ConsensusResponse.model_validate(data)
+        response_type = LazyConsensusResponse if lazy else ConsensusResponse
+        return self._request(url, params, response_type)
 
     # -------------------------------------------------------------------------
     # Grader API
@@ -226,12 +755,59 @@ class OddsblazeClient:
             odds_id: The odds ID to grade
             live: Grade while event is still in progress
         """
+        if self._grade_cache is not None:
+            cached = self._grade_cache.get(odds_id)
+            if cached is not None:
+                return cached
+
         params = self._build_params(require_auth=True, id=odds_id)
         if live:
             params["live"] = ""
 
-        data = self._request(self.GRADER_URL, params)
-        return GraderResponse.model_validate(data)
+        response = self._request(self.GRADER_URL, params, GraderResponse)
+        if self._grade_cache is not None:
+            self._grade_cache.put(odds_id, response)
+        return response
+
+    def grade_many(
+        self,
+        odds_ids: Iterable[str],
+        *,
+        concurrency: int = 10,
+        live: bool = False,
+    ) -> Iterator[GradeResult]:
+        """
+        Grade many bets on a thread pool.
+
+        Duplicate odds IDs are graded once. Grades already in the
+        `grade_cache` are yielded first without a request; the rest are
+        yielded as each request finishes. A failing ID yields a
+        `GradeResult` carrying the error instead of aborting the rest.
+
+        Args:
+            odds_ids: Odds IDs to grade
+            concurrency: Maximum requests in flight at once
+            live: Grade while events are still in progress
+        """
+        ids = list(dict.fromkeys(odds_ids))
+        if self._grade_cache is not None:
+            cached = self._grade_cache.get_many(ids)
+            for odds_id, response in cached.items():
+                yield GradeResult(odds_id, response=response)
+            ids = [odds_id for odds_id in ids if odds_id not in cached]
+
+        pool = ThreadPoolExecutor(max_workers=concurrency)
+        pending = {pool.submit(self.grade_bet, i, live=live): i for i in ids}
+        try:
+            for future in as_completed(pending):
+                odds_id = pending[future]
+                error = future.exception()
+                if error is None:
+                    yield GradeResult(odds_id, response=future.result())
+                else:
+                    yield GradeResult(odds_id, error=error)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
 
     def grade_moneyline(
         self,
@@ -390,8 +966,9 @@ class OddsblazeClient:
             live=live,
         )
         url = f"{self.BASE_URL}/schedule/{league}.json"
-        data = self._request(url, params)
-        return ScheduleResponse.model_validate(data)
+        return self._request_chunked(
+            url, params, ScheduleResponse, ("id", "team"), endpoint="schedule"
+        )
 
     # -------------------------------------------------------------------------
     # Leagues API (no auth required)
@@ -400,8 +977,7 @@ class OddsblazeClient:
         """Get all available leagues."""
         params = self._build_params(require_auth=False)
         url = f"{self.BASE_URL}/leagues.json"
-        data = self._request(url, params)
-        return [League.model_validate(item) for item in data]
+        return self._request(url, params, list[League], endpoint="leagues")
 
     # -------------------------------------------------------------------------
     # Sportsbooks API (no auth required)
@@ -410,8 +986,7 @@ class OddsblazeClient:
         """Get all available sportsbooks."""
         params = self._build_params(require_auth=False)
         url = f"{self.BASE_URL}/sportsbooks.json"
-        data = self._request(url, params)
-        return [Sportsbook.model_validate(item) for item in data]
+        return self._request(url, params, list[Sportsbook], endpoint="sportsbooks")
 
     # -------------------------------------------------------------------------
     # Active Markets API (no auth required)
@@ -420,19 +995,41 @@ class OddsblazeClient:
         """Get active markets across all leagues."""
         params = self._build_params(require_auth=False)
         url = f"{self.BASE_URL}/markets/active.json"
-        data = self._request(url, params)
-        return ActiveMarketsResponse.model_validate(data)
+        return self._request(
+            url, params, ActiveMarketsResponse, endpoint="active_markets"
+        )
 
     # -------------------------------------------------------------------------
     # Last Polled API
     # -------------------------------------------------------------------------
+    @overload
+    def get_last_polled(
+        self,
+        *,
+        league: Optional[str | list[str]] = None,
+        sportsbook: Optional[str | list[str]] = None,
+        group: bool = False,
+        lazy: Literal[False] = False,
+    ) -> PolledResponse: ...
+
+    @overload
     def get_last_polled(
         self,
         *,
         league: Optional[str | list[str]] = None,
         sportsbook: Optional[str | list[str]] = None,
         group: bool = False,
-    ) -> PolledResponse:
+        lazy: Literal[True],
+    ) -> LazyPolledResponse: ...
+
+    def get_last_polled(
+        self,
+        *,
+        league: Optional[str | list[str]] = None,
+        sportsbook: Optional[str | list[str]] = None,
+        group: bool = False,
+        lazy: bool = False,
+    ) -> PolledResponse | LazyPolledResponse:
         """
         Get last polled timestamps for odds.
 
@@ -440,6 +1037,9 @@ class OddsblazeClient:
             league: League ID(s) to filter
             sportsbook: Sportsbook ID(s) to filter
             group: Group results by sportsbook
+            lazy: Return a `LazyPolledResponse` that keeps sportsbook poll
+                timestamps as epoch milliseconds and builds datetimes only
+                when read
         """
         params = self._build_params(
             require_auth=True,
@@ -449,8 +1049,44 @@ class OddsblazeClient:
         if group:
             params["group"] = ""
 
-        data = self._request(self.POLLED_URL, params)
-        return PolledResponse.model_validate(data)
+        response_type = LazyPolledResponse if lazy else PolledResponse
+        return self._request(self.POLLED_URL, params, response_type)
+
+    # -------------------------------------------------------------------------
+    # Connection management
+    # -------------------------------------------------------------------------
+    def warmup(self, connections: int = 1) -> dict[str, bool]:
+        """
+        Open pooled connections to every API host ahead of real traffic.
+
+        Pays the DNS, TCP and TLS setup cost up front so the first requests
+        of a polling burst reuse warm keep-alive connections.
+
+        Args:
+            connections: Connections to open per host (at least 1)
+
+        Returns:
+            Whether each host answered, keyed by `https://host`
+        """
+        if connections < 1:
+            raise ValueError("connections must be at least 1")
+        hosts = list(dict.fromkeys(host_of(url) for url in self._host_urls()))
+
+        def ping(host: str) -> bool:
+            try:
+                self._client.head(host)
+            except httpx.HTTPError:
+                return False
+            return True
+
+        targets = [host for host in hosts for _ in range(connections)]
+        with ThreadPoolExecutor(max_workers=len(targets)) as pool:
+            results = list(pool.map(ping, targets))
+
+        return {
+            host: any(results[i * connections : (i + 1) * connections])
+            for i, host in enumerate(hosts)
+        }
 
     def close(self) -> None:
         """Close the HTTP client."""
@@ -0,0 +1,84 @@
+"""Single-flight coalescing of identical concurrent requests."""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Generic, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    """A call in flight that other threads may wait on."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Optional[T] = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Run at most one call per key at a time across threads.
+
+    Threads that ask for a key while a call for it is running block until it
+    finishes and share its result (or exception).
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, _Call[Any]] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Call `fn`, or wait for the identical call already in flight."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[return-value]
+
+        try:
+            result = call.result = fn()
+            return result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """
+    Run at most one coroutine per key at a time on an event loop.
+
+    The call runs as its own task, so cancelling one waiter never cancels
+    the request the others are waiting on.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: dict[Hashable, asyncio.Future[Any]] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await `fn()`, or the identical call already in flight."""
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._tasks[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Future[Any]) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+
+    def __len__(self) -> int:
+        return len(self._tasks)
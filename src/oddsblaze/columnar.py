@@ -0,0 +1,393 @@
+"""Columnar (NumPy / Arrow / pandas) export of odds boards and line movement.
+
+Requires NumPy (`pip install oddsblaze[numpy]`); `to_arrow()` additionally
+needs pyarrow and `to_pandas()` needs pandas.
+"""
+
+import warnings
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Union
+
+from .prices import parse_price
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - depends on installed extras
+    raise ImportError(
+        "Columnar export requires NumPy: pip install oddsblaze[numpy]"
+    ) from e
+
+if TYPE_CHECKING:
+    import pandas
+    import pyarrow
+
+    from .models import HistoricalResponse, OddsResponse
+    from .models.raw import RawHistoricalResponse, RawOddsResponse
+
+# Sentinel for missing timestamps; equal to NumPy's NaT when viewed as datetime64.
+MISSING_MS = np.iinfo(np.int64).min
+
+# Repeated strings stored as (int32 codes, categories); -1 marks a null.
+DICTIONARY_COLUMNS = (
+    "sportsbook",
+    "league",
+    "event_id",
+    "away_team",
+    "home_team",
+    "market",
+    "side",
+    "player",
+)
+
+COLUMNS = (
+    "sportsbook",
+    "league",
+    "event_id",
+    "away_team",
+    "home_team",
+    "live",
+    "date",
+    "odd_id",
+    "market",
+    "name",
+    "side",
+    "line",
+    "player",
+    "main",
+    "price",
+    "updated",
+)
+
+
+class _Dictionary:
+    """Accumulates dictionary codes for one column."""
+
+    __slots__ = ("codes", "index")
+
+    def __init__(self) -> None:
+        self.codes: list[int] = []
+        self.index: dict[str, int] = {}
+
+    def add(self, value: Optional[str]) -> None:
+        if value is None:
+            self.codes.append(-1)
+            return
+        code = self.index.get(value)
+        if code is None:
+            code = self.index[value] = len(self.index)
+        self.codes.append(code)
+
+    def build(self) -> tuple["np.ndarray", list[str]]:
+        return np.asarray(self.codes, dtype=np.int32), list(self.index)
+
+
+def _iso_to_ms(values: list[Optional[str]]) -> "np.ndarray":
+    """Convert ISO 8601 UTC strings to int64 epoch milliseconds."""
+    cleaned = [v[:-1] if v and v.endswith("Z") else (v or "NaT") for v in values]
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            return np.array(cleaned, dtype="datetime64[ms]").view(np.int64)
+    except (ValueError, Warning):
+        # Explicit UTC offsets: fall back to parsing one value at a time.
+        return _datetime_to_ms(
+            datetime.fromisoformat(v.replace("Z", "+00:00")) if v else None
+            for v in values
+        )
+
+
+def _datetime_to_ms(values: Iterable[Optional[datetime]]) -> "np.ndarray":
+    """Convert datetimes (naive ones taken as UTC) to int64 epoch milliseconds."""
+    return np.array(
+        [MISSING_MS if v is None else _epoch_ms(v) for v in values], dtype=np.int64
+    )
+
+
+def _epoch_ms(value: datetime) -> int:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp() * 1000)
+
+
+@dataclass
+class OddsColumns:
+    """
+    One row per odds line, stored column by column.
+
+    `arrays` holds plain columns: `price` and `line` are float64 (NaN when
+    missing), `date` and `updated` are int64 epoch milliseconds (`MISSING_MS`
+    when missing), `live` and `main` are bool (a missing `main` is False).
+    `dictionaries` holds repeated strings as int32 codes into a category list.
+    """
+
+    arrays: dict[str, "np.ndarray"]
+    dictionaries: dict[str, tuple["np.ndarray", list[str]]]
+
+    def __len__(self) -> int:
+        return len(self.arrays["odd_id"])
+
+    def to_numpy(self) -> dict[str, "np.ndarray"]:
+        """Columns as NumPy arrays; dictionary columns become object arrays."""
+        out: dict[str, np.ndarray] = {}
+        for name in COLUMNS:
+            if name in self.dictionaries:
+                codes, categories = self.dictionaries[name]
+                lookup = np.array([*categories, None], dtype=object)
+                out[name] = lookup[codes]
+            else:
+                out[name] = self.arrays[name]
+        return out
+
+    def to_records(self) -> "np.recarray":
+        """Rows as a NumPy record array."""
+        columns = self.to_numpy()
+        return np.rec.fromarrays(list(columns.values()), names=list(columns))
+
+    def to_arrow(self) -> "pyarrow.Table":
+        """Rows as a pyarrow Table with dictionary-encoded string columns."""
+        import pyarrow as pa
+
+        fields = {}
+        for name in COLUMNS:
+            if name in self.dictionaries:
+                codes, categories = self.dictionaries[name]
+                fields[name] = pa.DictionaryArray.from_arrays(
+                    pa.array(codes, mask=codes < 0),
+                    pa.array(categories, type=pa.string()),
+                )
+            elif name in ("date", "updated"):
+                values = self.arrays[name]
+                fields[name] = pa.array(
+                    values, type=pa.timestamp("ms", tz="UTC"), mask=values == MISSING_MS
+                )
+            else:
+                fields[name] = pa.array(self.arrays[name])
+        return pa.table(fields)
+
+    def to_pandas(self) -> "pandas.DataFrame":
+        """Rows as a pandas DataFrame with categorical string columns."""
+        import pandas as pd
+
+        data: dict[str, Any] = {}
+        for name in COLUMNS:
+            if name in self.dictionaries:
+                codes, categories = self.dictionaries[name]
+                data[name] = pd.Categorical.from_codes(codes, categories=categories)
+            elif name in ("date", "updated"):
+                stamps = self.arrays[name].view("datetime64[ms]")
+                data[name] = pd.to_datetime(stamps).tz_localize("UTC")
+            else:
+                data[name] = self.arrays[name]
+        return pd.DataFrame(data)
+
+
+class _Builder:
+    """Collects rows for `OddsColumns`, one event at a time."""
+
+    def __init__(self) -> None:
+        self.dicts = {
+            name: _Dictionary()
+            for name in (
+                "event_id",
+                "away_team",
+                "home_team",
+                "market",
+                "side",
+                "player",
+            )
+        }
+        self.counts: list[int] = []
+        self.live: list[bool] = []
+        self.dates: list[Any] = []
+        self.odd_ids: list[str] = []
+        self.names: list[str] = []
+        self.lines: list[float] = []
+        self.mains: list[bool] = []
+        self.prices: list[float] = []
+        self.updated: list[Any] = []
+
+    def build(self, sportsbook: str, league: str, timestamps: Any) -> OddsColumns:
+        counts = np.asarray(self.counts, dtype=np.int64)
+        total = int(counts.sum())
+        dictionaries = {}
+        for name, builder in self.dicts.items():
+            codes, categories = builder.build()
+            if name in ("event_id", "away_team", "home_team"):
+                codes = np.repeat(codes, counts)
+            dictionaries[name] = (codes, categories)
+        dictionaries["sportsbook"] = (np.zeros(total, dtype=np.int32), [sportsbook])
+        dictionaries["league"] = (np.zeros(total, dtype=np.int32), [league])
+
+        arrays = {
+            "live": np.repeat(np.asarray(self.live, dtype=bool), counts),
+            "date": np.repeat(timestamps(self.dates), counts),
+            "odd_id": np.asarray(self.odd_ids, dtype=object),
+            "name": np.asarray(self.names, dtype=object),
+            "line": np.asarray(self.lines, dtype=np.float64),
+            "main": np.asarray(self.mains, dtype=bool),
+            "price": np.asarray(self.prices, dtype=np.float64),
+            "updated": timestamps(self.updated),
+        }
+        return OddsColumns(arrays=arrays, dictionaries=dictionaries)
+
+
+def odds_columns(response: "OddsResponse") -> OddsColumns:
+    """Flatten a validated `OddsResponse` into columns."""
+    b = _Builder()
+    market, side, player = b.dicts["market"], b.dicts["side"], b.dicts["player"]
+    for event in response.events:
+        b.dicts["event_id"].add(event.id)
+        b.dicts["away_team"].add(event.teams.away.name)
+        b.dicts["home_team"].add(event.teams.home.name)
+        b.live.append(event.live)
+        b.dates.append(event.date)
+        b.counts.append(len(event.odds))
+        for odd in event.odds:
+            selection = odd.selection
+            b.odd_ids.append(odd.id)
+            b.names.append(odd.name)
+            market.add(odd.market)
+            side.add(selection.side if selection else None)
+            player.add(odd.player.name if odd.player else None)
+            line = selection.line if selection else None
+            b.lines.append(np.nan if line is None else line)
+            b.mains.append(bool(odd.main))
+            b.prices.append(parse_price(odd.price))
+            b.updated.append(odd.updated)
+    return b.build(response.sportsbook.id, response.league.id, _datetime_to_ms)
+
+
+def raw_odds_columns(data: "RawOddsResponse") -> OddsColumns:
+    """Flatten an unvalidated (`validate=False`) odds payload into columns."""
+    b = _Builder()
+    market, side, player = b.dicts["market"], b.dicts["side"], b.dicts["player"]
+    for event in data.get("events", []):
+        odds = event.get("odds", [])
+        b.dicts["event_id"].add(event["id"])
+        b.dicts["away_team"].add(event["teams"]["away"]["name"])
+        b.dicts["home_team"].add(event["teams"]["home"]["name"])
+        b.live.append(event["live"])
+        b.dates.append(event["date"])
+        b.counts.append(len(odds))
+        for odd in odds:
+            selection = odd.get("selection") or {}
+            odd_player = odd.get("player") or {}
+            b.odd_ids.append(odd["id"])
+            b.names.append(odd["name"])
+            market.add(odd["market"])
+            side.add(selection.get("side"))
+            player.add(odd_player.get("name"))
+            line = selection.get("line")
+            b.lines.append(np.nan if line is None else line)
+            b.mains.append(bool(odd.get("main")))
+            b.prices.append(parse_price(odd["price"]))
+            b.updated.append(odd.get("updated"))
+    return b.build(data["sportsbook"]["id"], data["league"]["id"], _iso_to_ms)
+
+
+@dataclass
+class HistoricalColumns:
+    """
+    Line movement for many odds IDs, stored column by column.
+
+    The entries of `odds_ids[i]` are rows `offsets[i]:offsets[i + 1]` of
+    `timestamp` (int64 epoch milliseconds), `price` (float64 in the fetched
+    format, NaN while locked) and `locked` (bool mask). The `olv_*` and
+    `clv_*` arrays hold one value per odds ID (NaN / `MISSING_MS` when
+    absent). IDs whose fetch failed are left out and listed in `errors`.
+    """
+
+    odds_ids: list[str]
+    offsets: "np.ndarray"
+    timestamp: "np.ndarray"
+    price: "np.ndarray"
+    locked: "np.ndarray"
+    olv_price: "np.ndarray"
+    olv_timestamp: "np.ndarray"
+    clv_price: "np.ndarray"
+    clv_timestamp: "np.ndarray"
+    errors: dict[str, BaseException]
+
+    def __len__(self) -> int:
+        return len(self.odds_ids)
+
+    def series(self, odds_id: str) -> dict[str, "np.ndarray"]:
+        """Timestamp, price and locked views for one odds ID."""
+        i = self.odds_ids.index(odds_id)
+        rows = slice(self.offsets[i], self.offsets[i + 1])
+        return {
+            "timestamp": self.timestamp[rows],
+            "price": self.price[rows],
+            "locked": self.locked[rows],
+        }
+
+
+def _ms(value: Any) -> int:
+    """Epoch milliseconds from a raw int or a validated datetime."""
+    if value is None:
+        return MISSING_MS
+    if isinstance(value, datetime):
+        return _epoch_ms(value)
+    return value
+
+
+def historical_columns(
+    results: Iterable[
+        tuple[str, Union["RawHistoricalResponse", "HistoricalResponse", BaseException]]
+    ],
+) -> HistoricalColumns:
+    """Collect (odds ID, raw or validated response, or error) into columns."""
+    odds_ids: list[str] = []
+    errors: dict[str, BaseException] = {}
+    counts: list[int] = []
+    stamps: list[int] = []
+    prices: list[float] = []
+    locked: list[bool] = []
+    points: dict[str, list[Any]] = {
+        "olv_price": [],
+        "olv_timestamp": [],
+        "clv_price": [],
+        "clv_timestamp": [],
+    }
+    parsed: dict[Optional[str], float] = {None: np.nan}
+
+    for odds_id, result in results:
+        if isinstance(result, BaseException):
+            errors[odds_id] = result
+            continue
+        if not isinstance(result, dict):
+            result = result.model_dump(by_alias=True)
+        odds_ids.append(odds_id)
+        entries = result.get("entries") or ()
+        counts.append(len(entries))
+        for entry in entries:
+            price = entry.get("price")
+            number = parsed.get(price)
+            if number is None:
+                number = parsed[price] = parse_price(price)
+            prices.append(number)
+            stamps.append(_ms(entry["timestamp"]))
+            locked.append(entry["locked"])
+        for name in ("olv", "clv"):
+            point = result.get(name) or {}
+            price = point.get("price")
+            points[f"{name}_price"].append(
+                np.nan if price is None else parse_price(price)
+            )
+            points[f"{name}_timestamp"].append(_ms(point.get("timestamp")))
+
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return HistoricalColumns(
+        odds_ids=odds_ids,
+        offsets=offsets,
+        timestamp=np.asarray(stamps, dtype=np.int64),
+        price=np.asarray(prices, dtype=np.float64),
+        locked=np.asarray(locked, dtype=bool),
+        olv_price=np.asarray(points["olv_price"], dtype=np.float64),
+        olv_timestamp=np.asarray(points["olv_timestamp"], dtype=np.int64),
+        clv_price=np.asarray(points["clv_price"], dtype=np.float64),
+        clv_timestamp=np.asarray(points["clv_timestamp"], dtype=np.int64),
+        errors=errors,
+    )
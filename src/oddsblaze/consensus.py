@@ -0,0 +1,236 @@
+"""Local consensus odds computed from individual sportsbook boards.
+
+Requires NumPy (`pip install oddsblaze[numpy]`).
+"""
+
+import re
+from typing import Iterable, Literal, Optional, overload
+
+from .models import (
+    ConsensusEvent,
+    ConsensusOdd,
+    ConsensusResponse,
+    Event,
+    Odd,
+    OddsResponse,
+    Sportsbook,
+    SportsbookPrice,
+)
+from .models.base import set_price_format
+from .prices import format_price, price_numbers
+from .settings import PriceFormat
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - depends on installed extras
+    raise ImportError(
+        "Local consensus requires NumPy: pip install oddsblaze[numpy]"
+    ) from e
+
+ConsensusMode = Literal["average", "best"]
+
+CONSENSUS_SPORTSBOOK = Sportsbook(id="consensus", name="Consensus")
+
+_NON_SLUG = re.compile(r"[^a-z0-9]+")
+
+
+def market_id(name: str) -> str:
+    """Market ID for a market name (`"Point Spread"` -> `"point-spread"`)."""
+    return _NON_SLUG.sub("-", name.lower()).strip("-")
+
+
+@overload
+def compute_consensus(
+    boards: Iterable[OddsResponse],
+    market: str,
+    *,
+    mode: ConsensusMode = ...,
+    price_format: PriceFormat = ...,
+    dedupe: Optional[bool] = ...,
+    sportsbooks: Optional[list[str]] = ...,
+    required_sportsbooks: Optional[list[str]] = ...,
+    weights: Optional[dict[str, float]] = ...,
+) -> ConsensusResponse: ...
+
+
+@overload
+def compute_consensus(
+    boards: Iterable[OddsResponse],
+    market: Optional[list[str]] = ...,
+    *,
+    mode: ConsensusMode = ...,
+    price_format: PriceFormat = ...,
+    dedupe: Optional[bool] = ...,
+    sportsbooks: Optional[list[str]] = ...,
+    required_sportsbooks: Optional[list[str]] = ...,
+    weights: Optional[dict[str, float]] = ...,
+) -> dict[str, ConsensusResponse]: ...
+
+
+def compute_consensus(
+    boards: Iterable[OddsResponse],
+    market: Optional[str | list[str]] = None,
+    *,
+    mode: ConsensusMode = "average",
+    price_format: PriceFormat = PriceFormat.AMERICAN,
+    dedupe: Optional[bool] = None,
+    sportsbooks: Optional[list[str]] = None,
+    required_sportsbooks: Optional[list[str]] = None,
+    weights: Optional[dict[str, float]] = None,
+) -> ConsensusResponse | dict[str, ConsensusResponse]:
+    """
+    Compute consensus odds from boards already fetched.
+
+    Takes the same options as `get_consensus`. The boards are flattened
+    once and every selection of every event in every requested market is
+    reduced in one vectorized pass: `"average"` takes the weighted mean of
+    implied probabilities, `"best"` the best price on offer.
+
+    Args:
+        boards: Odds boards for one league, one per sportsbook
+        market: Market ID (e.g., "point-spread") or name (e.g., "Point Spread")
+            for one `ConsensusResponse`; a list of them, or None for every
+            market on the boards, for a dict of responses keyed by market ID
+        mode: "average" or "best" (best available)
+        price_format: Format of the board prices; consensus prices use it too
+        dedupe: Count each distinct price once per selection (default True)
+        sportsbooks: Sportsbooks to include (at least one must have odds)
+        required_sportsbooks: Sportsbooks that must all be present
+        weights: Custom weights by sportsbook ID (e.g., {"draftkings": 1.5})
+    """
+    if market is None:
+        wanted = None
+    else:
+        requested = [market] if isinstance(market, str) else market
+        wanted = {market_id(name): None for name in requested}
+    include = {book.lower() for book in sportsbooks} if sportsbooks else None
+    required = {book.lower() for book in required_sportsbooks or ()}
+    book_weights = {book.lower(): w for book, w in (weights or {}).items()}
+
+    # Flatten to one row per (market, selection, sportsbook) in a single scan;
+    # market names repeat, so each is turned into an ID only once.
+    slugs: dict[str, str] = {}
+    keys: dict[tuple[str, str, str], int] = {}
+    groups: list[tuple[str, Event, Odd]] = []
+    sources: list[tuple[OddsResponse, Odd]] = []
+    group_of: list[int] = []
+    decimals: list[float] = []
+    book_weight: list[float] = []
+    is_required: list[bool] = []
+    league = updated = None
+    for board in boards:
+        book = board.sportsbook.id.lower()
+        if include is not None and book not in include:
+            continue
+        league = league or board.league
+        updated = max(updated, board.updated) if updated else board.updated
+        weight = book_weights.get(book, 1.0)
+        for event in board.events:
+            for odd in event.odds:
+                slug = slugs.get(odd.market)
+                if slug is None:
+                    slug = slugs[odd.market] = market_id(odd.market)
+                if wanted is not None and slug not in wanted:
+                    continue
+                slot = keys.setdefault((slug, event.id, odd.name), len(keys))
+                if slot == len(groups):
+                    groups.append((slug, event, odd))
+                sources.append((board, odd))
+                group_of.append(slot)
+                decimals.append(price_numbers(odd.price, price_format).decimal)
+                book_weight.append(weight)
+                is_required.append(book in required)
+
+    if league is None:
+        raise ValueError("No boards left to compute consensus from")
+
+    n = len(groups)
+    group = np.array(group_of, dtype=np.int64)
+    decimal = np.array(decimals, dtype=np.float64)
+    weight = np.array(book_weight, dtype=np.float64)
+    priced = decimal > 1  # False for NaN and non-paying prices
+
+    counted = priced.copy()
+    if dedupe is None or dedupe:
+        # Keep the first row of every (selection, price) run.
+        order = np.lexsort((decimal, group))
+        repeat = (group[order][1:] == group[order][:-1]) & (
+            decimal[order][1:] == decimal[order][:-1]
+        )
+        counted[order[1:][repeat]] = False
+
+    keep = np.bincount(group[priced], minlength=n) > 0
+    if required:
+        present = np.bincount(
+            group[np.array(is_required, dtype=bool) & priced], minlength=n
+        )
+        keep &= present == len(required)
+
+    if mode == "best":
+        consensus = np.full(n, -np.inf)
+        np.maximum.at(consensus, group[priced], decimal[priced])
+    else:
+        w = np.where(counted, weight, 0.0)
+        total = np.bincount(group, weights=w, minlength=n)
+        probability = np.bincount(
+            group,
+            weights=np.divide(w, decimal, where=counted, out=np.zeros_like(w)),
+            minlength=n,
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            consensus = total / probability
+        keep &= total > 0
+
+    kept = keep.tolist()
+    quotes: list[list[SportsbookPrice]] = [[] for _ in range(n)]
+    for slot, (board, odd) in zip(group_of, sources):
+        if kept[slot]:
+            quotes[slot].append(
+                SportsbookPrice(
+                    name=board.sportsbook.name,
+                    price=odd.price,
+                    timestamp=odd.updated or board.updated,
+                )
+            )
+
+    markets: dict[str, dict[str, tuple[Event, list[ConsensusOdd]]]] = {
+        slug: {} for slug in (wanted if wanted is not None else slugs.values())
+    }
+    for index in np.flatnonzero(keep):
+        slug, event, odd = groups[index]
+        _, odds = markets[slug].setdefault(event.id, (event, []))
+        odds.append(
+            ConsensusOdd(
+                id=f"Consensus#{event.id}#{odd.market}#{odd.name}",
+                market=odd.market,
+                name=odd.name,
+                price=format_price(float(consensus[index]), price_format),
+                selection=odd.selection,
+                player=odd.player,
+                sportsbooks=quotes[index],
+            )
+        )
+
+    responses = {
+        slug: ConsensusResponse(
+            updated=updated,
+            league=league,
+            sportsbook=CONSENSUS_SPORTSBOOK,
+            events=[
+                ConsensusEvent(
+                    id=event.id,
+                    teams=event.teams,
+                    date=event.date,
+                    live=event.live,
+                    odds=odds,
+                )
+                for event, odds in events.values()
+            ],
+        )
+        for slug, events in markets.items()
+    }
+    if price_format is not PriceFormat.AMERICAN:
+        set_price_format(list(responses.values()), price_format)
+    if isinstance(market, str):
+        return responses[market_id(market)]
+    return responses
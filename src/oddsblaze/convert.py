@@ -0,0 +1,100 @@
+"""Vectorized conversion between price formats.
+
+Requires NumPy (`pip install oddsblaze[numpy]`).
+"""
+
+from typing import Iterable, Union
+
+from .prices import format_price, parse_price
+from .settings import PriceFormat
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - depends on installed extras
+    raise ImportError(
+        "Price conversion requires NumPy: pip install oddsblaze[numpy]"
+    ) from e
+
+Prices = Union["np.ndarray", Iterable[str]]
+
+
+def to_decimal_array(values: "np.ndarray", price_format: PriceFormat) -> "np.ndarray":
+    """
+    Convert numeric prices (as from `parse_price`) to decimal odds.
+
+    Args:
+        values: Prices in `price_format`, e.g. the `price` column of `OddsColumns`
+        price_format: Format the values are in
+    """
+    v = np.asarray(values, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if price_format is PriceFormat.AMERICAN:
+            out = np.where(v > 0, 1 + v / 100, 1 - 100 / v)
+        elif price_format is PriceFormat.DECIMAL:
+            out = v.copy()
+        elif price_format in (PriceFormat.FRACTIONAL, PriceFormat.HONG_KONG):
+            out = 1 + v
+        elif price_format is PriceFormat.PROBABILITY:
+            out = 1 / np.where(v > 1, v / 100, v)
+        else:  # Malaysian and Indonesian
+            out = np.where(v > 0, 1 + v, 1 - 1 / v)
+    out[~(out > 1) | np.isinf(out)] = np.nan
+    return out
+
+
+def from_decimal_array(
+    decimals: "np.ndarray", price_format: PriceFormat
+) -> "np.ndarray":
+    """
+    Convert decimal odds to numeric prices in `price_format`.
+
+    Values match `parse_price` of the formatted string: American `+150` is
+    150.0, probability `40%` is 0.4 and fractional `3/2` is 1.5.
+
+    Args:
+        decimals: Decimal odds
+        price_format: Format to convert to
+    """
+    d = np.asarray(decimals, dtype=np.float64)
+    d = np.where(d > 1, d, np.nan)
+    profit = d - 1
+    if price_format is PriceFormat.AMERICAN:
+        return np.where(profit >= 1, profit * 100, -100 / profit)
+    if price_format is PriceFormat.DECIMAL:
+        return d
+    if price_format is PriceFormat.PROBABILITY:
+        return 1 / d
+    if price_format is PriceFormat.MALAYSIAN:
+        return np.where(profit <= 1, profit, -1 / profit)
+    if price_format is PriceFormat.INDONESIAN:
+        return np.where(profit >= 1, profit, -1 / profit)
+    return profit  # fractional and Hong Kong
+
+
+def convert_prices(
+    prices: Prices, source: PriceFormat, target: PriceFormat
+) -> "np.ndarray":
+    """
+    Rewrite many price strings from one format in another.
+
+    Boards repeat a few hundred distinct prices, so each distinct string is
+    parsed and formatted once and the results are gathered back with NumPy.
+
+    Args:
+        prices: Price strings as returned by the API
+        source: Format the prices are written in
+        target: Format to write
+
+    Returns:
+        Object array of price strings in `target`
+    """
+    if not isinstance(prices, np.ndarray):
+        prices = list(prices)
+    strings = np.asarray(prices, dtype=str)
+    if source is target or strings.size == 0:
+        return strings.astype(object)
+    unique, inverse = np.unique(strings, return_inverse=True)
+    numeric = np.fromiter((parse_price(p) for p in unique), np.float64, len(unique))
+    decimals = to_decimal_array(numeric, source)
+    out = np.array([format_price(d, target) for d in decimals], dtype=object)
+    return out[inverse.reshape(strings.shape)]
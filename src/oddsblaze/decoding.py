@@ -0,0 +1,63 @@
+"""Response decoding helpers shared by the sync and async clients."""
+
+import json
+from functools import lru_cache
+from typing import Any, Optional
+
+from pydantic import TypeAdapter, ValidationError
+
+from .exceptions import raise_for_error_message
+from .models.base import price_format_context
+from .settings import PriceFormat
+
+
+@lru_cache(maxsize=None)
+def get_adapter(response_type: Any) -> TypeAdapter[Any]:
+    """Return a cached TypeAdapter for a response model or list type."""
+    return TypeAdapter(response_type)
+
+
+def requested_price_format(params: dict[str, str]) -> Optional[PriceFormat]:
+    """The `price` request parameter, or None when prices are American."""
+    price = params.get("price")
+    if price is None or price == PriceFormat.AMERICAN.value:
+        return None
+    return PriceFormat(price)
+
+
+def decode(
+    content: bytes, response_type: Any, price_format: Optional[PriceFormat] = None
+) -> Any:
+    """
+    Validate a raw JSON body straight into `response_type`.
+
+    Parsing and validation happen in a single pass inside pydantic-core, with
+    no intermediate dict tree. The API's `{"message": ...}` error payload
+    fails validation, so it is only looked for on that slow path.
+
+    A `response_type` of None skips validation and returns the decoded JSON.
+    Validated models are tagged with `price_format` as they are built when it
+    is given (see `requested_price_format`).
+    """
+    if response_type is None:
+        data = json.loads(content)
+        if isinstance(data, dict) and "message" in data and len(data) == 1:
+            raise_for_error_message(data["message"])
+        return data
+
+    try:
+        result = get_adapter(response_type).validate_json(
+            content, context=price_format_context(price_format)
+        )
+    except ValidationError:
+        try:
+            data = json.loads(content)
+        except ValueError:
+            data = None
+
+        # Check for API error messages
+        if isinstance(data, dict) and "message" in data and len(data) == 1:
+            raise_for_error_message(data["message"])
+        raise
+
+    return result
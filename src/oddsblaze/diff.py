@@ -0,0 +1,131 @@
+"""Incremental diffs between successive odds boards."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Union
+
+from .models import OddsResponse
+
+Pair = tuple[str, str]
+
+# What we remember per odds line: (event id, price, updated).
+_Line = tuple[str, str, Optional[datetime]]
+
+
+@dataclass(frozen=True, slots=True)
+class Added:
+    """An odds line that was not on the previous board."""
+
+    sportsbook: str
+    league: str
+    event_id: str
+    odd_id: str
+    price: str
+    updated: Optional[datetime]
+
+
+@dataclass(frozen=True, slots=True)
+class Changed:
+    """An odds line whose price or update time moved."""
+
+    sportsbook: str
+    league: str
+    event_id: str
+    odd_id: str
+    old_price: str
+    new_price: str
+    old_updated: Optional[datetime]
+    new_updated: Optional[datetime]
+
+    @property
+    def price_moved(self) -> bool:
+        """Whether the price itself changed (not just the update time)."""
+        return self.old_price != self.new_price
+
+
+@dataclass(frozen=True, slots=True)
+class Removed:
+    """An odds line that is no longer offered (pulled, suspended or settled)."""
+
+    sportsbook: str
+    league: str
+    event_id: str
+    odd_id: str
+    price: str
+    updated: Optional[datetime]
+
+
+OddsChange = Union[Added, Changed, Removed]
+
+
+class OddsDiffer:
+    """
+    Diff each new board against the previous one for the same pair.
+
+    Lines are matched by `Odd.id` and compared on `(price, updated)` only, so
+    a diff costs one dict lookup per line and never compares whole models.
+    The first board seen for a (sportsbook, league) pair is reported as all
+    `Added`.
+    """
+
+    def __init__(self) -> None:
+        self._snapshots: dict[Pair, dict[str, _Line]] = {}
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    def __contains__(self, pair: object) -> bool:
+        return pair in self._snapshots
+
+    def diff(self, response: OddsResponse) -> list[OddsChange]:
+        """
+        Return what changed since the previous board and remember this one.
+
+        Args:
+            response: The latest odds board for one (sportsbook, league)
+        """
+        sportsbook, league = response.sportsbook.id, response.league.id
+        previous = self._snapshots.get((sportsbook, league), {})
+        current: dict[str, _Line] = {}
+        changes: list[OddsChange] = []
+
+        for event in response.events:
+            for odd in event.odds:
+                line = current[odd.id] = (event.id, odd.price, odd.updated)
+                old = previous.get(odd.id)
+                if old is None:
+                    changes.append(
+                        Added(
+                            sportsbook, league, event.id, odd.id, odd.price, odd.updated
+                        )
+                    )
+                elif old[1:] != line[1:]:
+                    changes.append(
+                        Changed(
+                            sportsbook,
+                            league,
+                            event.id,
+                            odd.id,
+                            old[1],
+                            odd.price,
+                            old[2],
+                            odd.updated,
+                        )
+                    )
+
+        for odd_id, (event_id, price, updated) in previous.items():
+            if odd_id not in current:
+                changes.append(
+                    Removed(sportsbook, league, event_id, odd_id, price, updated)
+                )
+
+        self._snapshots[(sportsbook, league)] = current
+        return changes
+
+    def forget(self, sportsbook: str, league: str) -> None:
+        """Drop the snapshot for a pair so its next board is all `Added`."""
+        self._snapshots.pop((sportsbook, league), None)
+
+    def clear(self) -> None:
+        """Drop every snapshot."""
+        self._snapshots.clear()
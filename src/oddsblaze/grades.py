@@ -0,0 +1,100 @@
+"""Persistent cache of final bet grades."""
+
+import sqlite3
+import threading
+from os import PathLike
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+from .models import GraderResponse
+
+DEFAULT_GRADES_PATH = Path.home() / ".cache" / "oddsblaze" / "grades.sqlite3"
+
+# SQLite's default limit on bound parameters per statement is 999.
+_BATCH = 500
+
+
+def is_final(response: GraderResponse) -> bool:
+    """Whether a grade can no longer change (the event is final)."""
+    return response.event.status.startswith("Final")
+
+
+class GradeCache:
+    """
+    SQLite store of final `GraderResponse`s keyed by odds ID.
+
+    A graded bet whose event is final never changes, so once stored it is
+    served from local disk by `grade_bet` and `grade_many` on every later
+    run. Results for events still in progress are never stored.
+
+    Args:
+        path: Database file (created if missing); ":memory:" for a
+            process-local store
+    """
+
+    def __init__(self, path: Union[str, PathLike[str]] = DEFAULT_GRADES_PATH):
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS grades ("
+                "odds_id TEXT PRIMARY KEY, response TEXT NOT NULL)"
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._db.execute("SELECT COUNT(*) FROM grades").fetchone()
+        return count
+
+    def __contains__(self, odds_id: object) -> bool:
+        return isinstance(odds_id, str) and self.get(odds_id) is not None
+
+    def get(self, odds_id: str) -> Optional[GraderResponse]:
+        """Stored grade for an odds ID, or None."""
+        return self.get_many([odds_id]).get(odds_id)
+
+    def get_many(self, odds_ids: Iterable[str]) -> dict[str, GraderResponse]:
+        """Stored grades for any of the given odds IDs."""
+        ids = list(odds_ids)
+        found: dict[str, GraderResponse] = {}
+        with self._lock:
+            for start in range(0, len(ids), _BATCH):
+                batch = ids[start : start + _BATCH]
+                rows = self._db.execute(
+                    "SELECT odds_id, response FROM grades WHERE odds_id IN "
+                    f"({','.join('?' * len(batch))})",
+                    batch,
+                ).fetchall()
+                for odds_id, body in rows:
+                    found[odds_id] = GraderResponse.model_validate_json(body)
+        return found
+
+    def put(self, odds_id: str, response: GraderResponse) -> bool:
+        """
+        Store a grade if its event is final.
+
+        Returns:
+            Whether the grade was stored
+        """
+        if not is_final(response):
+            return False
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO grades VALUES (?, ?)",
+                (odds_id, response.model_dump_json()),
+            )
+        return True
+
+    def clear(self) -> None:
+        """Delete every stored grade."""
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM grades")
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,88 @@
+"""Hedged requests: race a backup request against a slow one."""
+
+import threading
+from collections import deque
+from typing import Optional
+
+
+class HedgePolicy:
+    """
+    When to send a backup copy of a slow request, and how often.
+
+    A request still running after the `percentile` of recent latencies gets
+    one identical backup; whichever answers first wins and the other is
+    cancelled. No hedges are sent until `min_samples` latencies are known.
+
+    Hedges are paid for from a budget: every request earns `budget` credit
+    and a hedge costs one, so at most that fraction of requests (plus a
+    burst of `max_credit`) is ever duplicated, even when the service slows
+    down across the board.
+
+    Args:
+        percentile: Latency percentile (0-100) after which to hedge
+        window: Number of recent latencies to keep
+        min_samples: Latencies needed before hedging starts
+        min_delay: Never hedge sooner than this many seconds
+        budget: Hedges allowed per request (e.g. 0.05 for 5%)
+        max_credit: Most hedges that may be saved up while things are fast
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        *,
+        window: int = 256,
+        min_samples: int = 20,
+        min_delay: float = 0.01,
+        budget: float = 0.05,
+        max_credit: float = 10.0,
+    ):
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.budget = budget
+        self.max_credit = max_credit
+        self.hedged = 0
+        self.hedge_wins = 0
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._credit = 0.0
+        self._lock = threading.Lock()
+
+    def delay(self) -> Optional[float]:
+        """Seconds to wait before hedging, or None if not enough samples yet."""
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            ranked = sorted(self._latencies)
+        index = min(int(len(ranked) * self.percentile / 100), len(ranked) - 1)
+        return max(ranked[index], self.min_delay)
+
+    def record(self, seconds: float, hedge_won: bool = False) -> None:
+        """
+        Record a finished request's latency and earn hedge credit.
+
+        Args:
+            seconds: Latency of the request that answered
+            hedge_won: Whether that request was the hedge
+        """
+        with self._lock:
+            self._latencies.append(seconds)
+            self.hedge_wins += hedge_won
+            self._credit = min(self._credit + self.budget, self.max_credit)
+
+    def try_spend(self) -> bool:
+        """Take credit for one hedge; False if the budget is used up."""
+        with self._lock:
+            if self._credit < 1:
+                return False
+            self._credit -= 1
+            self.hedged += 1
+            return True
+
+    def refund(self) -> None:
+        """Give back the credit of a hedge that was not sent after all."""
+        with self._lock:
+            self._credit = min(self._credit + 1, self.max_credit)
+            self.hedged -= 1
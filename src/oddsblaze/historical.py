@@ -0,0 +1,144 @@
+"""Persistent on-disk store of closed historical odds."""
+
+import json
+import mmap
+import os
+import struct
+import threading
+import zlib
+from datetime import datetime
+from os import PathLike
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from .decoding import get_adapter
+from .models import HistoricalResponse, LazyHistoricalResponse
+
+DEFAULT_HISTORICAL_PATH = Path.home() / ".cache" / "oddsblaze" / "historical.bin"
+
+# Record header: key length, compressed body length.
+_HEADER = struct.Struct("<II")
+
+
+def is_closed(response: Union[HistoricalResponse, LazyHistoricalResponse]) -> bool:
+    """Whether historical odds can no longer change (a closing line exists)."""
+    return response.clv is not None
+
+
+def historical_key(
+    odds_id: str, price: str, time_series: bool = False, locked: bool = False
+) -> str:
+    """Store key for one `get_historical` call."""
+    return f"{odds_id}\0{price}\0{int(time_series)}{int(locked)}"
+
+
+def _wire_json(response: Union[HistoricalResponse, LazyHistoricalResponse]) -> bytes:
+    """A response as the API sends it, with timestamps in epoch milliseconds."""
+    data = response.model_dump(by_alias=True, exclude_none=True)
+    points = [data[name] for name in ("olv", "clv") if name in data]
+    for point in points + data["entries"]:
+        if isinstance(point["timestamp"], datetime):
+            point["timestamp"] = round(point["timestamp"].timestamp() * 1000)
+    return json.dumps(data, separators=(",", ":"), default=datetime.isoformat).encode()
+
+
+class HistoricalStore:
+    """
+    Append-only file of closed `HistoricalResponse`s, read through mmap.
+
+    Once an odds line has a closing line value its history never changes,
+    so `get_historical` serves it from this store instead of the network.
+    Each record is the zlib-compressed JSON of one response in the API's
+    wire shape, so it decodes into any response type. Lookups slice
+    the memory-mapped file at an offset kept in an in-memory index, which is
+    rebuilt from the record headers when the store is opened. Responses
+    without a `clv` are never stored, so they are always refetched.
+
+    Only one process should write to a store at a time.
+
+    Args:
+        path: Store file (created if missing)
+    """
+
+    def __init__(self, path: Union[str, PathLike[str]] = DEFAULT_HISTORICAL_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._index: dict[str, tuple[int, int]] = {}
+        self._map: Optional[mmap.mmap] = None
+        self._file = open(self.path, "a+b")
+        self._load()
+
+    def _load(self) -> None:
+        """Index every complete record and drop a torn tail, if any."""
+        size = os.fstat(self._file.fileno()).st_size
+        offset = 0
+        if size:
+            with mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                while offset + _HEADER.size <= size:
+                    key_len, body_len = _HEADER.unpack_from(view, offset)
+                    start = offset + _HEADER.size + key_len
+                    if start + body_len > size:
+                        break
+                    key = view[offset + _HEADER.size : start].decode()
+                    self._index[key] = (start, body_len)
+                    offset = start + body_len
+        if offset < size:
+            self._file.truncate(offset)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def get(self, key: str, response_type: Any = HistoricalResponse) -> Any:
+        """
+        Stored response for a `historical_key`, or None.
+
+        Args:
+            key: Store key from `historical_key`
+            response_type: Model to validate into, or None for plain dicts
+        """
+        with self._lock:
+            location = self._index.get(key)
+            if location is None:
+                return None
+            start, length = location
+            if self._map is None or len(self._map) < start + length:
+                if self._map is not None:
+                    self._map.close()
+                self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            body = zlib.decompress(self._map[start : start + length])
+        if response_type is None:
+            return json.loads(body)
+        return get_adapter(response_type).validate_json(body)
+
+    def put(
+        self, key: str, response: Union[HistoricalResponse, LazyHistoricalResponse]
+    ) -> bool:
+        """
+        Store a response if its odds have closed.
+
+        Returns:
+            Whether the response was stored
+        """
+        if not is_closed(response):
+            return False
+        encoded = key.encode()
+        body = zlib.compress(_wire_json(response))
+        with self._lock:
+            self._file.seek(0, os.SEEK_END)
+            offset = self._file.tell()
+            self._file.write(_HEADER.pack(len(encoded), len(body)) + encoded + body)
+            self._file.flush()
+            self._index[key] = (offset + _HEADER.size + len(encoded), len(body))
+        return True
+
+    def close(self) -> None:
+        """Close the store file."""
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            self._file.close()
@@ -1,12 +1,46 @@
 """Pydantic models for OddsBlaze API responses."""
 
-from .base import League, Links, Player, Selection, Sportsbook, Team, Teams
-from .consensus import ConsensusEvent, ConsensusOdd, ConsensusResponse, SportsbookPrice
+from .base import (
+    LazyTimestampModel,
+    League,
+    Links,
+    Player,
+    PricedModel,
+    Selection,
+    Sportsbook,
+    Team,
+    Teams,
+)
+from .consensus import (
+    ConsensusEvent,
+    ConsensusOdd,
+    ConsensusResponse,
+    LazyConsensusEvent,
+    LazyConsensusOdd,
+    LazyConsensusResponse,
+    LazySportsbookPrice,
+    SportsbookPrice,
+)
 from .grader import GradedEvent, GradedPlayer, GradedTeam, GradedTeams, GraderResponse
-from .historical import HistoricalResponse, PricePoint, TimeSeriesEntry
+from .historical import (
+    HistoricalResponse,
+    LazyHistoricalResponse,
+    LazyPricePoint,
+    LazyTimeSeriesEntry,
+    PricePoint,
+    TimeSeriesEntry,
+)
 from .markets import ActiveMarketsResponse, LeagueMarkets, Market
-from .odds import Event, Odd, OddsResponse
-from .polled import PolledLeague, PolledResponse, PolledSportsbook
+from .odds import Event, LazyEvent, LazyOddsResponse, Odd, OddsResponse
+from .polled import (
+    LazyPolledLeague,
+    LazyPolledResponse,
+    LazyPolledSportsbook,
+    PolledLeague,
+    PolledResponse,
+    PolledSportsbook,
+)
+from .raw import RawEvent, RawOdd, RawOddsResponse
 from .schedule import ScheduleEvent, ScheduleResponse
 
 __all__ = [
@@ -18,14 +52,25 @@ __all__ = [
     "Player",
     "Selection",
     "Links",
+    "PricedModel",
+    "LazyTimestampModel",
     # Odds
     "Odd",
     "Event",
     "OddsResponse",
+    "LazyEvent",
+    "LazyOddsResponse",
+    # Unvalidated odds payloads
+    "RawOdd",
+    "RawEvent",
+    "RawOddsResponse",
     # Historical
     "PricePoint",
     "TimeSeriesEntry",
     "HistoricalResponse",
+    "LazyPricePoint",
+    "LazyTimeSeriesEntry",
+    "LazyHistoricalResponse",
     # Grader
     "GradedTeam",
     "GradedTeams",
@@ -37,6 +82,10 @@ __all__ = [
     "ConsensusOdd",
     "ConsensusEvent",
     "ConsensusResponse",
+    "LazySportsbookPrice",
+    "LazyConsensusOdd",
+    "LazyConsensusEvent",
+    "LazyConsensusResponse",
     # Schedule
     "ScheduleEvent",
     "ScheduleResponse",
@@ -48,4 +97,7 @@ __all__ = [
     "PolledSportsbook",
     "PolledLeague",
     "PolledResponse",
+    "LazyPolledSportsbook",
+    "LazyPolledLeague",
+    "LazyPolledResponse",
 ]
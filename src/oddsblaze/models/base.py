@@ -1,8 +1,33 @@
 """Base Pydantic models shared across multiple endpoints."""
 
-from typing import Optional
+from datetime import datetime, timezone
+from functools import cached_property
+from typing import TYPE_CHECKING, Annotated, Any, ClassVar, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field
+
+from ..prices import convert_price, price_numbers
+from ..settings import PriceFormat
+
+# Validation context key holding the `PriceFormat` of the prices being read.
+PRICE_FORMAT = "price_format"
+
+
+def ms_to_datetime(ms: float) -> datetime:
+    """Convert an epoch-millisecond timestamp to a UTC datetime."""
+    return datetime.fromtimestamp(ms / 1000, tz=timezone.utc)
+
+
+def _read_ms(value: Any) -> Any:
+    if isinstance(value, (int, float)):
+        return ms_to_datetime(value)
+    return value
+
+
+# Epoch-millisecond timestamps. Numbers always count milliseconds, including
+# small ones pydantic alone would read as seconds; ISO 8601 strings and
+# datetimes (e.g. from `model_dump_json`) are left to pydantic-core.
+TimestampMs = Annotated[datetime, BeforeValidator(_read_ms)]
 
 
 class League(BaseModel):
@@ -67,3 +92,105 @@ class Links(BaseModel):
 
     desktop: Optional[str] = Field(default=None, description="Desktop web deep link")
     mobile: Optional[str] = Field(default=None, description="Mobile app deep link")
+
+
+class PricedModel(BaseModel):
+    """
+    Base for models with a `price` string, adding numeric views of it.
+
+    Prices are read as American unless the model was fetched in another
+    format, in which case validation records it from the context built by
+    `price_format_context` (or the library tags it with `set_price_format`).
+    Nothing is stored on the instance: the numbers come from the memoized
+    `price_numbers`, so they follow `model_copy` updates and retagging.
+    """
+
+    if TYPE_CHECKING:
+        price: Optional[str]
+
+    # Overridden per instance (outside pydantic) only for non-American prices.
+    _price_format: ClassVar[PriceFormat] = PriceFormat.AMERICAN
+
+    def model_post_init(self, context: Any, /) -> None:
+        # Tag prices read through `price_format_context`.
+        if context and context.get(PRICE_FORMAT) is not None:
+            self.__dict__["_price_format"] = context[PRICE_FORMAT]
+
+    @property
+    def price_decimal(self) -> float:
+        """The price as decimal odds (NaN if missing or unreadable)."""
+        return price_numbers(self.price, self._price_format).decimal
+
+    @property
+    def price_american(self) -> float:
+        """The price as American odds, e.g. 150.0 or -200.0."""
+        return price_numbers(self.price, self._price_format).american
+
+    @property
+    def implied_probability(self) -> float:
+        """The probability implied by the price (0-1, vig included)."""
+        return price_numbers(self.price, self._price_format).implied_probability
+
+    def price_in(
+        self, price_format: PriceFormat, source: Optional[PriceFormat] = None
+    ) -> str:
+        """
+        This price written in another format.
+
+        Args:
+            price_format: Format to write
+            source: Format the price is written in (defaults to the one fetched)
+        """
+        if self.price is None:
+            return ""
+        return convert_price(self.price, source or self._price_format, price_format)
+
+
+class LazyTimestampModel(BaseModel):
+    """
+    Base for models that keep their timestamp as epoch milliseconds.
+
+    The wire value is stored as `timestamp_ms` and only turned into a
+    datetime the first time `timestamp` is read. Either `timestamp` or
+    `timestamp_ms` is accepted on input, so `model_dump()` output validates
+    back into an equal model.
+    """
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    timestamp_ms: int = Field(
+        alias="timestamp", description="Timestamp in epoch milliseconds"
+    )
+
+    @cached_property
+    def timestamp(self) -> datetime:
+        """The timestamp as a UTC datetime."""
+        return ms_to_datetime(self.timestamp_ms)
+
+
+def price_format_context(price_format: Optional[PriceFormat]) -> Optional[dict]:
+    """
+    Validation context that tags models with `price_format` as they are built.
+
+    None for American prices, so the common case passes no context at all.
+    """
+    return None if price_format is None else {PRICE_FORMAT: price_format}
+
+
+def set_price_format(value: Any, price_format: PriceFormat) -> None:
+    """
+    Record the format of every price in a validated response.
+
+    Walks `value` (a model or list of models) and tags each model that
+    declares `_price_format`. For models built by the library itself;
+    validation tags them in the same pass through `price_format_context`.
+    """
+    if isinstance(value, list):
+        for item in value:
+            set_price_format(item, price_format)
+    elif isinstance(value, BaseModel):
+        if hasattr(type(value), "_price_format"):
+            value.__dict__["_price_format"] = price_format
+        for field in value.__dict__.values():
+            if isinstance(field, (BaseModel, list)):
+                set_price_format(field, price_format)
@@ -1,34 +1,33 @@
-"""Models for the Consensus Odds API endpoint."""
+"""Models for the Consensus Odds API endpoint.
 
-from datetime import datetime, timezone
-from typing import Annotated, Optional
+Each model comes in an eager and a lazy (epoch-millisecond) variant. Both
+inherit every field they share from one private base, so the two cannot
+drift apart; only the timestamped and nested fields are declared twice.
+"""
 
-from pydantic import BaseModel, BeforeValidator, Field
+from datetime import datetime
+from typing import Optional
 
-from .base import League, Player, Selection, Sportsbook, Teams
+from pydantic import BaseModel, Field
 
+from .base import (
+    LazyTimestampModel,
+    League,
+    Player,
+    PricedModel,
+    Selection,
+    Sportsbook,
+    Teams,
+    TimestampMs,
+)
 
-def _ms_to_datetime(v: int | datetime) -> datetime:
-    """Convert millisecond timestamp to UTC datetime."""
-    if isinstance(v, datetime):
-        return v
-    return datetime.fromtimestamp(v / 1000, tz=timezone.utc)
-
-
-TimestampMs = Annotated[datetime, BeforeValidator(_ms_to_datetime)]
-
-
-class SportsbookPrice(BaseModel):
-    """A sportsbook's price for consensus odds."""
 
+class _SportsbookPriceFields(PricedModel):
     name: str = Field(description="Sportsbook name")
     price: str = Field(description="Odds price")
-    timestamp: TimestampMs = Field(description="Last update timestamp")
 
 
-class ConsensusOdd(BaseModel):
-    """Individual consensus odds line with sportsbook breakdown."""
-
+class _ConsensusOddFields(PricedModel):
     id: str = Field(description="Consensus odds ID")
     market: str = Field(description="Market name")
     name: str = Field(description="Selection name")
@@ -37,25 +36,68 @@ class ConsensusOdd(BaseModel):
         default=None, description="Parsed selection details"
     )
     player: Optional[Player] = Field(default=None, description="Player details")
+
+
+class _ConsensusEventFields(BaseModel):
+    id: str = Field(description="Event identifier")
+    teams: Teams = Field(description="Participating teams")
+    date: datetime = Field(description="Event start time (UTC)")
+    live: bool = Field(description="Whether event is live")
+
+
+class _ConsensusResponseFields(BaseModel):
+    updated: datetime = Field(description="Response generation timestamp")
+    league: League = Field(description="League information")
+    sportsbook: Sportsbook = Field(description="Sportsbook information (Consensus)")
+
+
+class SportsbookPrice(_SportsbookPriceFields):
+    """A sportsbook's price for consensus odds."""
+
+    timestamp: TimestampMs = Field(description="Last update timestamp")
+
+
+class ConsensusOdd(_ConsensusOddFields):
+    """Individual consensus odds line with sportsbook breakdown."""
+
     sportsbooks: list[SportsbookPrice] = Field(
         default=[], description="Prices from individual sportsbooks"
     )
 
 
-class ConsensusEvent(BaseModel):
+class ConsensusEvent(_ConsensusEventFields):
     """A sporting event with consensus odds."""
 
-    id: str = Field(description="Event identifier")
-    teams: Teams = Field(description="Participating teams")
-    date: datetime = Field(description="Event start time (UTC)")
-    live: bool = Field(description="Whether event is live")
     odds: list[ConsensusOdd] = Field(default=[], description="List of consensus odds")
 
 
-class ConsensusResponse(BaseModel):
+class ConsensusResponse(_ConsensusResponseFields):
     """Response from the Consensus Odds API endpoint."""
 
-    updated: datetime = Field(description="Response generation timestamp")
-    league: League = Field(description="League information")
-    sportsbook: Sportsbook = Field(description="Sportsbook information (Consensus)")
     events: list[ConsensusEvent] = Field(default=[], description="List of events")
+
+
+class LazySportsbookPrice(LazyTimestampModel, _SportsbookPriceFields):
+    """A sportsbook's consensus price whose timestamp stays in epoch ms."""
+
+
+class LazyConsensusOdd(_ConsensusOddFields):
+    """Consensus odds line whose sportsbook timestamps are built lazily."""
+
+    sportsbooks: list[LazySportsbookPrice] = Field(
+        default=[], description="Prices from individual sportsbooks"
+    )
+
+
+class LazyConsensusEvent(_ConsensusEventFields):
+    """A sporting event with lazily timestamped consensus odds."""
+
+    odds: list[LazyConsensusOdd] = Field(
+        default=[], description="List of consensus odds"
+    )
+
+
+class LazyConsensusResponse(_ConsensusResponseFields):
+    """Consensus Odds API response that builds timestamps on first access."""
+
+    events: list[LazyConsensusEvent] = Field(default=[], description="List of events")
@@ -1,44 +1,30 @@
-"""Models for the Historical Odds API endpoint."""
+"""Models for the Historical Odds API endpoint.
 
-from datetime import datetime, timezone
-from typing import Annotated, Optional
+Each model comes in an eager and a lazy (epoch-millisecond) variant. Both
+inherit every field they share from one private base, so the two cannot
+drift apart; only the timestamped and nested fields are declared twice.
+"""
 
-from pydantic import BaseModel, BeforeValidator, Field
+from datetime import datetime
+from typing import Optional
 
-from .base import Selection
+from pydantic import BaseModel, Field
 
+from .base import LazyTimestampModel, PricedModel, Selection, TimestampMs
 
-def _ms_to_datetime(v: int | datetime) -> datetime:
-    """Convert millisecond timestamp to UTC datetime."""
-    if isinstance(v, datetime):
-        return v
-    return datetime.fromtimestamp(v / 1000, tz=timezone.utc)
-
-
-# Type alias for millisecond timestamps that become datetimes
-TimestampMs = Annotated[datetime, BeforeValidator(_ms_to_datetime)]
-
-
-class PricePoint(BaseModel):
-    """A price at a specific timestamp (CLV/OLV)."""
 
+class _PricePointFields(PricedModel):
     price: str = Field(description="The odds price")
-    timestamp: TimestampMs = Field(description="Timestamp of the price")
-
 
-class TimeSeriesEntry(BaseModel):
-    """An entry in the line movement history."""
 
+class _TimeSeriesEntryFields(PricedModel):
     price: Optional[str] = Field(
         default=None, description="The odds price at this time"
     )
     locked: bool = Field(description="Whether the odds were locked/suspended")
-    timestamp: TimestampMs = Field(description="Timestamp of the update")
 
 
-class HistoricalResponse(BaseModel):
-    """Response from the Historical Odds API endpoint."""
-
+class _HistoricalFields(BaseModel):
     updated: datetime = Field(description="Response generation timestamp")
     id: str = Field(description="The odds ID")
     market: str = Field(description="Market name")
@@ -46,8 +32,47 @@ class HistoricalResponse(BaseModel):
     selection: Optional[Selection] = Field(
         default=None, description="Parsed selection details"
     )
+
+
+class PricePoint(_PricePointFields):
+    """A price at a specific timestamp (CLV/OLV)."""
+
+    timestamp: TimestampMs = Field(description="Timestamp of the price")
+
+
+class TimeSeriesEntry(_TimeSeriesEntryFields):
+    """An entry in the line movement history."""
+
+    timestamp: TimestampMs = Field(description="Timestamp of the update")
+
+
+class HistoricalResponse(_HistoricalFields):
+    """Response from the Historical Odds API endpoint."""
+
     olv: Optional[PricePoint] = Field(default=None, description="Opening Line Value")
     clv: Optional[PricePoint] = Field(default=None, description="Closing Line Value")
     entries: list[TimeSeriesEntry] = Field(
         default=[], description="Line movement history"
     )
+
+
+class LazyPricePoint(LazyTimestampModel, _PricePointFields):
+    """A CLV/OLV price whose timestamp stays in epoch milliseconds."""
+
+
+class LazyTimeSeriesEntry(LazyTimestampModel, _TimeSeriesEntryFields):
+    """A line movement entry whose timestamp stays in epoch milliseconds."""
+
+
+class LazyHistoricalResponse(_HistoricalFields):
+    """Historical Odds API response that builds timestamps on first access."""
+
+    olv: Optional[LazyPricePoint] = Field(
+        default=None, description="Opening Line Value"
+    )
+    clv: Optional[LazyPricePoint] = Field(
+        default=None, description="Closing Line Value"
+    )
+    entries: list[LazyTimeSeriesEntry] = Field(
+        default=[], description="Line movement history"
+    )
@@ -1,14 +1,31 @@
 """Models for the Odds API endpoint."""
 
 from datetime import datetime
-from typing import Optional
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, ClassVar, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
-from .base import League, Links, Player, Selection, Sportsbook, Teams
+from ..settings import PriceFormat
+from .base import (
+    PRICE_FORMAT,
+    League,
+    Links,
+    Player,
+    PricedModel,
+    Selection,
+    Sportsbook,
+    Teams,
+    price_format_context,
+)
 
+if TYPE_CHECKING:
+    import numpy
+    import pandas
+    import pyarrow
 
-class Odd(BaseModel):
+
+class Odd(PricedModel):
     """Individual odds line."""
 
     id: str = Field(description="Unique odds identifier")
@@ -46,3 +63,67 @@ class OddsResponse(BaseModel):
     league: League = Field(description="League information")
     sportsbook: Sportsbook = Field(description="Sportsbook information")
     events: list[Event] = Field(default=[], description="List of events with odds")
+
+    def to_numpy(self) -> "dict[str, numpy.ndarray]":
+        """One row per odds line as a dict of NumPy columns (see `OddsColumns`)."""
+        from ..columnar import odds_columns
+
+        return odds_columns(self).to_numpy()
+
+    def to_records(self) -> "numpy.recarray":
+        """One row per odds line as a NumPy record array."""
+        from ..columnar import odds_columns
+
+        return odds_columns(self).to_records()
+
+    def to_arrow(self) -> "pyarrow.Table":
+        """One row per odds line as a pyarrow Table with dictionary columns."""
+        from ..columnar import odds_columns
+
+        return odds_columns(self).to_arrow()
+
+    def to_pandas(self) -> "pandas.DataFrame":
+        """One row per odds line as a pandas DataFrame with categorical columns."""
+        from ..columnar import odds_columns
+
+        return odds_columns(self).to_pandas()
+
+
+_ODDS_ADAPTER = TypeAdapter(list[Odd])
+
+
+class LazyEvent(BaseModel):
+    """A sporting event whose odds are validated on first access."""
+
+    id: str = Field(description="Unique event identifier")
+    teams: Teams = Field(description="Participating teams")
+    date: datetime = Field(description="Event start time (UTC)")
+    live: bool = Field(description="Whether the event is currently live")
+    raw_odds: list[Any] = Field(
+        default=[], alias="odds", repr=False, description="Unvalidated odds"
+    )
+    # Tagged like priced models so deferred odds are tagged too.
+    _price_format: ClassVar[Optional[PriceFormat]] = None
+
+    def model_post_init(self, context: Any, /) -> None:
+        # Tag prices read through `price_format_context`.
+        if context and context.get(PRICE_FORMAT) is not None:
+            self.__dict__["_price_format"] = context[PRICE_FORMAT]
+
+    @cached_property
+    def odds(self) -> list[Odd]:
+        """Odds for this event, validated the first time they are read."""
+        return _ODDS_ADAPTER.validate_python(
+            self.raw_odds, context=price_format_context(self._price_format)
+        )
+
+
+class LazyOddsResponse(BaseModel):
+    """Odds API response that defers validating each event's odds."""
+
+    updated: datetime = Field(description="Response generation timestamp")
+    league: League = Field(description="League information")
+    sportsbook: Sportsbook = Field(description="Sportsbook information")
+    events: list[LazyEvent] = Field(
+        default=[], description="List of events with lazily validated odds"
+    )
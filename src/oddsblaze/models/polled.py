@@ -1,44 +1,69 @@
-"""Models for the Last Polled API endpoint."""
+"""Models for the Last Polled API endpoint.
 
-from datetime import datetime, timezone
-from typing import Annotated
+Each model comes in an eager and a lazy (epoch-millisecond) variant. Both
+inherit every field they share from one private base, so the two cannot
+drift apart; only the timestamped and nested fields are declared twice.
+"""
 
-from pydantic import BaseModel, BeforeValidator, Field
+from datetime import datetime
 
+from pydantic import BaseModel, Field
 
-def _ms_to_datetime(v: int | datetime) -> datetime:
-    """Convert millisecond timestamp to UTC datetime."""
-    if isinstance(v, datetime):
-        return v
-    return datetime.fromtimestamp(v / 1000, tz=timezone.utc)
+from .base import LazyTimestampModel, TimestampMs
 
 
-TimestampMs = Annotated[datetime, BeforeValidator(_ms_to_datetime)]
+class _PolledSportsbookFields(BaseModel):
+    id: str = Field(description="Sportsbook identifier")
+    name: str = Field(description="Sportsbook name")
+    last: int = Field(description="Seconds elapsed since last poll")
+
+
+class _PolledLeagueFields(BaseModel):
+    id: str = Field(description="League identifier")
+    name: str = Field(description="League name")
 
 
-class PolledSportsbook(BaseModel):
+class _PolledResponseFields(BaseModel):
+    updated: datetime = Field(description="Response generation timestamp")
+
+
+class PolledSportsbook(_PolledSportsbookFields):
     """A sportsbook's last polled status."""
 
-    id: str = Field(description="Sportsbook identifier")
-    name: str = Field(description="Sportsbook name")
     timestamp: TimestampMs = Field(description="Last poll timestamp")
-    last: int = Field(description="Seconds elapsed since last poll")
 
 
-class PolledLeague(BaseModel):
+class PolledLeague(_PolledLeagueFields):
     """A league with polled sportsbooks."""
 
-    id: str = Field(description="League identifier")
-    name: str = Field(description="League name")
     sportsbooks: list[PolledSportsbook] = Field(
         default=[], description="Poll status per sportsbook"
     )
 
 
-class PolledResponse(BaseModel):
+class PolledResponse(_PolledResponseFields):
     """Response from the Last Polled API endpoint."""
 
-    updated: datetime = Field(description="Response generation timestamp")
     leagues: list[PolledLeague] = Field(
         default=[], description="List of leagues and poll statuses"
     )
+
+
+class LazyPolledSportsbook(LazyTimestampModel, _PolledSportsbookFields):
+    """A sportsbook's last polled status whose timestamp stays in epoch ms."""
+
+
+class LazyPolledLeague(_PolledLeagueFields):
+    """A league whose sportsbook poll timestamps are built lazily."""
+
+    sportsbooks: list[LazyPolledSportsbook] = Field(
+        default=[], description="Poll status per sportsbook"
+    )
+
+
+class LazyPolledResponse(_PolledResponseFields):
+    """Last Polled API response that builds timestamps on first access."""
+
+    leagues: list[LazyPolledLeague] = Field(
+        default=[], description="List of leagues and poll statuses"
+    )
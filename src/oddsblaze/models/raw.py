@@ -0,0 +1,123 @@
+"""Typed views of unvalidated API payloads.
+
+Returned by `get_odds(..., validate=False)` and read by
+`get_historical_many`. These are the plain dicts decoded from the response
+JSON: nothing is coerced, so timestamps stay as sent (ISO 8601 strings, or
+epoch milliseconds in historical odds) and prices stay strings in the
+requested format. Keys declared on the required classes below are always
+present on a successful response; keys on the `total=False` bases may be
+missing or null.
+"""
+
+from typing import Optional, TypedDict
+
+
+class RawLeague(TypedDict):
+    """League information."""
+
+    id: str
+    name: str
+    sport: str
+
+
+class _RawSportsbookOptional(TypedDict, total=False):
+    sgp: Optional[bool]
+
+
+class RawSportsbook(_RawSportsbookOptional):
+    """Sportsbook information."""
+
+    id: str
+    name: str
+
+
+class _RawTeamOptional(TypedDict, total=False):
+    abbreviation: Optional[str]
+
+
+class RawTeam(_RawTeamOptional):
+    """A team."""
+
+    id: str
+    name: str
+
+
+class RawTeams(TypedDict):
+    """Away and home teams for an event."""
+
+    away: RawTeam
+    home: RawTeam
+
+
+class _RawOddOptional(TypedDict, total=False):
+    main: Optional[bool]
+    links: Optional[dict[str, Optional[str]]]
+    sgp: Optional[str]
+    selection: Optional[dict[str, object]]
+    player: Optional[dict[str, object]]
+    updated: Optional[str]
+
+
+class RawOdd(_RawOddOptional):
+    """An odds line. `id`, `market`, `name` and `price` are guaranteed."""
+
+    id: str
+    market: str
+    name: str
+    price: str
+
+
+class _RawEventOptional(TypedDict, total=False):
+    odds: list[RawOdd]
+
+
+class RawEvent(_RawEventOptional):
+    """An event with its odds lines."""
+
+    id: str
+    teams: RawTeams
+    date: str
+    live: bool
+
+
+class _RawOddsResponseOptional(TypedDict, total=False):
+    events: list[RawEvent]
+
+
+class RawOddsResponse(_RawOddsResponseOptional):
+    """Unvalidated response from the Odds API endpoint."""
+
+    updated: str
+    league: RawLeague
+    sportsbook: RawSportsbook
+
+
+class RawPricePoint(TypedDict):
+    """A price at a timestamp (epoch milliseconds)."""
+
+    price: str
+    timestamp: int
+
+
+class RawTimeSeriesEntry(TypedDict):
+    """An entry in the line movement history."""
+
+    price: Optional[str]
+    locked: bool
+    timestamp: int
+
+
+class _RawHistoricalOptional(TypedDict, total=False):
+    selection: Optional[dict[str, object]]
+    olv: Optional[RawPricePoint]
+    clv: Optional[RawPricePoint]
+    entries: list[RawTimeSeriesEntry]
+
+
+class RawHistoricalResponse(_RawHistoricalOptional):
+    """Unvalidated response from the Historical Odds API endpoint."""
+
+    updated: str
+    id: str
+    market: str
+    name: str
@@ -0,0 +1,165 @@
+"""Polling engines that refetch odds only when upstream data has moved."""
+
+import asyncio
+import time
+from datetime import datetime
+from typing import AsyncIterator, Iterable, Iterator, Optional
+
+from .async_client import AsyncOddsblazeClient
+from .bulk import OddsResult
+from .client import OddsblazeClient
+from .models import PolledResponse
+from .settings import PriceFormat
+
+Pair = tuple[str, str]
+
+
+class _PollingState:
+    """Bookkeeping shared by the sync and async engines."""
+
+    def __init__(self, pairs: Iterable[Pair]):
+        self.pairs: list[Pair] = list(dict.fromkeys(pairs))
+        self.leagues = sorted({league for _, league in self.pairs})
+        self.sportsbooks = sorted({sportsbook for sportsbook, _ in self.pairs})
+        # Upstream poll time of the data behind our latest board, per pair.
+        self.fetched: dict[Pair, datetime] = {}
+        self.checks = 0
+        self.fetches = 0
+        self.skipped = 0
+
+    def stale(self, polled: PolledResponse) -> dict[Pair, Optional[datetime]]:
+        """Pairs whose upstream poll is newer than our last fetch."""
+        wanted = set(self.pairs)
+        latest: dict[Pair, datetime] = {}
+        for league in polled.leagues:
+            for sportsbook in league.sportsbooks:
+                pair = (sportsbook.id, league.id)
+                if pair in wanted:
+                    latest[pair] = sportsbook.timestamp
+
+        stale: dict[Pair, Optional[datetime]] = {}
+        for pair in self.pairs:
+            seen = self.fetched.get(pair)
+            upstream = latest.get(pair)
+            # Never fetched, or upstream unknown: fetch to be safe.
+            if seen is None or upstream is None or upstream > seen:
+                stale[pair] = upstream
+        self.checks += 1
+        self.skipped += len(self.pairs) - len(stale)
+        return stale
+
+    def record(self, result: OddsResult, upstream: Optional[datetime]) -> None:
+        """Remember the upstream time of a successful fetch."""
+        self.fetches += 1
+        if result.ok and upstream is not None:
+            self.fetched[(result.sportsbook, result.league)] = upstream
+
+
+class PollingEngine:
+    """
+    Refetch (sportsbook, league) boards only when upstream has polled them.
+
+    Each cycle makes one cheap `get_last_polled(group=True)` call and compares
+    every pair's upstream poll timestamp with the one behind our latest board.
+    Only pairs that have advanced (or never been fetched) go to `get_odds`.
+    Failed fetches are retried on the next cycle.
+
+    Args:
+        client: Client to poll with
+        pairs: (sportsbook, league) pairs to keep fresh
+        concurrency: Maximum odds requests in flight per cycle
+        price: Price format (defaults to settings)
+    """
+
+    def __init__(
+        self,
+        client: OddsblazeClient,
+        pairs: Iterable[Pair],
+        *,
+        concurrency: int = 10,
+        price: Optional[PriceFormat] = None,
+    ):
+        self.client = client
+        self.concurrency = concurrency
+        self.price = price
+        self.state = _PollingState(pairs)
+
+    def stale_pairs(self) -> dict[Pair, Optional[datetime]]:
+        """Pairs that need refetching, with their upstream poll time."""
+        polled = self.client.get_last_polled(
+            league=self.state.leagues, sportsbook=self.state.sportsbooks, group=True
+        )
+        return self.state.stale(polled)
+
+    def poll(self) -> list[OddsResult]:
+        """Run one cycle and return the boards that were refetched."""
+        stale = self.stale_pairs()
+        results = []
+        for result in self.client.get_odds_many(
+            stale, concurrency=self.concurrency, price=self.price
+        ):
+            self.state.record(result, stale[(result.sportsbook, result.league)])
+            results.append(result)
+        return results
+
+    def run(self, interval: float = 1.0) -> Iterator[list[OddsResult]]:
+        """Poll forever, yielding each non-empty batch of refetched boards."""
+        while True:
+            started = time.monotonic()
+            results = self.poll()
+            if results:
+                yield results
+            time.sleep(max(interval - (time.monotonic() - started), 0.0))
+
+
+class AsyncPollingEngine:
+    """
+    Async version of `PollingEngine`.
+
+    Args:
+        client: Client to poll with
+        pairs: (sportsbook, league) pairs to keep fresh
+        concurrency: Maximum odds requests in flight per cycle
+        price: Price format (defaults to settings)
+    """
+
+    def __init__(
+        self,
+        client: AsyncOddsblazeClient,
+        pairs: Iterable[Pair],
+        *,
+        concurrency: int = 10,
+        price: Optional[PriceFormat] = None,
+    ):
+        self.client = client
+        self.concurrency = concurrency
+        self.price = price
+        self.state = _PollingState(pairs)
+
+    async def stale_pairs(self) -> dict[Pair, Optional[datetime]]:
+        """Pairs that need refetching, with their upstream poll time."""
+        polled = await self.client.get_last_polled(
+            league=self.state.leagues, sportsbook=self.state.sportsbooks, group=True
+        )
+        return self.state.stale(polled)
+
+    async def poll(self) -> list[OddsResult]:
+        """Run one cycle and return the boards that were refetched."""
+        stale = await self.stale_pairs()
+        results = []
+        async for result in self.client.get_odds_many(
+            stale, concurrency=self.concurrency, price=self.price
+        ):
+            self.state.record(result, stale[(result.sportsbook, result.league)])
+            results.append(result)
+        return results
+
+    async def run(self, interval: float = 1.0) -> AsyncIterator[list[OddsResult]]:
+        """Poll forever, yielding each non-empty batch of refetched boards."""
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            results = await self.poll()
+            if results:
+                yield results
+            await asyncio.sleep(max(interval - (loop.time() - started), 0.0))
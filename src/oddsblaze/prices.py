@@ -0,0 +1,149 @@
+"""Parsing of the price strings returned by the API."""
+
+import math
+from fractions import Fraction
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+from .settings import PriceFormat
+
+
+def parse_price(text: str) -> float:
+    """
+    Read a price string as a number in its own format.
+
+    American prices keep their sign (`"+150"` -> 150.0, `"EVEN"` -> 100.0),
+    fractional prices become their ratio (`"5/2"` -> 2.5) and probabilities
+    written as percentages become fractions (`"40%"` -> 0.4). Anything that
+    cannot be read gives NaN.
+    """
+    text = text.strip()
+    try:
+        if "/" in text:
+            num, den = text.split("/", 1)
+            return float(num) / float(den)
+        if text.endswith("%"):
+            return float(text[:-1]) / 100
+        if text.upper() == "EVEN":
+            return 100.0
+        return float(text)
+    except (ValueError, ZeroDivisionError):
+        return math.nan
+
+
+def to_decimal(text: str, price_format: PriceFormat = PriceFormat.AMERICAN) -> float:
+    """
+    Convert a price string in `price_format` to decimal odds.
+
+    Decimal odds rise with the payout in every format, so they rank prices
+    from different books. Unreadable prices give NaN.
+
+    Args:
+        text: Price as returned by the API
+        price_format: Format the price is written in
+    """
+    value = parse_price(text)
+    if math.isnan(value):
+        return value
+    if price_format is PriceFormat.AMERICAN:
+        if value == 0:
+            return math.nan
+        return 1 + value / 100 if value > 0 else 1 - 100 / value
+    if price_format is PriceFormat.DECIMAL:
+        return value
+    if price_format in (PriceFormat.FRACTIONAL, PriceFormat.HONG_KONG):
+        return 1 + value
+    if price_format is PriceFormat.PROBABILITY:
+        probability = value / 100 if value > 1 else value
+        return 1 / probability if probability > 0 else math.nan
+    # Malaysian and Indonesian: negative prices are the stake to win one unit.
+    if value == 0:
+        return math.nan
+    return 1 + value if value > 0 else 1 - 1 / value
+
+
+def format_price(
+    decimal: float, price_format: PriceFormat = PriceFormat.AMERICAN
+) -> str:
+    """
+    Write decimal odds as a price string in `price_format`.
+
+    The inverse of `to_decimal`, rounded the way the API writes prices
+    (whole American points, two decimal places elsewhere). NaN or odds that
+    do not pay out give an empty string.
+
+    Args:
+        decimal: Decimal odds (greater than 1)
+        price_format: Format to write
+    """
+    if not decimal > 1 or math.isinf(decimal):
+        return ""
+    profit = decimal - 1
+    if price_format is PriceFormat.AMERICAN:
+        if profit >= 1:
+            return f"+{round(profit * 100)}"
+        return f"-{round(100 / profit)}"
+    if price_format is PriceFormat.DECIMAL:
+        return f"{decimal:.2f}"
+    if price_format is PriceFormat.FRACTIONAL:
+        ratio = Fraction(profit).limit_denominator(100)
+        return f"{ratio.numerator}/{ratio.denominator}"
+    if price_format is PriceFormat.PROBABILITY:
+        return f"{100 / decimal:.1f}%"
+    if price_format is PriceFormat.HONG_KONG:
+        return f"{profit:.2f}"
+    if price_format is PriceFormat.MALAYSIAN:
+        return f"{profit:.2f}" if profit <= 1 else f"{-1 / profit:.2f}"
+    # Indonesian
+    return f"{profit:.2f}" if profit >= 1 else f"{-1 / profit:.2f}"
+
+
+def convert_price(
+    text: str, source: PriceFormat, target: PriceFormat = PriceFormat.AMERICAN
+) -> str:
+    """
+    Rewrite a price string from one format in another.
+
+    Args:
+        text: Price as returned by the API
+        source: Format `text` is written in
+        target: Format to write
+    """
+    if source is target:
+        return text
+    return format_price(to_decimal(text, source), target)
+
+
+class PriceNumbers(NamedTuple):
+    """A price string read as numbers."""
+
+    decimal: float
+    american: float
+    implied_probability: float
+
+
+_NAN_NUMBERS = PriceNumbers(math.nan, math.nan, math.nan)
+
+
+@lru_cache(maxsize=4096)
+def price_numbers(
+    text: Optional[str], price_format: PriceFormat = PriceFormat.AMERICAN
+) -> PriceNumbers:
+    """
+    Decimal odds, American odds and implied probability of a price string.
+
+    Memoized: a board repeats a few hundred distinct prices, so nearly every
+    call is a table hit. Missing or unreadable prices give NaN.
+
+    Args:
+        text: Price as returned by the API
+        price_format: Format `text` is written in
+    """
+    if text is None:
+        return _NAN_NUMBERS
+    decimal = to_decimal(text, price_format)
+    if math.isnan(decimal):
+        return _NAN_NUMBERS
+    profit = decimal - 1
+    american = profit * 100 if profit >= 1 else -100 / profit
+    return PriceNumbers(decimal, american, 1 / decimal)
@@ -0,0 +1,57 @@
+"""Client-side token-bucket rate limiting."""
+
+import threading
+import time
+from typing import Optional
+
+
+class RateLimiter:
+    """
+    Token bucket that spaces requests to a sustained rate.
+
+    Each request takes one token; tokens refill at `rate` per second up to
+    `burst`. When the bucket is empty a request reserves the next token and
+    is told how long to wait for it, so concurrent callers are released in
+    order, exactly `1 / rate` apart, with no polling. One limiter is safe to
+    share between threads, event loops and clients.
+
+    Args:
+        rate: Sustained requests per second
+        burst: Requests allowed back to back after an idle period
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst or 1
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take a token and return the seconds to wait before using it."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def try_acquire(self) -> bool:
+        """Take a token only if one is available right now."""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for `seconds` (e.g. after a 429 Retry-After)."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, 1 - seconds * self.rate)
@@ -0,0 +1,81 @@
+"""Retry policy with jittered exponential backoff."""
+
+import random
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import httpx
+
+# Statuses worth retrying: throttled, or a transient server-side failure.
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Transport failures worth retrying. Every API call is an idempotent GET.
+RETRY_EXCEPTIONS: tuple[type[Exception], ...] = (
+    httpx.TimeoutException,
+    httpx.NetworkError,
+    httpx.RemoteProtocolError,
+)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a `Retry-After` header (seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    When and how long to wait before retrying a failed request.
+
+    Retry `n` (counting from 0) waits a random time between 0 and
+    `min(max_backoff, backoff * 2**n)` ("full jitter"), so clients that
+    failed together do not retry together. A `Retry-After` header replaces
+    the backoff; if it asks for longer than `max_retry_after` the request
+    fails instead of retrying early.
+
+    Args:
+        retries: Retries after the first attempt
+        backoff: Base delay in seconds
+        max_backoff: Upper bound on a backoff delay in seconds
+        max_retry_after: Longest `Retry-After` to honor, in seconds
+        statuses: Response statuses to retry
+        exceptions: Transport errors to retry
+    """
+
+    retries: int = 3
+    backoff: float = 0.5
+    max_backoff: float = 30.0
+    max_retry_after: float = 60.0
+    statuses: frozenset[int] = RETRY_STATUSES
+    exceptions: tuple[type[Exception], ...] = RETRY_EXCEPTIONS
+
+    def delay(
+        self, attempt: int, response: Optional[httpx.Response] = None
+    ) -> Optional[float]:
+        """
+        Seconds to wait before retrying, or None to give up.
+
+        Args:
+            attempt: Retries made so far
+            response: The failed response (None after a transport error)
+        """
+        if attempt >= self.retries:
+            return None
+        if response is not None:
+            if response.status_code not in self.statuses:
+                return None
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return retry_after if retry_after <= self.max_retry_after else None
+        return random.uniform(0.0, min(self.max_backoff, self.backoff * 2**attempt))
@@ -0,0 +1,332 @@
+"""Adaptive refresh scheduling of odds boards under a request budget."""
+
+import asyncio
+import math
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import AsyncIterator, Iterable, Iterator, Optional
+
+from .async_client import AsyncOddsblazeClient
+from .bulk import OddsResult
+from .client import OddsblazeClient
+from .diff import Changed, OddsDiffer
+from .models import PolledResponse
+from .polling import Pair
+from .ratelimit import RateLimiter
+from .settings import PriceFormat
+
+# Weight of the latest sample in the change-rate and staleness averages.
+_EWMA_ALPHA = 0.3
+
+
+@dataclass(slots=True)
+class PairStats:
+    """What the scheduler knows about one (sportsbook, league) pair."""
+
+    live: bool = False
+    # Price changes per minute between our refreshes (moving average).
+    change_rate: float = 0.0
+    # Seconds since upstream last polled the pair (None if not reported).
+    last: Optional[int] = None
+    # Target seconds between refreshes under the current budget split.
+    interval: float = math.inf
+    fetches: int = 0
+    fetched_at: Optional[float] = None
+    fetched_upstream: Optional[datetime] = None
+    # Upstream poll time first seen newer than our board (or first reported
+    # after a fetch upstream did not report on), while stale.
+    stale_since: Optional[datetime] = None
+    # Seconds our board lagged upstream when refreshed (moving average).
+    staleness: float = 0.0
+    max_staleness: float = 0.0
+
+
+class _SchedulerState:
+    """Budget split and bookkeeping shared by the sync and async schedulers."""
+
+    def __init__(
+        self,
+        pairs: Iterable[Pair],
+        budget: float,
+        tick: float,
+        live_weight: float,
+        idle_after: float,
+        min_interval: float,
+    ):
+        self.pairs: list[Pair] = list(dict.fromkeys(pairs))
+        self.leagues = sorted({league for _, league in self.pairs})
+        self.sportsbooks = sorted({sportsbook for sportsbook, _ in self.pairs})
+        self.stats = {pair: PairStats() for pair in self.pairs}
+        self.limiter = RateLimiter(budget, burst=max(1, math.ceil(budget * tick)))
+        # One `get_last_polled` per cycle comes out of the budget first.
+        self.odds_budget = max(budget - 1 / tick, 0.0)
+        self.live_weight = live_weight
+        self.idle_after = idle_after
+        self.min_interval = min_interval
+        self.differ = OddsDiffer()
+
+    def weight(self, stats: PairStats) -> float:
+        """Share of the budget a pair deserves relative to the others."""
+        weight = self.live_weight if stats.live else 1.0
+        weight *= 1.0 + math.log1p(stats.change_rate)
+        if stats.last is not None:
+            # Upstream has not polled this board for a while: it is quiet.
+            weight /= 1.0 + stats.last / self.idle_after
+        return weight
+
+    def allocate(self) -> None:
+        """Split the odds budget into a refresh interval per pair."""
+        weights = {pair: self.weight(stats) for pair, stats in self.stats.items()}
+        total = sum(weights.values())
+        for pair, stats in self.stats.items():
+            rate = self.odds_budget * weights[pair] / total if total else 0.0
+            stats.interval = max(1 / rate if rate else math.inf, self.min_interval)
+
+    def observe(self, polled: PolledResponse) -> None:
+        """Record upstream poll times and note pairs that fell behind."""
+        for stats in self.stats.values():
+            stats.last = None
+        for league in polled.leagues:
+            for sportsbook in league.sportsbooks:
+                stats = self.stats.get((sportsbook.id, league.id))
+                if stats is None:
+                    continue
+                stats.last = sportsbook.last
+                if stats.stale_since is not None or stats.fetched_at is None:
+                    continue
+                # Fetched while upstream did not report the pair: we cannot
+                # tell whether the board is current, so count it as stale.
+                seen = stats.fetched_upstream
+                if seen is None or sportsbook.timestamp > seen:
+                    stats.stale_since = sportsbook.timestamp
+        self.allocate()
+
+    def due(self) -> list[Pair]:
+        """Pairs to refresh now, most overdue first, within the budget."""
+        now = time.monotonic()
+        candidates = []
+        for pair, stats in self.stats.items():
+            if stats.fetched_at is None:
+                candidates.append((math.inf, pair))
+            elif stats.stale_since is not None or stats.last is None:
+                # Skip boards that cannot have changed since our refresh;
+                # ones upstream did not report on are refreshed to be safe.
+                overdue = (now - stats.fetched_at) / stats.interval
+                if overdue >= 1:
+                    candidates.append((overdue, pair))
+        candidates.sort(reverse=True)
+
+        due = []
+        for _, pair in candidates:
+            if not self.limiter.try_acquire():
+                break
+            due.append(pair)
+        return due
+
+    def record(self, result: OddsResult, upstream: Optional[datetime]) -> None:
+        """Update live status, change rate and staleness from a refresh."""
+        stats = self.stats[(result.sportsbook, result.league)]
+        if not result.ok or result.response is None:
+            return
+        now = time.monotonic()
+        response = result.response
+        changes = self.differ.diff(response)
+        if stats.fetched_at is not None:
+            moved = sum(
+                not isinstance(change, Changed) or change.price_moved
+                for change in changes
+            )
+            per_minute = moved * 60 / max(now - stats.fetched_at, 1e-3)
+            stats.change_rate += _EWMA_ALPHA * (per_minute - stats.change_rate)
+        if stats.stale_since is not None:
+            lag = (datetime.now(timezone.utc) - stats.stale_since).total_seconds()
+            lag = max(lag, 0.0)
+            stats.staleness += _EWMA_ALPHA * (lag - stats.staleness)
+            stats.max_staleness = max(stats.max_staleness, lag)
+        stats.live = any(event.live for event in response.events)
+        stats.fetches += 1
+        stats.fetched_at = now
+        stats.fetched_upstream = upstream
+        stats.stale_since = None
+
+    def staleness(self) -> dict[Pair, float]:
+        """Seconds each pair currently lags upstream (0 when up to date)."""
+        now = datetime.now(timezone.utc)
+        return {
+            pair: (
+                max((now - stats.stale_since).total_seconds(), 0.0)
+                if stats.stale_since is not None
+                else 0.0
+            )
+            for pair, stats in self.stats.items()
+        }
+
+
+class RefreshScheduler:
+    """
+    Refresh (sportsbook, league) boards at rates that follow the action.
+
+    A global `budget` of requests per second is split between pairs by
+    weight: live boards (`Event.live`) count `live_weight` times as much,
+    boards whose prices changed often recently count more, and boards that
+    upstream has not polled for a while (a large `last` from
+    `get_last_polled`) count less. Each cycle spends one request on
+    `get_last_polled` and refreshes the most overdue pairs whose upstream
+    data has moved, as far as the budget allows.
+
+    `staleness()` and the per-pair `stats` report how far each board lags
+    upstream, measured from the first upstream poll seen newer than it.
+
+    Args:
+        client: Client to poll with
+        pairs: (sportsbook, league) pairs to keep fresh
+        budget: Requests per second to spend, `get_last_polled` included
+        tick: Seconds between scheduling cycles
+        concurrency: Maximum odds requests in flight per cycle
+        price: Price format (defaults to settings)
+        live_weight: Budget weight of a live board relative to a pre-match one
+        idle_after: Seconds of upstream quiet (`last`) that halve a weight
+        min_interval: Never refresh a pair more often than this
+    """
+
+    def __init__(
+        self,
+        client: OddsblazeClient,
+        pairs: Iterable[Pair],
+        *,
+        budget: float,
+        tick: float = 1.0,
+        concurrency: int = 10,
+        price: Optional[PriceFormat] = None,
+        live_weight: float = 4.0,
+        idle_after: float = 60.0,
+        min_interval: float = 1.0,
+    ):
+        self.client = client
+        self.tick = tick
+        self.concurrency = concurrency
+        self.price = price
+        self.state = _SchedulerState(
+            pairs, budget, tick, live_weight, idle_after, min_interval
+        )
+
+    @property
+    def stats(self) -> dict[Pair, PairStats]:
+        """Per-pair rates, change history and staleness."""
+        return self.state.stats
+
+    def staleness(self) -> dict[Pair, float]:
+        """Seconds each pair currently lags upstream (0 when up to date)."""
+        return self.state.staleness()
+
+    def poll(self) -> list[OddsResult]:
+        """Run one cycle and return the boards that were refreshed."""
+        if not self.state.limiter.try_acquire():
+            return []
+        polled = self.client.get_last_polled(
+            league=self.state.leagues, sportsbook=self.state.sportsbooks, group=True
+        )
+        self.state.observe(polled)
+        upstream = _upstream_times(polled)
+        results = []
+        for result in self.client.get_odds_many(
+            self.state.due(), concurrency=self.concurrency, price=self.price
+        ):
+            pair = (result.sportsbook, result.league)
+            self.state.record(result, upstream.get(pair))
+            results.append(result)
+        return results
+
+    def run(self) -> Iterator[list[OddsResult]]:
+        """Schedule forever, yielding each non-empty batch of refreshed boards."""
+        while True:
+            started = time.monotonic()
+            results = self.poll()
+            if results:
+                yield results
+            time.sleep(max(self.tick - (time.monotonic() - started), 0.0))
+
+
+class AsyncRefreshScheduler:
+    """
+    Async version of `RefreshScheduler`.
+
+    Args:
+        client: Client to poll with
+        pairs: (sportsbook, league) pairs to keep fresh
+        budget: Requests per second to spend, `get_last_polled` included
+        tick: Seconds between scheduling cycles
+        concurrency: Maximum odds requests in flight per cycle
+        price: Price format (defaults to settings)
+        live_weight: Budget weight of a live board relative to a pre-match one
+        idle_after: Seconds of upstream quiet (`last`) that halve a weight
+        min_interval: Never refresh a pair more often than this
+    """
+
+    def __init__(
+        self,
+        client: AsyncOddsblazeClient,
+        pairs: Iterable[Pair],
+        *,
+        budget: float,
+        tick: float = 1.0,
+        concurrency: int = 10,
+        price: Optional[PriceFormat] = None,
+        live_weight: float = 4.0,
+        idle_after: float = 60.0,
+        min_interval: float = 1.0,
+    ):
+        self.client = client
+        self.tick = tick
+        self.concurrency = concurrency
+        self.price = price
+        self.state = _SchedulerState(
+            pairs, budget, tick, live_weight, idle_after, min_interval
+        )
+
+    @property
+    def stats(self) -> dict[Pair, PairStats]:
+        """Per-pair rates, change history and staleness."""
+        return self.state.stats
+
+    def staleness(self) -> dict[Pair, float]:
+        """Seconds each pair currently lags upstream (0 when up to date)."""
+        return self.state.staleness()
+
+    async def poll(self) -> list[OddsResult]:
+        """Run one cycle and return the boards that were refreshed."""
+        if not self.state.limiter.try_acquire():
+            return []
+        polled = await self.client.get_last_polled(
+            league=self.state.leagues, sportsbook=self.state.sportsbooks, group=True
+        )
+        self.state.observe(polled)
+        upstream = _upstream_times(polled)
+        results = []
+        async for result in self.client.get_odds_many(
+            self.state.due(), concurrency=self.concurrency, price=self.price
+        ):
+            pair = (result.sportsbook, result.league)
+            self.state.record(result, upstream.get(pair))
+            results.append(result)
+        return results
+
+    async def run(self) -> AsyncIterator[list[OddsResult]]:
+        """Schedule forever, yielding each non-empty batch of refreshed boards."""
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            results = await self.poll()
+            if results:
+                yield results
+            await asyncio.sleep(max(self.tick - (loop.time() - started), 0.0))
+
+
+def _upstream_times(polled: PolledResponse) -> dict[Pair, datetime]:
+    """Upstream poll time of every (sportsbook, league) in a polled response."""
+    return {
+        (sportsbook.id, league.id): sportsbook.timestamp
+        for league in polled.leagues
+        for sportsbook in league.sportsbooks
+    }
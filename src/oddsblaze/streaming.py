@@ -0,0 +1,111 @@
+"""Incremental parsing of streamed Odds API bodies."""
+
+import json
+import re
+from typing import Any
+
+from .exceptions import OddsblazeError, raise_for_error_message
+
+# Bytes that change parser state outside and inside JSON strings.
+_STRUCTURAL = re.compile(rb'["{}\[\]]')
+_STRING_END = re.compile(rb'["\\]')
+
+_OUTSIDE, _BETWEEN, _EVENT = 0, 1, 2
+
+
+class EventStreamParser:
+    """
+    Split an Odds API body into one JSON document per event as bytes arrive.
+
+    Only the structure of the body is tracked (nesting depth and string
+    boundaries), so each event is handed over as soon as its closing brace
+    is seen and never more than one event is buffered. Everything outside
+    the top-level `events` array is kept aside so the top-level fields (or
+    an API error message) can be read once the body ends.
+    """
+
+    def __init__(self) -> None:
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._key = bytearray()
+        self._mode = _OUTSIDE
+        self._event = bytearray()
+        self._rest = bytearray()
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """Consume the next chunk and return every event it completed."""
+        events: list[bytes] = []
+        pos = start = 0
+        end = len(chunk)
+
+        while pos < end:
+            if self._escape:
+                self._escape = False
+                pos += 1
+                continue
+
+            if self._in_string:
+                match = _STRING_END.search(chunk, pos)
+                stop = match.start() if match else end
+                if self._depth == 1:
+                    self._key += chunk[pos:stop]
+                if match is None:
+                    break
+                pos = match.end()
+                if match.group() == b"\\":
+                    self._escape = True
+                else:
+                    self._in_string = False
+                continue
+
+            match = _STRUCTURAL.search(chunk, pos)
+            if match is None:
+                break
+            char = match.group()
+            pos = match.end()
+
+            if char == b'"':
+                self._in_string = True
+                if self._depth == 1:
+                    self._key.clear()
+            elif char in b"{[":
+                if self._mode == _BETWEEN and char == b"{":
+                    start = match.start()
+                    self._mode = _EVENT
+                elif self._depth == 1 and char == b"[" and self._key == b"events":
+                    self._rest += chunk[start:pos]
+                    start = pos
+                    self._mode = _BETWEEN
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._mode == _EVENT and self._depth == 2:
+                    self._event += chunk[start:pos]
+                    events.append(bytes(self._event))
+                    self._event.clear()
+                    start = pos
+                    self._mode = _BETWEEN
+                elif self._mode == _BETWEEN and self._depth == 1:
+                    start = match.start()
+                    self._mode = _OUTSIDE
+
+        if self._mode == _OUTSIDE:
+            self._rest += chunk[start:]
+        elif self._mode == _EVENT:
+            self._event += chunk[start:]
+        return events
+
+    def close(self) -> dict[str, Any]:
+        """
+        Finish parsing and return the top-level fields (with empty `events`).
+
+        Raises the matching SDK exception if the body was an API error message.
+        """
+        if self._depth != 0 or self._in_string:
+            raise OddsblazeError("Odds response ended in the middle of a document")
+
+        data = json.loads(self._rest)
+        if isinstance(data, dict) and "message" in data and len(data) == 1:
+            raise_for_error_message(data["message"])
+        return data
@@ -0,0 +1,217 @@
+"""Tiered refresh of one odds board: hot events often, the rest rarely."""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Iterator, Optional
+
+from .async_client import AsyncOddsblazeClient
+from .client import OddsblazeClient
+from .models import Event, OddsResponse
+from .settings import PriceFormat
+
+
+def is_hot(event: Event, now: datetime, window: timedelta) -> bool:
+    """Whether an event is live or starts (or started) within `window` of now."""
+    return event.live or abs(event.date - now) <= window
+
+
+class _TieredState:
+    """Snapshot and refresh planning shared by the sync and async refreshers."""
+
+    def __init__(self, hot_interval: float, full_interval: float, window: timedelta):
+        self.hot_interval = hot_interval
+        self.full_interval = full_interval
+        self.window = window
+        self.snapshot: Optional[OddsResponse] = None
+        self.full_at = -float("inf")
+        self.hot_at = -float("inf")
+        self.full_refreshes = 0
+        self.hot_refreshes = 0
+
+    def plan(self) -> Optional[dict[str, Any]]:
+        """
+        Filters for the next fetch, or None if nothing is due.
+
+        Returns `{}` for a full board, `{"live": True}` when every hot event
+        is already live, or `{"event": [...]}` for live and starting events.
+        """
+        now = time.monotonic()
+        if self.snapshot is None or now - self.full_at >= self.full_interval:
+            return {}
+        if now - self.hot_at < self.hot_interval:
+            return None
+        wall = datetime.now(timezone.utc)
+        hot = [e for e in self.snapshot.events if is_hot(e, wall, self.window)]
+        if not hot:
+            return None
+        if all(event.live for event in hot):
+            return {"live": True}
+        return {"event": [event.id for event in hot]}
+
+    def merge(self, filters: dict[str, Any], response: OddsResponse) -> OddsResponse:
+        """Fold a full or partial board into a new snapshot and return it."""
+        now = time.monotonic()
+        if not filters or self.snapshot is None:
+            self.snapshot = response
+            self.full_at = self.hot_at = now
+            self.full_refreshes += 1
+            return response
+
+        # Requested events missing from the answer have closed or finished.
+        if filters.get("live"):
+            requested = {e.id for e in self.snapshot.events if e.live}
+        else:
+            requested = set(filters["event"])
+        fresh = {event.id: event for event in response.events}
+        events = [
+            fresh.pop(event.id, event)
+            for event in self.snapshot.events
+            if event.id in fresh or event.id not in requested
+        ]
+        events.extend(fresh.values())  # newly live, not on the last full board
+        self.snapshot = self.snapshot.model_copy(
+            update={"updated": response.updated, "events": events}
+        )
+        self.hot_at = now
+        self.hot_refreshes += 1
+        return self.snapshot
+
+
+class TieredRefresher:
+    """
+    Keep one (sportsbook, league) board fresh at two cadences.
+
+    Live events and events starting within `window` are refetched every
+    `hot_interval` seconds through the `event=` filter, or `live=True` when
+    all of them are live. The full board is refetched every `full_interval`
+    seconds to pick up new events and pre-match moves. Partial results are
+    merged into a new `OddsResponse` snapshot each time, so readers of an
+    older snapshot never see it change under them.
+
+    Args:
+        client: Client to fetch with
+        sportsbook: Sportsbook ID (e.g., "draftkings")
+        league: League ID (e.g., "nfl")
+        hot_interval: Seconds between refreshes of live and starting events
+        full_interval: Seconds between full board refreshes
+        window: How close to its start time an event counts as hot
+        market: Market ID(s) or name(s) to filter
+        price: Price format (defaults to settings)
+        main: True for main lines only, False for alternates only
+    """
+
+    def __init__(
+        self,
+        client: OddsblazeClient,
+        sportsbook: str,
+        league: str,
+        *,
+        hot_interval: float = 2.0,
+        full_interval: float = 60.0,
+        window: timedelta = timedelta(minutes=15),
+        market: Optional[str | list[str]] = None,
+        price: Optional[PriceFormat] = None,
+        main: Optional[bool] = None,
+    ):
+        self.client = client
+        self.sportsbook = sportsbook
+        self.league = league
+        self.market = market
+        self.price = price
+        self.main = main
+        self.state = _TieredState(hot_interval, full_interval, window)
+
+    @property
+    def snapshot(self) -> Optional[OddsResponse]:
+        """The latest merged board, or None before the first refresh."""
+        return self.state.snapshot
+
+    def refresh(self) -> Optional[OddsResponse]:
+        """Fetch whatever is due and return the new snapshot, or None."""
+        filters = self.state.plan()
+        if filters is None:
+            return None
+        response = self.client.get_odds(
+            self.sportsbook,
+            self.league,
+            market=self.market,
+            price=self.price,
+            main=self.main,
+            **filters,
+        )
+        return self.state.merge(filters, response)
+
+    def run(self) -> Iterator[OddsResponse]:
+        """Refresh forever, yielding each new snapshot."""
+        while True:
+            snapshot = self.refresh()
+            if snapshot is not None:
+                yield snapshot
+            time.sleep(self.state.hot_interval)
+
+
+class AsyncTieredRefresher:
+    """
+    Async version of `TieredRefresher`.
+
+    Args:
+        client: Client to fetch with
+        sportsbook: Sportsbook ID (e.g., "draftkings")
+        league: League ID (e.g., "nfl")
+        hot_interval: Seconds between refreshes of live and starting events
+        full_interval: Seconds between full board refreshes
+        window: How close to its start time an event counts as hot
+        market: Market ID(s) or name(s) to filter
+        price: Price format (defaults to settings)
+        main: True for main lines only, False for alternates only
+    """
+
+    def __init__(
+        self,
+        client: AsyncOddsblazeClient,
+        sportsbook: str,
+        league: str,
+        *,
+        hot_interval: float = 2.0,
+        full_interval: float = 60.0,
+        window: timedelta = timedelta(minutes=15),
+        market: Optional[str | list[str]] = None,
+        price: Optional[PriceFormat] = None,
+        main: Optional[bool] = None,
+    ):
+        self.client = client
+        self.sportsbook = sportsbook
+        self.league = league
+        self.market = market
+        self.price = price
+        self.main = main
+        self.state = _TieredState(hot_interval, full_interval, window)
+
+    @property
+    def snapshot(self) -> Optional[OddsResponse]:
+        """The latest merged board, or None before the first refresh."""
+        return self.state.snapshot
+
+    async def refresh(self) -> Optional[OddsResponse]:
+        """Fetch whatever is due and return the new snapshot, or None."""
+        filters = self.state.plan()
+        if filters is None:
+            return None
+        response = await self.client.get_odds(
+            self.sportsbook,
+            self.league,
+            market=self.market,
+            price=self.price,
+            main=self.main,
+            **filters,
+        )
+        return self.state.merge(filters, response)
+
+    async def run(self) -> AsyncIterator[OddsResponse]:
+        """Refresh forever, yielding each new snapshot."""
+        while True:
+            snapshot = await self.refresh()
+            if snapshot is not None:
+                yield snapshot
+            await asyncio.sleep(self.state.hot_interval)
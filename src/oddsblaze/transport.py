@@ -0,0 +1,54 @@
+"""Connection pool configuration for the OddsBlaze API hosts."""
+
+from typing import Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+# Polling clients revisit every host every few seconds, so keep idle
+# connections around far longer than httpx's 5 second default.
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=20,
+    max_keepalive_connections=20,
+    keepalive_expiry=60.0,
+)
+
+
+def host_of(url: str) -> str:
+    """Reduce a URL to the `scheme://host[:port]` form used for pool mounts."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def build_mounts(
+    urls: list[str],
+    *,
+    limits: Optional[httpx.Limits] = None,
+    host_limits: Optional[dict[str, httpx.Limits]] = None,
+    http2: bool = False,
+) -> dict[str, httpx.HTTPTransport]:
+    """Build one sync transport (and so one connection pool) per API host."""
+    overrides = {host_of(k): v for k, v in (host_limits or {}).items()}
+    return {
+        host: httpx.HTTPTransport(
+            limits=overrides.get(host, limits or DEFAULT_LIMITS), http2=http2
+        )
+        for host in dict.fromkeys(host_of(url) for url in urls)
+    }
+
+
+def build_async_mounts(
+    urls: list[str],
+    *,
+    limits: Optional[httpx.Limits] = None,
+    host_limits: Optional[dict[str, httpx.Limits]] = None,
+    http2: bool = False,
+) -> dict[str, httpx.AsyncHTTPTransport]:
+    """Build one async transport (and so one connection pool) per API host."""
+    overrides = {host_of(k): v for k, v in (host_limits or {}).items()}
+    return {
+        host: httpx.AsyncHTTPTransport(
+            limits=overrides.get(host, limits or DEFAULT_LIMITS), http2=http2
+        )
+        for host in dict.fromkeys(host_of(url) for url in urls)
+    }
@@ -1,10 +1,15 @@
 """Shared pytest fixtures."""
 
+from pathlib import Path
+from typing import Callable
+
 import pytest
 
 from oddsblaze import OddsblazeClient
 from oddsblaze.settings import OddsblazeSettings
 
+FIXTURES = Path(__file__).parent / "fixtures"
+
 
 @pytest.fixture
 def client() -> OddsblazeClient:
@@ -58,3 +63,22 @@ def active_league(client: OddsblazeClient) -> str:
 
     # Return the first league with active markets
     return response.leagues[0].id
+
+
+@pytest.fixture
+def offline_settings() -> OddsblazeSettings:
+    """Settings with a placeholder API key for tests using a mock transport."""
+    return OddsblazeSettings.model_construct(
+        api_key="test-key",
+        price_format=OddsblazeSettings.model_fields["price_format"].default,
+    )
+
+
+@pytest.fixture
+def payload() -> Callable[[str], bytes]:
+    """Load a recorded API response body from tests/fixtures by name."""
+
+    def load(name: str) -> bytes:
+        return (FIXTURES / f"{name}.json").read_bytes()
+
+    return load
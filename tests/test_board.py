@@ -0,0 +1,73 @@
+"""Tests for the cross-sportsbook odds index."""
+
+import json
+from typing import Any, Callable
+
+from oddsblaze import OddsBoard
+from oddsblaze.models import OddsResponse
+from oddsblaze.prices import to_decimal
+from oddsblaze.settings import PriceFormat
+
+EVENT = "0a1b2c3d-0000-4000-8000-000000000001"
+KNICKS = (EVENT, "Moneyline", "New York Knicks")
+
+
+def board_for(
+    payload: Callable[[str], bytes], sportsbook: str, **prices: str
+) -> OddsResponse:
+    """The fixture board re-labelled as `sportsbook`, with prices overridden by name."""
+    data: dict[str, Any] = json.loads(payload("odds"))
+    data["sportsbook"] = {"id": sportsbook, "name": sportsbook}
+    for event in data["events"]:
+        for odd in event["odds"]:
+            odd["price"] = prices.get(odd["name"].replace(" ", "_"), odd["price"])
+    return OddsResponse.model_validate(data)
+
+
+def test_best_price_across_books(payload: Callable[[str], bytes]) -> None:
+    """The ladder should rank books by payout and track incremental updates."""
+    board = OddsBoard()
+    board.ingest(board_for(payload, "draftkings"))
+    board.ingest(board_for(payload, "fanduel", New_York_Knicks="+165"))
+    board.ingest(board_for(payload, "circa", New_York_Knicks="+140"))
+
+    best = board.best_price(*KNICKS)
+    assert best is not None and (best.sportsbook, best.price) == ("fanduel", "+165")
+    assert board.books_offering(*KNICKS) == ["fanduel", "draftkings", "circa"]
+
+    # Re-ingesting one book only moves that book's entries.
+    board.ingest(board_for(payload, "circa", New_York_Knicks="+200"))
+    assert board.books_offering(*KNICKS) == ["circa", "fanduel", "draftkings"]
+    assert [p.price for p in board.all_prices(*KNICKS)] == ["+200", "+165", "+150"]
+
+    board.remove("circa", "nba")
+    assert board.best_price(*KNICKS).sportsbook == "fanduel"
+    assert board.best_price(EVENT, "Moneyline", "Nobody") is None
+
+
+def test_lines_dropped_from_a_board_leave_the_index(
+    payload: Callable[[str], bytes],
+) -> None:
+    """A selection a book stops offering should disappear from its ladder."""
+    board = OddsBoard()
+    board.ingest(board_for(payload, "draftkings"))
+    selections = len(board)
+
+    data = json.loads(payload("odds"))
+    data["events"] = data["events"][:1]
+    board.ingest(OddsResponse.model_validate(data))
+
+    assert len(board) < selections
+    assert KNICKS in board
+
+
+def test_to_decimal_ranks_every_format() -> None:
+    """Decimal odds should agree across formats for the same price."""
+    assert to_decimal("+150") == 2.5
+    assert to_decimal("-200") == 1.5
+    assert to_decimal("3/2", PriceFormat.FRACTIONAL) == 2.5
+    assert to_decimal("2.50", PriceFormat.DECIMAL) == 2.5
+    assert to_decimal("40%", PriceFormat.PROBABILITY) == 2.5
+    assert to_decimal("1.5", PriceFormat.HONG_KONG) == 2.5
+    assert to_decimal("-0.5", PriceFormat.MALAYSIAN) == 3.0
+    assert to_decimal("-2.00", PriceFormat.INDONESIAN) == 1.5
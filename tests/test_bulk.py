@@ -0,0 +1,88 @@
+"""Tests for bulk fan-out across (sportsbook, league) pairs."""
+
+import asyncio
+import json
+import time
+from typing import Callable
+
+import httpx
+
+from oddsblaze import AsyncOddsblazeClient, OddsblazeClient, OddsResult
+from oddsblaze.settings import OddsblazeSettings
+
+PAIRS = [("draftkings", "nba"), ("fanduel", "nba"), ("broken", "nba"), ("slow", "nfl")]
+
+
+def odds_for(payload: Callable[[str], bytes], sportsbook: str) -> bytes:
+    data = json.loads(payload("odds"))
+    data["sportsbook"] = {"id": sportsbook, "name": sportsbook.title()}
+    return json.dumps(data).encode()
+
+
+def test_async_get_odds_many_isolates_errors_and_bounds_concurrency(
+    offline_settings: OddsblazeSettings, payload: Callable[[str], bytes]
+) -> None:
+    """Failures and timeouts should be per pair; fetches should overlap."""
+    in_flight = peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        sportsbook = request.url.params["sportsbook"]
+        in_flight += 1
+        peak = max(peak, in_flight)
+        try:
+            await asyncio.sleep(1.0 if sportsbook == "slow" else 0.05)
+        finally:
+            in_flight -= 1
+        if sportsbook == "broken":
+            return httpx.Response(500)
+        return httpx.Response(200, content=odds_for(payload, sportsbook))
+
+    async def run() -> list[OddsResult]:
+        async with AsyncOddsblazeClient(
+            settings=offline_settings, transport=httpx.MockTransport(handler)
+        ) as client:
+            return [
+                result
+                async for result in client.get_odds_many(
+                    PAIRS, concurrency=3, per_call_timeout=0.2
+                )
+            ]
+
+    start = time.perf_counter()
+    results = asyncio.run(run())
+    elapsed = time.perf_counter() - start
+
+    by_book = {result.sportsbook: result for result in results}
+    assert by_book["draftkings"].response.sportsbook.id == "draftkings"
+    assert by_book["fanduel"].ok
+    assert isinstance(by_book["broken"].error, httpx.HTTPStatusError)
+    assert isinstance(by_book["slow"].error, TimeoutError)
+    assert peak == 3
+    assert elapsed < 0.5
+
+
+def test_sync_get_odds_many_yields_as_completed(
+    offline_settings: OddsblazeSettings, payload: Callable[[str], bytes]
+) -> None:
+    """The thread-pool version should yield fast pairs before slow ones."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sportsbook = request.url.params["sportsbook"]
+        time.sleep(1.0 if sportsbook == "slow" else 0.05)
+        if sportsbook == "broken":
+            return httpx.Response(500)
+        return httpx.Response(200, content=odds_for(payload, sportsbook))
+
+    client = OddsblazeClient(
+        settings=offline_settings, transport=httpx.MockTransport(handler)
+    )
+
+    start = time.perf_counter()
+    results = list(client.get_odds_many(PAIRS, concurrency=4, per_call_timeout=0.2))
+    elapsed = time.perf_counter() - start
+
+    assert [r.sportsbook for r in results][-1] == "slow"
+    assert isinstance(results[-1].error, TimeoutError)
+    assert {r.sportsbook for r in results if r.ok} == {"draftkings", "fanduel"}
+    assert elapsed < 0.5
@@ -0,0 +1,95 @@
+"""Tests for the opt-in response cache."""
+
+import time
+from typing import Callable
+
+import httpx
+
+from oddsblaze import OddsblazeClient, ResponseCache
+from oddsblaze.cache import cache_key
+from oddsblaze.models import League, ScheduleResponse
+from oddsblaze.settings import OddsblazeSettings
+
+
+def make_client(
+    settings: OddsblazeSettings,
+    payload: Callable[[str], bytes],
+    cache: ResponseCache,
+    calls: list[httpx.Request],
+) -> OddsblazeClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        name = request.url.path.rsplit("/", 1)[-1].removesuffix(".json")
+        if name == "nba":
+            name = "schedule"
+        return httpx.Response(200, content=payload(name))
+
+    return OddsblazeClient(
+        settings=settings, cache=cache, transport=httpx.MockTransport(handler)
+    )
+
+
+def test_cache_hit_skips_network_and_validation(
+    offline_settings: OddsblazeSettings, payload: Callable[[str], bytes]
+) -> None:
+    """A second call should return the same validated object without a request."""
+    calls: list[httpx.Request] = []
+    client = make_client(offline_settings, payload, ResponseCache(), calls)
+
+    first = client.get_leagues()
+    second = client.get_leagues()
+
+    assert len(calls) == 1
+    assert second is first
+    assert isinstance(first[0], League)
+
+
+def test_cache_key_ignores_api_key_but_not_filters(
+    offline_settings: OddsblazeSettings, payload: Callable[[str], bytes]
+) -> None:
+    """Keys should drop the API key and keep every other param."""
+    assert cache_key("u", {"key": "a", "live": "true"}) == cache_key(
+        "u", {"live": "true", "key": "b"}
+    )
+
+    calls: list[httpx.Request] = []
+    client = make_client(offline_settings, payload, ResponseCache(), calls)
+
+    assert isinstance(client.get_schedule("nba", live=True), ScheduleResponse)
+    client.get_schedule("nba", live=True)
+    client.get_schedule("nba", live=False)
+
+    assert len(calls) == 2
+
+
+def test_uncached_endpoints_always_hit_network(
+    offline_settings: OddsblazeSettings, payload: Callable[[str], bytes]
+) -> None:
+    """Endpoints without a TTL should bypass the cache."""
+    calls: list[httpx.Request] = []
+    cache = ResponseCache(ttls={"leagues": 60.0})
+    client = make_client(offline_settings, payload, cache, calls)
+
+    client.get_sportsbooks()
+    client.get_sportsbooks()
+
+    assert len(calls) == 2
+    assert len(cache) == 0
+
+
+def test_ttl_expiry_and_lru_byte_budget() -> None:
+    """Entries should expire after their TTL and be evicted over budget."""
+    cache = ResponseCache(max_bytes=100)
+
+    cache.set("a", "A", size=40, ttl=60.0)
+    cache.set("b", "B", size=40, ttl=60.0)
+    assert cache.get("a") == "A"  # "b" is now least recently used
+    cache.set("c", "C", size=40, ttl=60.0)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    assert cache.get("c") == "C"
+
+    cache.set("d", "D", size=10, ttl=0.01)
+    time.sleep(0.02)
+    assert cache.get("d") is None
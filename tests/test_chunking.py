@@ -0,0 +1,180 @@
+"""Tests for splitting long list filters into concurrent requests."""
+
+import asyncio
+import copy
+import json
+from typing import Any, Callable
+
+import httpx
+
+from oddsblaze import AsyncOddsblazeClient, OddsblazeClient
+from oddsblaze.chunking import MAX_CHUNK_CONCURRENCY, chunk_params
+from oddsblaze.settings import OddsblazeSettings
+
+
+def test_chunk_params_splits_long_filters() -> None:
+    """Long filters are split by count and by length; short ones are kept."""
+    params = {"key": "k", "market": "moneyline", "event": ",".join("abcdea")}
+    chunks = chunk_params(params, ("event", "market"), size=2)
+    assert [c["event"] for c in chunks] == ["a,b", "c,d", "e"]
+    assert all(c["market"] == "moneyline" and c["key"] == "k" for c in chunks)
+
+    long_ids = {"event": ",".join(f"{i:04d}" for i in range(10))}
+    by_chars = chunk_params(long_ids, ("event",), size=100, max_chars=12)
+    assert [c["event"] for c in by_chars][:2] == ["0000,0001", "0002,0003"]
+    assert chunk_params(params, ("event",), size=10) == [params]
+    assert chunk_params(params, ("team",)) == [params]
+
+
+def test_chunk_params_splits_every_long_filter() -> None:
+    """Two long filters go out as the cross product of their chunks."""
+    events = [f"{i:08x}-0000-4000-8000-000000000000" for i in range(200)]
+    markets = [f"player-market-{i:03d}" for i in range(200)]
+    params = {"event": ",".join(events), "market": ",".join(markets)}
+    chunks = chunk_params(params, ("event", "market"))
+
+    # 40 event IDs fit in 1500 characters, 50 markets per chunk by count.
+    assert len(chunks) == 5 * 4
+    assert all(len(c["event"]) <= 1500 and len(c["market"]) <= 1500 for c in chunks)
+    pairs = {
+        (event, market)
+        for c in chunks
+        for event in c["event"].split(",")
+        for market in c["market"].split(",")
+    }
+    assert len(pairs) == len(events) * len(markets)
+
+
+class OddsHost:
+    """Mock odds host that honors the `event` and `market` filters."""
+
+    def __init__(self, payload: Callable[[str], bytes], event_ids: list[str]):
+        data = json.loads(payload("odds"))
+        template = data["events"][0]
+        self.base = {k: v for k, v in data.items() if k != "events"}
+        self.events = []
+        for event_id in event_ids:
+            event = copy.deepcopy(template)
+            event["id"] = event_id
+            for odd in event["odds"]:
+                odd["id"] = f"{event_id}#{odd['market']}#{odd['name']}"
+            self.events.append(event)
+        self.requests: list[dict[str, str]] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        params = dict(request.url.params)
+        self.requests.append(params)
+        events: list[dict[str, Any]] = copy.deepcopy(self.events)
+        if "event" in params:
+            wanted = set(params["event"].split(","))
+            events = [e for e in events if e["id"] in wanted]
+        if "market" in params:
+            markets = set(params["market"].split(","))
+            for event in events:
+                event["odds"] = [o for o in event["odds"] if o["market"] in markets]
+        return httpx.Response(200, json={**self.base, "events": events})
+
+    async def async_handler(self, request: httpx.Request) -> httpx.Response:
+        return self.handler(request)
+
+
+def test_long_event_filter_is_chunked_and_merged(
+    offline_settings: OddsblazeSettings, payload: Callable[[str], bytes]
+) -> None:
+    """120 event IDs should go out as three requests and come back as one."""
+    ids = [f"event-{i:03d}" for i in range(120)]
+    host = OddsHost(payload, ids)
+    client = OddsblazeClient(
+        settings=offline_settings,
+        chunk_size=50,
+        transport=httpx.MockTransport(host.handler),
+    )
+    board = client.get_odds("draftkings", "nba", event=ids + ids[:5])
+    assert len(host.requests) == 3
+    assert [e.id for e in board.events] == ids
+
+    raw = client.get_odds("draftkings", "nba", event=ids, validate=False)
+    assert [e["id"] for e in raw["events"]] == ids
+
+    unchunked = OddsblazeClient(
+        settings=offline_settings,
+        chunk_size=None,
+        transport=httpx.MockTransport(host.handler),
+    )
+    unchunked.get_odds("draftkings", "nba", event=ids)
+    assert len(host.requests) == 7
+
+
+def test_market_chunks_merge_odds_of_one_event(
+    offline_settings: OddsblazeSettings, payload: Callable[[str], bytes]
+) -> None:
+    """An event returned by every chunk should keep the odds of all of them."""
+    host = OddsHost(payload, ["only"])
+    markets = sorted({o["market"] for o in host.events[0]["odds"]})
+    assert len(markets) > 1
+
+    async def main() -> None:
+        async with AsyncOddsblazeClient(
+            settings=offline_settings,
+            chunk_size=1,
+            transport=httpx.MockTransport(host.async_handler),
+        ) as client:
+            board = await client.get_odds("draftkings", "nba", market=markets)
+            lazy = await client.get_odds("draftkings", "nba", market=markets, lazy=True)
+        assert len(board.events) == 1
+        assert len(board.events[0].odds) == len(host.events[0]["odds"])
+        assert len(lazy.events[0].odds) == len(host.events[0]["odds"])
+
+    asyncio.run(main())
+    assert len(host.requests) == 2 * len(markets)
+
+
+def test_async_chunks_share_the_sync_concurrency_cap(
+    offline_settings: OddsblazeSettings, payload: Callable[[str], bytes]
+) -> None:
+    """No more than `MAX_CHUNK_CONCURRENCY` chunks should be in flight."""
+    ids = [f"event-{i:03d}" for i in range(30)]
+    host = OddsHost(payload, ids)
+    in_flight = peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return host.handler(request)
+
+    async def main() -> None:
+        async with AsyncOddsblazeClient(
+            settings=offline_settings,
+            chunk_size=1,
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            board = await client.get_odds("draftkings", "nba", event=ids)
+        assert [e.id for e in board.events] == ids
+
+    asyncio.run(main())
+    assert len(host.requests) == len(ids)
+    assert peak == MAX_CHUNK_CONCURRENCY
+
+
+def test_schedule_team_filter_is_chunked(
+    offline_settings: OddsblazeSettings, payload: Callable[[str], bytes]
+) -> None:
+    """Schedule chunks should be merged with duplicate events dropped."""
+    schedule = json.loads(payload("schedule"))
+    requests: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.params["team"])
+        return httpx.Response(200, json=schedule)
+
+    client = OddsblazeClient(
+        settings=offline_settings,
+        chunk_size=2,
+        transport=httpx.MockTransport(handler),
+    )
+    response = client.get_schedule("nba", team=["a", "b", "c", "d", "e"])
+    assert sorted(requests) == ["a,b", "c,d", "e"]
+    assert [e.id for e in response.events] == [e["id"] for e in schedule["events"]]
@@ -0,0 +1,91 @@
+"""Tests for single-flight coalescing of identical requests."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+import httpx
+import pytest
+
+from oddsblaze import AsyncOddsblazeClient, EventNotFoundError, OddsblazeClient
+from oddsblaze.settings import OddsblazeSettings
+
+
+def test_async_identical_requests_share_one_call(
+    offline_settings: OddsblazeSettings, payload: Callable[[str], bytes]
+) -> None:
+    """Concurrent identical get_odds calls should make a single request."""
+    calls: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.params["league"])
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, content=payload("odds"))
+
+    async def run() -> list:
+        async with AsyncOddsblazeClient(
+            settings=offline_settings, transport=httpx.MockTransport(handler)
+        ) as client:
+            return await asyncio.gather(
+                *(client.get_odds("draftkings", "nba") for _ in range(10)),
+                client.get_odds("draftkings", "nfl"),
+            )
+
+    *nba, nfl = asyncio.run(run())
+
+    assert sorted(calls) == ["nba", "nfl"]
+    assert all(response is nba[0] for response in nba)
+    assert nfl is not nba[0]
+
+
+def test_async_cancelled_waiter_does_not_cancel_others(
+    offline_settings: OddsblazeSettings, payload: Callable[[str], bytes]
+) -> None:
+    """Cancelling the first caller should leave the shared request running."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, content=payload("odds"))
+
+    async def run() -> object:
+        async with AsyncOddsblazeClient(
+            settings=offline_settings, transport=httpx.MockTransport(handler)
+        ) as client:
+            first = asyncio.create_task(client.get_odds("draftkings", "nba"))
+            second = asyncio.create_task(client.get_odds("draftkings", "nba"))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            return await second
+
+    assert asyncio.run(run()).sportsbook.id == "draftkings"
+
+
+def test_sync_threads_share_result_and_errors(
+    offline_settings: OddsblazeSettings,
+) -> None:
+    """Threads asking for the same request should share one call and its error."""
+    calls = 0
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        with lock:
+            calls += 1
+        time.sleep(0.1)
+        return httpx.Response(200, json={"message": "Event not found"})
+
+    client = OddsblazeClient(
+        settings=offline_settings, transport=httpx.MockTransport(handler)
+    )
+
+    def grade() -> None:
+        with pytest.raises(EventNotFoundError):
+            client.grade_bet("draftkings#missing")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for future in [pool.submit(grade) for _ in range(8)]:
+            future.result()
+
+    assert calls == 1
@@ -0,0 +1,72 @@
+"""Tests for columnar export of odds boards."""
+
+import json
+from typing import Callable
+
+import pytest
+
+from oddsblaze.models import OddsResponse
+
+np = pytest.importorskip("numpy")
+
+from oddsblaze.columnar import MISSING_MS, raw_odds_columns  # noqa: E402
+
+
+def test_to_numpy_types_and_values(payload: Callable[[str], bytes]) -> None:
+    """Prices should be numeric, timestamps int64 ms, one row per odds line."""
+    board = OddsResponse.model_validate_json(payload("odds"))
+    columns = board.to_numpy()
+
+    assert len(columns["odd_id"]) == sum(len(e.odds) for e in board.events)
+    assert columns["price"].dtype == np.float64
+    assert columns["price"][:2].tolist() == [-180.0, 150.0]
+    assert columns["updated"].dtype == np.int64
+    assert columns["updated"][0] == 1736985521512
+    assert columns["date"][0] == int(board.events[0].date.timestamp() * 1000)
+    assert columns["home_team"][-1] == "Los Angeles Lakers"
+    assert columns["player"][0] is None
+    assert np.isnan(columns["line"][0]) and columns["line"][2] == -4.5
+
+
+def test_raw_payload_gives_same_columns(payload: Callable[[str], bytes]) -> None:
+    """Building from decoded JSON should match building from models."""
+    body = payload("odds")
+    from_models = OddsResponse.model_validate_json(body).to_numpy()
+    from_raw = raw_odds_columns(json.loads(body)).to_numpy()
+
+    for name, values in from_models.items():
+        np.testing.assert_array_equal(values, from_raw[name], err_msg=name)
+
+
+def test_missing_timestamps_use_sentinel(payload: Callable[[str], bytes]) -> None:
+    """Odds without an updated time should get the NaT-compatible sentinel."""
+    data = json.loads(payload("odds"))
+    del data["events"][0]["odds"][0]["updated"]
+
+    columns = raw_odds_columns(data).to_numpy()
+
+    assert columns["updated"][0] == MISSING_MS
+    assert np.isnat(columns["updated"][:1].view("datetime64[ms]"))[0]
+
+
+def test_to_arrow_uses_dictionary_columns(payload: Callable[[str], bytes]) -> None:
+    """Repeated strings should be dictionary-encoded in Arrow."""
+    pa = pytest.importorskip("pyarrow")
+    table = OddsResponse.model_validate_json(payload("odds")).to_arrow()
+
+    assert pa.types.is_dictionary(table.schema.field("market").type)
+    assert table.schema.field("updated").type == pa.timestamp("ms", tz="UTC")
+    assert table.column("market").to_pylist()[0] == "Moneyline"
+
+
+def test_to_pandas_and_records(payload: Callable[[str], bytes]) -> None:
+    """pandas export should use categoricals; records should keep row order."""
+    pd = pytest.importorskip("pandas")
+    board = OddsResponse.model_validate_json(payload("odds"))
+
+    frame = board.to_pandas()
+    records = board.to_records()
+
+    assert isinstance(frame["sportsbook"].dtype, pd.CategoricalDtype)
+    assert frame["updated"].isna().sum() == 0
+    assert records[0].odd_id == frame["odd_id"][0]
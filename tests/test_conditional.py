@@ -0,0 +1,115 @@
+"""Tests for conditional requests and unchanged-body short-circuiting."""
+
+import asyncio
+from typing import Callable
+
+import httpx
+
+from oddsblaze import AsyncOddsblazeClient, OddsblazeClient
+from oddsblaze.cache import Validators, ValidatorStore
+from oddsblaze.models import OddsResponse
+from oddsblaze.settings import OddsblazeSettings
+
+
+def test_304_returns_previous_response(
+    offline_settings: OddsblazeSettings, payload: Callable[[str], bytes]
+) -> None:
+    """A 304 should reuse the previously validated object."""
+    seen_headers: list[httpx.Headers] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            content=payload("odds"),
+            headers={"ETag": '"v1"', "Last-Modified": "Thu, 16 Jan 2025 00:00:02 GMT"},
+        )
+
+    client = OddsblazeClient(
+        settings=offline_settings,
+        conditional=True,
+        transport=httpx.MockTransport(handler),
+    )
+    first = client.get_odds("draftkings", "nba")
+    second = client.get_odds("draftkings", "nba")
+
+    assert isinstance(first, OddsResponse)
+    assert second is first
+    assert "If-None-Match" not in seen_headers[0]
+    assert seen_headers[1]["If-Modified-Since"] == "Thu, 16 Jan 2025 00:00:02 GMT"
+
+
+def test_identical_body_skips_decode(
+    offline_settings: OddsblazeSettings, payload: Callable[[str], bytes]
+) -> None:
+    """Without validators, an identical body hash should reuse the old object."""
+    bodies = [
+        payload("odds"),
+        payload("odds"),
+        payload("odds").replace(b"-180", b"-185"),
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=bodies.pop(0))
+
+    async def run() -> list[OddsResponse]:
+        async with AsyncOddsblazeClient(
+            settings=offline_settings,
+            conditional=True,
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            return [await client.get_odds("draftkings", "nba") for _ in range(3)]
+
+    first, second, third = asyncio.run(run())
+
+    assert second is first
+    assert third is not first
+    assert third.events[0].odds[0].price == "-185"
+
+
+def test_conditional_is_keyed_by_params(
+    offline_settings: OddsblazeSettings, payload: Callable[[str], bytes]
+) -> None:
+    """Validators for one filter set should not be sent for another."""
+    seen_headers: list[httpx.Headers] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers)
+        return httpx.Response(200, content=payload("odds"), headers={"ETag": '"v1"'})
+
+    client = OddsblazeClient(
+        settings=offline_settings,
+        conditional=True,
+        transport=httpx.MockTransport(handler),
+    )
+    client.get_odds("draftkings", "nba", live=True)
+    client.get_odds("draftkings", "nba", live=False)
+
+    assert all("If-None-Match" not in headers for headers in seen_headers)
+
+
+def test_validator_store_has_a_byte_budget() -> None:
+    """Remembered results should be evicted by body size, not only by count."""
+
+    def seen(size: int) -> Validators:
+        return Validators(
+            etag='"v"', last_modified=None, digest=b"", size=size, result={}
+        )
+
+    store = ValidatorStore(max_entries=10, max_bytes=100)
+    store.set("a", seen(40))
+    store.set("b", seen(40))
+    assert store.get("a") is not None  # now most recently used
+    store.set("c", seen(40))
+    assert store.get("b") is None
+    assert store.get("a") is not None and store.get("c") is not None
+
+    store.set("a", seen(500))  # too big to keep: the old entry goes too
+    assert store.get("a") is None and len(store) == 1
+
+    counted = ValidatorStore(max_entries=2)
+    for key in "xyz":
+        counted.set(key, seen(1))
+    assert counted.get("x") is None and len(counted) == 2
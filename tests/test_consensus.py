@@ -0,0 +1,177 @@
+"""Tests for local consensus computation."""
+
+import json
+from typing import Any, Callable
+
+import pytest
+
+from oddsblaze import PriceFormat
+from oddsblaze.models import ConsensusResponse, OddsResponse
+from oddsblaze.prices import convert_price
+
+pytest.importorskip("numpy")
+
+from oddsblaze.consensus import compute_consensus  # noqa: E402
+
+KNICKS = "New York Knicks"
+
+
+def board_for(
+    payload: Callable[[str], bytes], sportsbook: str, knicks: str
+) -> OddsResponse:
+    """The fixture board as `sportsbook`, quoting the Knicks moneyline at `knicks`."""
+    data: dict[str, Any] = json.loads(payload("odds"))
+    data["sportsbook"] = {"id": sportsbook, "name": sportsbook.title()}
+    for event in data["events"]:
+        for odd in event["odds"]:
+            if odd["name"] == KNICKS:
+                odd["price"] = knicks
+    return OddsResponse.model_validate(data)
+
+
+def knicks_price(response: ConsensusResponse) -> str:
+    (odd,) = [o for e in response.events for o in e.odds if o.name == KNICKS]
+    return odd.price
+
+
+@pytest.fixture
+def boards(payload: Callable[[str], bytes]) -> list[OddsResponse]:
+    return [
+        board_for(payload, "draftkings", "+150"),
+        board_for(payload, "fanduel", "+165"),
+        board_for(payload, "circa", "+140"),
+        board_for(payload, "betmgm", "+140"),
+    ]
+
+
+def test_average_and_best_consensus(boards: list[OddsResponse]) -> None:
+    """Hand-computed: implied 0.4, 0.3774, 0.4167 average to 0.3980 (+151)."""
+    average = compute_consensus(boards, "moneyline")
+    assert average.sportsbook.id == "consensus"
+    assert knicks_price(average) == "+151"
+    assert len(average.events[0].odds[1].sportsbooks) == 4
+    assert {o.market for e in average.events for o in e.odds} == {"Moneyline"}
+
+    # Without dedupe the repeated +140 counts twice: 0.4027 -> +148.
+    assert knicks_price(compute_consensus(boards, "moneyline", dedupe=False)) == "+148"
+    assert knicks_price(compute_consensus(boards, "moneyline", mode="best")) == "+165"
+
+
+def test_consensus_filters_and_weights(boards: list[OddsResponse]) -> None:
+    """`sportsbooks`, `required_sportsbooks` and `weights` follow the API."""
+    only = compute_consensus(boards, "moneyline", sportsbooks=["circa", "fanduel"])
+    assert len(only.events[0].odds[1].sportsbooks) == 2
+
+    # Circa counted twice: (0.4 + 0.3774 + 2 * 0.4167) / 4 = 0.4027 -> +148.
+    weighted = compute_consensus(boards, "moneyline", weights={"circa": 2.0})
+    assert knicks_price(weighted) == "+148"
+
+    missing = compute_consensus(boards, "moneyline", required_sportsbooks=["pinnacle"])
+    assert missing.events == []
+
+
+@pytest.fixture
+def rule_boards(payload: Callable[[str], bytes]) -> list[OddsResponse]:
+    """
+    Per-book NBA boards for the `consensus_*` fixtures.
+
+    The fixtures are consensus responses in the API's shape whose prices were
+    worked out by hand from the documented consensus rules; they are not
+    recordings of `get_consensus`.
+    """
+    return [
+        OddsResponse.model_validate(board)
+        for board in json.loads(payload("consensus_boards"))
+    ]
+
+
+def prices(response: ConsensusResponse) -> dict[str, str]:
+    return {odd.id: odd.price for event in response.events for odd in event.odds}
+
+
+@pytest.mark.parametrize(
+    ("name", "market", "options"),
+    [
+        ("consensus_moneyline", "moneyline", {}),
+        ("consensus_moneyline_best", "moneyline", {"mode": "best"}),
+        ("consensus_moneyline_weighted", "moneyline", {"weights": {"circa": 2.0}}),
+        ("consensus_moneyline_all", "moneyline", {"dedupe": False}),
+        (
+            "consensus_moneyline_weighted_all",
+            "moneyline",
+            {"weights": {"circa": 2.0}, "dedupe": False},
+        ),
+        ("consensus_point_spread", "point-spread", {}),
+        (
+            "consensus_point_spread_required",
+            "point-spread",
+            {"required_sportsbooks": ["circa"]},
+        ),
+    ],
+)
+def test_consensus_follows_documented_rules(
+    payload: Callable[[str], bytes],
+    rule_boards: list[OddsResponse],
+    name: str,
+    market: str,
+    options: dict[str, Any],
+) -> None:
+    """Prices and per-book breakdowns should match the hand-worked fixtures."""
+    expected = ConsensusResponse.model_validate_json(payload(name))
+    local = compute_consensus(rule_boards, market, **options)
+    assert prices(local) == prices(expected)
+    assert [
+        [(quote.name, quote.price, quote.timestamp) for quote in odd.sportsbooks]
+        for event in local.events
+        for odd in event.odds
+    ] == [
+        [(quote.name, quote.price, quote.timestamp) for quote in odd.sportsbooks]
+        for event in expected.events
+        for odd in event.odds
+    ]
+
+
+def test_consensus_for_every_market_at_once(
+    payload: Callable[[str], bytes], rule_boards: list[OddsResponse]
+) -> None:
+    """One call over several markets should match one call per market."""
+    every = compute_consensus(rule_boards)
+    assert list(every) == ["moneyline", "point-spread"]
+    for market, name in [
+        ("moneyline", "consensus_moneyline"),
+        ("point-spread", "consensus_point_spread"),
+    ]:
+        expected = ConsensusResponse.model_validate_json(payload(name))
+        assert prices(every[market]) == prices(expected)
+
+    listed = compute_consensus(
+        rule_boards, ["Point Spread", "total-points"], mode="best"
+    )
+    assert list(listed) == ["point-spread", "total-points"]
+    assert listed["total-points"].events == []
+    assert prices(listed["point-spread"]) == prices(
+        compute_consensus(rule_boards, "point-spread", mode="best")
+    )
+
+
+def test_consensus_in_decimal_is_read_as_decimal(
+    payload: Callable[[str], bytes],
+) -> None:
+    """Consensus odds and quotes should carry the format of the boards."""
+    boards = []
+    for board in json.loads(payload("consensus_boards")):
+        for event in board["events"]:
+            for odd in event["odds"]:
+                odd["price"] = convert_price(
+                    odd["price"], PriceFormat.AMERICAN, PriceFormat.DECIMAL
+                )
+        boards.append(OddsResponse.model_validate(board))
+
+    best = compute_consensus(
+        boards, "moneyline", mode="best", price_format=PriceFormat.DECIMAL
+    )
+    knicks = next(o for e in best.events for o in e.odds if o.name == KNICKS)
+    assert knicks.price == "2.65"
+    assert knicks.price_decimal == 2.65
+    assert knicks.price_american == pytest.approx(165.0)
+    assert {quote.price_decimal for quote in knicks.sportsbooks} == {2.5, 2.65, 2.4}
@@ -0,0 +1,66 @@
+"""Tests for client-side price format conversion."""
+
+from typing import Callable
+
+import pytest
+
+from oddsblaze.models import OddsResponse, PricePoint
+from oddsblaze.prices import convert_price, parse_price
+from oddsblaze.settings import PriceFormat
+
+np = pytest.importorskip("numpy")
+
+from oddsblaze.convert import (  # noqa: E402
+    convert_prices,
+    from_decimal_array,
+    to_decimal_array,
+)
+
+AMERICAN = ["+150", "-200", "+100", "-110", "EVEN"]
+
+EXPECTED = {
+    PriceFormat.DECIMAL: ["2.50", "1.50", "2.00", "1.91", "2.00"],
+    PriceFormat.FRACTIONAL: ["3/2", "1/2", "1/1", "10/11", "1/1"],
+    PriceFormat.PROBABILITY: ["40.0%", "66.7%", "50.0%", "52.4%", "50.0%"],
+    PriceFormat.MALAYSIAN: ["-0.67", "0.50", "1.00", "0.91", "1.00"],
+    PriceFormat.INDONESIAN: ["1.50", "-2.00", "1.00", "-1.10", "1.00"],
+    PriceFormat.HONG_KONG: ["1.50", "0.50", "1.00", "0.91", "1.00"],
+}
+
+
+@pytest.mark.parametrize("target", list(EXPECTED))
+def test_convert_prices_matches_scalar(target: PriceFormat) -> None:
+    """Array conversion should agree with the per-price conversion."""
+    converted = convert_prices(AMERICAN, PriceFormat.AMERICAN, target)
+
+    assert converted.tolist() == EXPECTED[target]
+    assert [convert_price(p, PriceFormat.AMERICAN, target) for p in AMERICAN] == (
+        EXPECTED[target]
+    )
+    # Two-decimal formats are lossy, so compare the round trip as decimal odds.
+    back = convert_prices(converted, target, PriceFormat.DECIMAL).astype(float)
+    np.testing.assert_allclose(back, [2.5, 1.5, 2.0, 1.91, 2.0], atol=0.01)
+
+
+@pytest.mark.parametrize("target", list(PriceFormat))
+def test_numeric_round_trip(target: PriceFormat) -> None:
+    """Numeric conversions should invert each other and match parse_price."""
+    decimals = np.array([2.5, 1.5, 2.0, 1.25, np.nan])
+    values = from_decimal_array(decimals, target)
+
+    np.testing.assert_allclose(to_decimal_array(values, target), decimals)
+    formatted = convert_prices(["+150", "-200"], PriceFormat.AMERICAN, target).tolist()
+    np.testing.assert_allclose(
+        [parse_price(p) for p in formatted], values[:2], rtol=0.01
+    )
+
+
+def test_model_price_views(payload: Callable[[str], bytes]) -> None:
+    """Models should expose their price in another format."""
+    odd = OddsResponse.model_validate_json(payload("odds")).events[0].odds[1]
+    assert odd.price == "+150"
+    assert odd.price_in(PriceFormat.DECIMAL) == "2.50"
+    assert odd.price_in(PriceFormat.AMERICAN) == "+150"
+
+    point = PricePoint(price="2.50", timestamp=1736985521512)
+    assert point.price_in(PriceFormat.AMERICAN, source=PriceFormat.DECIMAL) == "+150"
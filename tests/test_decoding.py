@@ -0,0 +1,70 @@
+"""Tests for the single-pass JSON decode path."""
+
+import json
+from typing import Callable
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from oddsblaze import InvalidMarketError, OddsblazeClient, OddsblazeError
+from oddsblaze.decoding import decode
+from oddsblaze.models import League, OddsResponse
+from oddsblaze.settings import OddsblazeSettings
+
+
+def test_decode_matches_two_pass_validation(payload: Callable[[str], bytes]) -> None:
+    """Validating bytes directly should give the same models as dict + validate."""
+    body = payload("odds")
+
+    assert decode(body, OddsResponse) == OddsResponse.model_validate(json.loads(body))
+    leagues = decode(payload("leagues"), list[League])
+    assert [league.id for league in leagues] == ["nba", "nfl", "nhl"]
+
+
+def test_decode_raises_for_api_error_messages() -> None:
+    """The single-key message payload should map to SDK exceptions."""
+    with pytest.raises(InvalidMarketError):
+        decode(b'{"message": "Invalid market"}', OddsResponse)
+    with pytest.raises(OddsblazeError):
+        decode(b'{"message": "Something else"}', list[League])
+
+
+def test_decode_reraises_real_validation_errors() -> None:
+    """Malformed payloads that are not API errors should still fail loudly."""
+    with pytest.raises(ValidationError):
+        decode(b'{"updated": "not a date"}', OddsResponse)
+    with pytest.raises(ValidationError):
+        decode(b"<html>bad gateway</html>", OddsResponse)
+
+
+def test_get_odds_validate_false_returns_plain_dicts(
+    offline_settings: OddsblazeSettings, payload: Callable[[str], bytes]
+) -> None:
+    """validate=False should skip pydantic and keep raw JSON values."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=payload("odds"))
+
+    client = OddsblazeClient(
+        settings=offline_settings,
+        conditional=True,
+        transport=httpx.MockTransport(handler),
+    )
+    raw = client.get_odds("draftkings", "nba", validate=False)
+    validated = client.get_odds("draftkings", "nba")
+
+    assert isinstance(raw, dict)
+    odd = raw["events"][0]["odds"][0]
+    assert (odd["id"], odd["price"], odd["updated"]) == (
+        "DraftKings#0a1b2c3d-0000-4000-8000-000000000001#Moneyline#Boston Celtics",
+        "-180",
+        "2025-01-15T23:58:41.512Z",
+    )
+    assert isinstance(validated, OddsResponse)
+
+
+def test_raw_decode_still_raises_for_api_error_messages() -> None:
+    """Skipping validation should not skip error detection."""
+    with pytest.raises(InvalidMarketError):
+        decode(b'{"message": "Invalid market"}', None)
@@ -0,0 +1,56 @@
+"""Tests for incremental diffs between odds boards."""
+
+import json
+from typing import Callable
+
+from oddsblaze import Added, Changed, OddsDiffer, Removed
+from oddsblaze.models import OddsResponse
+
+
+def test_diff_reports_added_changed_removed(payload: Callable[[str], bytes]) -> None:
+    """Price moves, new lines and pulled lines should each be reported once."""
+    data = json.loads(payload("odds"))
+    first = OddsResponse.model_validate(data)
+    odds = data["events"][0]["odds"]
+    moved, pulled = odds[0], odds.pop(1)
+    moved["price"] = "-200"
+    odds.append({**pulled, "id": "new-line", "price": "+300"})
+    second = OddsResponse.model_validate(data)
+
+    differ = OddsDiffer()
+    initial = differ.diff(first)
+    assert len(initial) == sum(len(e.odds) for e in first.events)
+    assert all(isinstance(change, Added) for change in initial)
+
+    changes = differ.diff(second)
+    by_type = {type(change): change for change in changes}
+    assert len(changes) == 3
+
+    changed = by_type[Changed]
+    assert (changed.odd_id, changed.old_price, changed.new_price) == (
+        moved["id"],
+        "-180",
+        "-200",
+    )
+    assert changed.price_moved
+    assert changed.old_updated == changed.new_updated is not None
+    assert by_type[Removed].odd_id == pulled["id"]
+    assert by_type[Added].price == "+300"
+    assert by_type[Added].event_id == second.events[0].id
+
+    assert differ.diff(second) == []
+
+
+def test_diff_keeps_snapshots_per_pair(payload: Callable[[str], bytes]) -> None:
+    """Boards from different sportsbooks should not be diffed against each other."""
+    data = json.loads(payload("odds"))
+    differ = OddsDiffer()
+    differ.diff(OddsResponse.model_validate(data))
+    data["sportsbook"] = {"id": "fanduel", "name": "FanDuel"}
+    other = differ.diff(OddsResponse.model_validate(data))
+
+    assert other and all(isinstance(change, Added) for change in other)
+    assert len(differ) == 2
+
+    differ.forget("fanduel", data["league"]["id"])
+    assert ("fanduel", data["league"]["id"]) not in differ
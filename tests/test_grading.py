@@ -0,0 +1,120 @@
+"""Tests for batch grading and the persistent grade cache."""
+
+import asyncio
+import json
+import threading
+from pathlib import Path
+from typing import Iterable, Optional
+
+import httpx
+
+from oddsblaze import AsyncOddsblazeClient, GradeCache, GradeResult, OddsblazeClient
+from oddsblaze.models import GraderResponse
+from oddsblaze.settings import OddsblazeSettings
+
+
+class Grader:
+    """Mock grader; odds IDs starting with "live" are in progress, "bad" fail."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.lock = threading.Lock()
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        odds_id = request.url.params["id"]
+        with self.lock:
+            self.calls.append(odds_id)
+        if odds_id.startswith("bad"):
+            return httpx.Response(500)
+        status = "Q3 5:12" if odds_id.startswith("live") else "Final"
+        body = {
+            "id": odds_id,
+            "event": {
+                "id": "event-1",
+                "teams": {
+                    "away": {"name": "Boston Celtics", "score": 112},
+                    "home": {"name": "New York Knicks", "score": 104},
+                },
+                "status": status,
+            },
+            "market": "Moneyline",
+            "name": "Boston Celtics",
+            "result": "Win",
+        }
+        return httpx.Response(200, content=json.dumps(body).encode())
+
+    async def async_handler(self, request: httpx.Request) -> httpx.Response:
+        return self.handler(request)
+
+
+class ThreadRecordingCache(GradeCache):
+    """Grade cache noting which threads touch it."""
+
+    def __init__(self, path: str) -> None:
+        super().__init__(path)
+        self.threads: set[int] = set()
+
+    def get(self, odds_id: str) -> Optional[GraderResponse]:
+        self.threads.add(threading.get_ident())
+        return super().get(odds_id)
+
+    def get_many(self, odds_ids: Iterable[str]) -> dict[str, GraderResponse]:
+        self.threads.add(threading.get_ident())
+        return super().get_many(odds_ids)
+
+    def put(self, odds_id: str, response: GraderResponse) -> bool:
+        self.threads.add(threading.get_ident())
+        return super().put(odds_id, response)
+
+
+IDS = ["final-1", "final-2", "final-1", "live-1", "bad-1"]
+
+
+def test_grade_many_dedupes_and_persists_final_grades(
+    offline_settings: OddsblazeSettings, tmp_path: Path
+) -> None:
+    """Final grades should survive a new client and skip the network."""
+    grader = Grader()
+    path = tmp_path / "grades.sqlite3"
+
+    def run() -> dict[str, GradeResult]:
+        client = OddsblazeClient(
+            settings=offline_settings,
+            grade_cache=GradeCache(path),
+            transport=httpx.MockTransport(grader.handler),
+        )
+        return {r.odds_id: r for r in client.grade_many(IDS, concurrency=3)}
+
+    first = run()
+    assert sorted(grader.calls) == ["bad-1", "final-1", "final-2", "live-1"]
+    assert first["final-1"].response.result == "Win"
+    assert isinstance(first["bad-1"].error, httpx.HTTPStatusError)
+    assert len(GradeCache(path)) == 2
+
+    grader.calls.clear()
+    second = run()
+    assert sorted(grader.calls) == ["bad-1", "live-1"]
+    assert second["final-2"].response == first["final-2"].response
+
+
+def test_async_grade_many_uses_cache(offline_settings: OddsblazeSettings) -> None:
+    """The async client should serve cached grades without blocking the loop."""
+    grader = Grader()
+    cache = ThreadRecordingCache(":memory:")
+
+    async def run() -> list[GradeResult]:
+        async with AsyncOddsblazeClient(
+            settings=offline_settings,
+            grade_cache=cache,
+            transport=httpx.MockTransport(grader.async_handler),
+        ) as client:
+            return [r async for r in client.grade_many(IDS, concurrency=2)]
+
+    assert len(asyncio.run(run())) == 4
+    grader.calls.clear()
+    results = asyncio.run(run())
+
+    assert sorted(grader.calls) == ["bad-1", "live-1"]
+    assert sum(r.ok for r in results) == 3
+    assert cache.threads and threading.get_ident() not in cache.threads
+    assert "final-1" in cache and "live-1" not in cache
@@ -0,0 +1,115 @@
+"""Tests for hedged odds requests in the async client."""
+
+import asyncio
+import time
+from typing import Callable
+
+import httpx
+
+from oddsblaze import AsyncOddsblazeClient, HedgePolicy, RateLimiter
+from oddsblaze.settings import OddsblazeSettings
+
+
+def test_hedge_policy_delay_and_budget() -> None:
+    """The delay should track the percentile; hedges should cost credit."""
+    hedge = HedgePolicy(90, min_samples=10, budget=0.25, max_credit=2)
+    for i in range(9):
+        hedge.record(i / 100)
+    assert hedge.delay() is None
+    hedge.record(0.09)
+    assert hedge.delay() == 0.09
+
+    assert hedge.try_spend() and hedge.try_spend()  # capped at max_credit
+    assert not hedge.try_spend()
+    for _ in range(4):
+        hedge.record(0.01)
+    assert hedge.try_spend() and not hedge.try_spend()
+    assert hedge.hedged == 3
+
+
+def test_hedge_takes_a_limiter_token_only_when_sent(
+    offline_settings: OddsblazeSettings,
+) -> None:
+    """A refused hedge should cost neither a limiter token nor hedge credit."""
+    limiter = RateLimiter(rate=0.001)
+    hedge = HedgePolicy(min_samples=1, budget=1.0)
+    client = AsyncOddsblazeClient(
+        settings=offline_settings, hedge=hedge, rate_limiter=limiter
+    )
+
+    assert not client._may_hedge(hedge)  # no credit yet
+    hedge.record(0.01)
+    assert client._may_hedge(hedge)  # spends the credit and the token
+    hedge.record(0.01)
+    assert not client._may_hedge(hedge)  # limiter empty: credit refunded
+    assert hedge.hedged == 1
+    assert hedge.try_spend()
+
+
+def test_slow_odds_request_is_hedged(
+    offline_settings: OddsblazeSettings, payload: Callable[[str], bytes]
+) -> None:
+    """A stalled request should be answered by its hedge and then cancelled."""
+    calls = 0
+    cancelled = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls, cancelled
+        calls += 1
+        try:
+            # The sixth request stalls; everything else is quick.
+            await asyncio.sleep(5.0 if calls == 6 else 0.01)
+        except asyncio.CancelledError:
+            cancelled += 1
+            raise
+        return httpx.Response(200, content=payload("odds"))
+
+    hedge = HedgePolicy(95, min_samples=5, budget=0.5)
+
+    async def main() -> float:
+        async with AsyncOddsblazeClient(
+            settings=offline_settings,
+            hedge=hedge,
+            coalesce=False,
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            for _ in range(5):
+                await client.get_odds("draftkings", "nba")
+            started = time.monotonic()
+            board = await client.get_odds("draftkings", "nba")
+            assert board.events
+            return time.monotonic() - started
+
+    elapsed = asyncio.run(main())
+    assert elapsed < 1.0
+    assert calls == 7 and cancelled == 1
+    assert hedge.hedged == 1 and hedge.hedge_wins == 1
+
+
+def test_hedges_stay_within_budget(
+    offline_settings: OddsblazeSettings, payload: Callable[[str], bytes]
+) -> None:
+    """When everything is slow, only the budgeted share is duplicated."""
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01 if calls <= 5 else 0.05)
+        return httpx.Response(200, content=payload("odds"))
+
+    hedge = HedgePolicy(50, min_samples=5, budget=0.2, max_credit=1)
+
+    async def main() -> None:
+        async with AsyncOddsblazeClient(
+            settings=offline_settings,
+            hedge=hedge,
+            coalesce=False,
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            for _ in range(25):
+                await client.get_odds("draftkings", "nba")
+
+    asyncio.run(main())
+    assert 1 <= hedge.hedged <= 0.2 * 25
+    assert calls == 25 + hedge.hedged
@@ -0,0 +1,114 @@
+"""Tests for bulk historical fetches into columns."""
+
+import asyncio
+import json
+import threading
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+
+from oddsblaze import AsyncOddsblazeClient, HistoricalStore, OddsblazeClient
+from oddsblaze.models import HistoricalResponse
+from oddsblaze.settings import OddsblazeSettings
+
+np = pytest.importorskip("numpy")
+
+from oddsblaze.columnar import MISSING_MS, HistoricalColumns  # noqa: E402
+
+
+def historical_body(odds_id: str) -> dict[str, Any]:
+    entries = [
+        {"price": "-150", "locked": False, "timestamp": 1736900000000},
+        {"price": None, "locked": True, "timestamp": 1736950000000},
+        {"price": "-180", "locked": False, "timestamp": 1736985521512},
+    ]
+    body: dict[str, Any] = {
+        "updated": "2025-01-16T04:00:00Z",
+        "id": odds_id,
+        "market": "Moneyline",
+        "name": "Boston Celtics",
+        "olv": {"price": "-150", "timestamp": 1736900000000},
+        "entries": entries[: 1 if odds_id == "short" else 3],
+    }
+    if odds_id != "open":
+        body["clv"] = {"price": "-180", "timestamp": 1736985521512}
+    return body
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    odds_id = request.url.params["id"]
+    if odds_id == "bad":
+        return httpx.Response(500)
+    return httpx.Response(200, content=json.dumps(historical_body(odds_id)))
+
+
+IDS = ["closed", "short", "bad", "open", "closed"]
+
+
+def check(columns: HistoricalColumns) -> None:
+    assert columns.odds_ids == ["closed", "short", "open"]
+    assert columns.offsets.tolist() == [0, 3, 4, 7]
+    assert columns.timestamp.dtype == np.int64
+    assert columns.locked.tolist() == [False, True, False, False] + [False, True, False]
+    closed = columns.series("closed")
+    assert closed["timestamp"][-1] == 1736985521512
+    assert closed["price"][0] == -150.0 and np.isnan(closed["price"][1])
+    assert columns.clv_price[:2].tolist() == [-180.0, -180.0]
+    assert np.isnan(columns.clv_price[2])
+    assert columns.clv_timestamp[2] == MISSING_MS
+    assert isinstance(columns.errors["bad"], httpx.HTTPStatusError)
+
+
+def test_get_historical_many_builds_columns(
+    offline_settings: OddsblazeSettings, tmp_path: Path
+) -> None:
+    """Raw responses and store hits should land in the same columns."""
+    client = OddsblazeClient(
+        settings=offline_settings,
+        historical_store=HistoricalStore(tmp_path / "historical.bin"),
+        transport=httpx.MockTransport(handler),
+    )
+    check(client.get_historical_many(IDS, concurrency=4))
+    # Second run reads "closed" and "short" back from the store.
+    check(client.get_historical_many(IDS, concurrency=4))
+
+
+class ThreadRecordingStore(HistoricalStore):
+    """Historical store noting which threads touch it."""
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(path)
+        self.threads: set[int] = set()
+
+    def get(self, key: str, response_type: Any = HistoricalResponse) -> Any:
+        self.threads.add(threading.get_ident())
+        return super().get(key, response_type)
+
+    def put(self, key: str, response: Any) -> bool:
+        self.threads.add(threading.get_ident())
+        return super().put(key, response)
+
+
+def test_async_get_historical_many_builds_columns(
+    offline_settings: OddsblazeSettings, tmp_path: Path
+) -> None:
+    """The async client should build the same columns off the event loop."""
+    store = ThreadRecordingStore(tmp_path / "historical.bin")
+
+    async def async_handler(request: httpx.Request) -> httpx.Response:
+        return handler(request)
+
+    async def run() -> HistoricalColumns:
+        async with AsyncOddsblazeClient(
+            settings=offline_settings,
+            historical_store=store,
+            transport=httpx.MockTransport(async_handler),
+        ) as client:
+            return await client.get_historical_many(IDS, concurrency=2)
+
+    check(asyncio.run(run()))
+    check(asyncio.run(run()))
+    assert len(store) == 2
+    assert store.threads and threading.get_ident() not in store.threads
@@ -0,0 +1,85 @@
+"""Tests for the persistent store of closed historical odds."""
+
+import json
+from pathlib import Path
+from typing import Any, Optional
+
+import httpx
+
+from oddsblaze import HistoricalStore, OddsblazeClient, PriceFormat
+from oddsblaze.historical import historical_key
+from oddsblaze.models import HistoricalResponse
+from oddsblaze.settings import OddsblazeSettings
+
+
+def historical_body(odds_id: str, clv: Optional[str]) -> dict[str, Any]:
+    body: dict[str, Any] = {
+        "updated": "2025-01-16T04:00:00Z",
+        "id": odds_id,
+        "market": "Moneyline",
+        "name": "Boston Celtics",
+        "olv": {"price": "-150", "timestamp": 1736900000000},
+        "entries": [
+            {"price": "-150", "locked": False, "timestamp": 1736900000000},
+            {"price": None, "locked": True, "timestamp": 1736950000000},
+            {"price": "-180", "locked": False, "timestamp": 1736985521512},
+        ],
+    }
+    if clv is not None:
+        body["clv"] = {"price": clv, "timestamp": 1736985521512}
+    return body
+
+
+def test_store_round_trips_closed_odds(tmp_path: Path) -> None:
+    """Closed odds should persist across opens; open odds are never stored."""
+    path = tmp_path / "historical.bin"
+    closed = HistoricalResponse.model_validate(historical_body("closed", "-180"))
+    still_open = HistoricalResponse.model_validate(historical_body("open", None))
+
+    store = HistoricalStore(path)
+    assert store.put(historical_key("closed", "american", True), closed)
+    assert not store.put(historical_key("open", "american", True), still_open)
+    store.close()
+
+    # A torn write at the tail is dropped when the store is reopened.
+    with open(path, "ab") as f:
+        f.write(b"\x10\x00\x00\x00\xff")
+
+    reopened = HistoricalStore(path)
+    assert len(reopened) == 1
+    assert reopened.get(historical_key("closed", "american", True)) == closed
+    assert reopened.get(historical_key("closed", "decimal", True)) is None
+    assert path.stat().st_size < len(closed.model_dump_json())
+
+
+def test_client_serves_closed_odds_from_store(
+    offline_settings: OddsblazeSettings, tmp_path: Path
+) -> None:
+    """Only odds without a closing line should go back to the network."""
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        odds_id = request.url.params["id"]
+        calls.append(odds_id)
+        clv = "2.50" if request.url.params["price"] == "decimal" else "+150"
+        clv = None if odds_id == "open" else clv
+        return httpx.Response(200, content=json.dumps(historical_body(odds_id, clv)))
+
+    store = HistoricalStore(tmp_path / "historical.bin")
+    client = OddsblazeClient(
+        settings=offline_settings,
+        historical_store=store,
+        transport=httpx.MockTransport(handler),
+    )
+    for _ in range(3):
+        for odds_id in ("closed", "open"):
+            client.get_historical(odds_id, time_series=True)
+    assert calls == ["closed", "open", "open", "open"]
+
+    # Other price formats are stored separately and read back in that format.
+    for _ in range(2):
+        decimal = client.get_historical(
+            "closed", price=PriceFormat.DECIMAL, time_series=True
+        )
+    assert calls[-1] == "closed" and len(calls) == 5
+    assert decimal.clv is not None and decimal.clv.price_american == 150.0
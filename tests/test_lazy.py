@@ -0,0 +1,57 @@
+"""Tests for lazily validated odds responses."""
+
+from typing import Callable
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from oddsblaze import OddsblazeClient
+from oddsblaze.models import LazyOddsResponse, Odd, OddsResponse
+from oddsblaze.settings import OddsblazeSettings
+
+
+def test_lazy_response_matches_eager_response(payload: Callable[[str], bytes]) -> None:
+    """Reading every event lazily should give the same data as eager validation."""
+    body = payload("odds")
+    eager = OddsResponse.model_validate_json(body)
+    lazy = LazyOddsResponse.model_validate_json(body)
+
+    assert lazy.updated == eager.updated
+    assert lazy.sportsbook == eager.sportsbook
+    for lazy_event, event in zip(lazy.events, eager.events, strict=True):
+        assert (lazy_event.id, lazy_event.live) == (event.id, event.live)
+        assert lazy_event.odds == event.odds
+
+
+def test_odds_are_validated_once_on_first_access(
+    payload: Callable[[str], bytes],
+) -> None:
+    """Bad odds should only fail when read, and results should be cached."""
+    body = payload("odds").replace(b'"price": "+110"', b'"price": 110.5', 1)
+    lazy = LazyOddsResponse.model_validate_json(body)
+
+    live = [event for event in lazy.events if event.live]
+    assert isinstance(live[0].odds[0], Odd)
+    assert live[0].odds is live[0].odds
+
+    with pytest.raises(ValidationError):
+        lazy.events[1].odds
+
+
+def test_get_odds_lazy(
+    offline_settings: OddsblazeSettings, payload: Callable[[str], bytes]
+) -> None:
+    """get_odds(lazy=True) should return a LazyOddsResponse."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=payload("odds"))
+
+    client = OddsblazeClient(
+        settings=offline_settings, transport=httpx.MockTransport(handler)
+    )
+    response = client.get_odds("draftkings", "nba", lazy=True)
+
+    assert isinstance(response, LazyOddsResponse)
+    assert "odds" not in response.events[0].__dict__
+    assert response.events[0].odds[0].price == "-180"
@@ -0,0 +1,102 @@
+"""Tests for change-driven polling with last-polled timestamps."""
+
+import asyncio
+import json
+from typing import Callable
+
+import httpx
+
+from oddsblaze import (
+    AsyncOddsblazeClient,
+    AsyncPollingEngine,
+    OddsblazeClient,
+    PollingEngine,
+)
+from oddsblaze.settings import OddsblazeSettings
+
+PAIRS = [("draftkings", "nba"), ("fanduel", "nba")]
+
+
+class Upstream:
+    """Mock API whose last-polled timestamps can be advanced per sportsbook."""
+
+    def __init__(self, payload: Callable[[str], bytes]):
+        self.payload = payload
+        self.polled = {"draftkings": 1_700_000_000_000, "fanduel": 1_700_000_000_000}
+        self.fetched: list[str] = []
+
+    def polled_body(self) -> bytes:
+        return json.dumps(
+            {
+                "updated": "2024-01-01T00:00:00Z",
+                "leagues": [
+                    {
+                        "id": "nba",
+                        "name": "NBA",
+                        "sportsbooks": [
+                            {"id": book, "name": book, "timestamp": ms, "last": 1}
+                            for book, ms in self.polled.items()
+                        ],
+                    }
+                ],
+            }
+        ).encode()
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.host == "polled.oddsblaze.com":
+            return httpx.Response(200, content=self.polled_body())
+        sportsbook = request.url.params["sportsbook"]
+        self.fetched.append(sportsbook)
+        data = json.loads(self.payload("odds"))
+        data["sportsbook"] = {"id": sportsbook, "name": sportsbook}
+        return httpx.Response(200, json=data)
+
+    async def async_handler(self, request: httpx.Request) -> httpx.Response:
+        return self.handler(request)
+
+
+def test_polling_engine_refetches_only_advanced_pairs(
+    offline_settings: OddsblazeSettings, payload: Callable[[str], bytes]
+) -> None:
+    """Only pairs whose upstream timestamp moved should be refetched."""
+    upstream = Upstream(payload)
+    client = OddsblazeClient(
+        settings=offline_settings, transport=httpx.MockTransport(upstream.handler)
+    )
+    engine = PollingEngine(client, PAIRS)
+
+    first = engine.poll()
+    assert sorted(r.sportsbook for r in first) == ["draftkings", "fanduel"]
+    assert all(r.ok for r in first)
+
+    assert engine.poll() == []
+
+    upstream.polled["fanduel"] += 5_000
+    third = engine.poll()
+    assert [r.sportsbook for r in third] == ["fanduel"]
+    assert sorted(upstream.fetched) == ["draftkings", "fanduel", "fanduel"]
+    assert (engine.state.checks, engine.state.fetches, engine.state.skipped) == (
+        3,
+        3,
+        3,
+    )
+
+
+def test_async_polling_engine_refetches_only_advanced_pairs(
+    offline_settings: OddsblazeSettings, payload: Callable[[str], bytes]
+) -> None:
+    """The async engine should skip unchanged pairs the same way."""
+    upstream = Upstream(payload)
+
+    async def run() -> list[list[str]]:
+        async with AsyncOddsblazeClient(
+            settings=offline_settings,
+            transport=httpx.MockTransport(upstream.async_handler),
+        ) as client:
+            engine = AsyncPollingEngine(client, PAIRS)
+            cycles = [await engine.poll(), await engine.poll()]
+            upstream.polled["draftkings"] += 1_000
+            cycles.append(await engine.poll())
+            return [sorted(r.sportsbook for r in cycle) for cycle in cycles]
+
+    assert asyncio.run(run()) == [["draftkings", "fanduel"], [], ["draftkings"]]
@@ -0,0 +1,88 @@
+"""Tests for numeric price accessors."""
+
+import json
+import math
+from typing import Callable
+
+import httpx
+import pytest
+
+from oddsblaze import OddsblazeClient, PriceFormat
+from oddsblaze.models import OddsResponse, TimeSeriesEntry
+from oddsblaze.models.base import set_price_format
+from oddsblaze.prices import price_numbers
+from oddsblaze.settings import OddsblazeSettings
+
+
+def decimal_board(payload: Callable[[str], bytes]) -> bytes:
+    """The fixture board with its American prices rewritten as decimal odds."""
+    data = json.loads(payload("odds"))
+    for event in data["events"]:
+        for odd in event["odds"]:
+            odd["price"] = {"-180": "1.56", "+150": "2.50"}.get(odd["price"], "1.91")
+    return json.dumps(data).encode()
+
+
+def test_numeric_accessors(payload: Callable[[str], bytes]) -> None:
+    """Accessors should agree with each other and stay out of dumps."""
+    odd = OddsResponse.model_validate_json(payload("odds")).events[0].odds[1]
+
+    assert odd.price == "+150"
+    assert odd.price_decimal == 2.5
+    assert odd.price_american == 150.0
+    assert odd.implied_probability == 0.4
+    assert "price_decimal" not in odd.model_dump()
+
+    missing = TimeSeriesEntry(price=None, locked=True, timestamp=1736985521512)
+    assert math.isnan(missing.price_decimal)
+    assert missing.price_in(PriceFormat.DECIMAL) == ""
+
+
+def test_accessors_follow_price_and_format_changes(
+    payload: Callable[[str], bytes],
+) -> None:
+    """Copies with a new price and retagged models should not read old values."""
+    odd = OddsResponse.model_validate_json(payload("odds")).events[0].odds[1]
+    assert odd.price_american == 150.0
+
+    moved = odd.model_copy(update={"price": "-200"})
+    assert moved.price_american == -200.0
+    assert moved.implied_probability == pytest.approx(2 / 3)
+    assert odd.price_american == 150.0
+
+    decimal = odd.model_copy(update={"price": "3.00"})
+    assert decimal.price_decimal == pytest.approx(1.03)  # read as American +3
+    set_price_format(decimal, PriceFormat.DECIMAL)
+    assert decimal.price_decimal == 3.0
+    assert decimal.price_american == 200.0
+
+
+def test_memo_table_hits_repeated_prices(payload: Callable[[str], bytes]) -> None:
+    """Repeated price strings should be served from the memo table."""
+    price_numbers.cache_clear()
+    board = OddsResponse.model_validate_json(payload("odds"))
+    odds = [odd for event in board.events for odd in event.odds]
+    assert all(0 < odd.implied_probability < 1 for odd in odds)
+
+    info = price_numbers.cache_info()
+    assert info.misses == len({odd.price for odd in odds})
+    assert info.hits == len(odds) - info.misses
+
+
+def test_client_tags_non_american_prices(
+    offline_settings: OddsblazeSettings, payload: Callable[[str], bytes]
+) -> None:
+    """Boards fetched in decimal should be read as decimal by every accessor."""
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, content=decimal_board(payload))
+    )
+    client = OddsblazeClient(settings=offline_settings, transport=transport)
+
+    eager = client.get_odds("draftkings", "nba", price=PriceFormat.DECIMAL)
+    lazy = client.get_odds("draftkings", "nba", price=PriceFormat.DECIMAL, lazy=True)
+    streamed = next(client.iter_odds("draftkings", "nba", price=PriceFormat.DECIMAL))
+
+    for odd in (eager.events[0].odds[1], lazy.events[0].odds[1], streamed.odds[1]):
+        assert odd.price == "2.50"
+        assert odd.price_american == 150.0
+        assert odd.price_in(PriceFormat.AMERICAN) == "+150"
@@ -0,0 +1,130 @@
+"""Tests for retries with backoff and client-side rate limiting."""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import Callable
+
+import httpx
+import pytest
+
+from oddsblaze import AsyncOddsblazeClient, OddsblazeClient, RateLimiter, RetryPolicy
+from oddsblaze.retry import parse_retry_after
+from oddsblaze.settings import OddsblazeSettings
+
+FAST = RetryPolicy(backoff=0.001, max_backoff=0.01)
+
+
+def scripted(
+    statuses: list[int], payload: Callable[[str], bytes], calls: list[float]
+) -> Callable[[httpx.Request], httpx.Response]:
+    """Answer with each status in turn, then with the recorded odds board."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(time.monotonic())
+        if len(calls) <= len(statuses):
+            status = statuses[len(calls) - 1]
+            if status == 0:
+                raise httpx.ConnectError("connection reset", request=request)
+            headers = {"Retry-After": "0"} if status == 429 else {}
+            return httpx.Response(status, headers=headers)
+        return httpx.Response(200, content=payload("odds"))
+
+    return handler
+
+
+def test_retries_transient_failures(
+    offline_settings: OddsblazeSettings, payload: Callable[[str], bytes]
+) -> None:
+    """429s, 5xx and connection errors should be retried until success."""
+    calls: list[float] = []
+    client = OddsblazeClient(
+        settings=offline_settings,
+        retry=FAST,
+        transport=httpx.MockTransport(scripted([503, 0, 429], payload, calls)),
+    )
+    assert client.get_odds("draftkings", "nba").events
+    assert len(calls) == 4
+
+
+def test_gives_up_when_not_retryable(
+    offline_settings: OddsblazeSettings, payload: Callable[[str], bytes]
+) -> None:
+    """Exhausted retries, 4xx and overlong Retry-After should raise."""
+    calls: list[float] = []
+    client = OddsblazeClient(
+        settings=offline_settings,
+        retry=FAST,
+        transport=httpx.MockTransport(scripted([500] * 5, payload, calls)),
+    )
+    with pytest.raises(httpx.HTTPStatusError):
+        client.get_odds("draftkings", "nba")
+    assert len(calls) == FAST.retries + 1
+
+    calls.clear()
+    client = OddsblazeClient(
+        settings=offline_settings,
+        retry=FAST,
+        transport=httpx.MockTransport(scripted([404], payload, calls)),
+    )
+    with pytest.raises(httpx.HTTPStatusError):
+        client.get_odds("draftkings", "nba")
+    assert len(calls) == 1
+
+    throttled = httpx.Response(429, headers={"Retry-After": "3600"})
+    assert FAST.delay(0, throttled) is None
+    assert FAST.delay(0, httpx.Response(429, headers={"Retry-After": "2"})) == 2.0
+    assert 0.0 <= FAST.delay(2) <= 0.004  # type: ignore[operator]
+
+
+def test_parse_retry_after() -> None:
+    """Both delta-seconds and HTTP dates should be understood."""
+    soon = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert parse_retry_after("7") == 7.0
+    delay = parse_retry_after(format_datetime(soon, usegmt=True))
+    assert delay is not None and 25 < delay <= 30
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_rate_limiter_spaces_requests() -> None:
+    """Tokens should be handed out `1 / rate` apart after the burst."""
+    limiter = RateLimiter(rate=100, burst=2)
+    waits = [limiter.reserve() for _ in range(4)]
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] == pytest.approx(0.01, abs=2e-3)
+    assert waits[3] == pytest.approx(0.02, abs=2e-3)
+
+    limiter = RateLimiter(rate=100)
+    limiter.pause(0.5)
+    assert limiter.reserve() == pytest.approx(0.5, abs=2e-3)
+
+
+def test_async_client_rate_limits_concurrent_calls(
+    offline_settings: OddsblazeSettings, payload: Callable[[str], bytes]
+) -> None:
+    """Concurrent calls should stay under the rate and still be retried."""
+    calls: list[float] = []
+    started: list[float] = []
+    limiter = RateLimiter(rate=50)
+
+    async def main() -> None:
+        client = AsyncOddsblazeClient(
+            settings=offline_settings,
+            retry=FAST,
+            rate_limiter=limiter,
+            coalesce=False,
+            transport=httpx.MockTransport(scripted([503], payload, calls)),
+        )
+        async with client:
+            started.append(time.monotonic())
+            await asyncio.gather(
+                *(client.get_odds("draftkings", "nba") for _ in range(5))
+            )
+
+    asyncio.run(main())
+    assert len(calls) == 6
+    # Six tokens at 50/s: the last is handed out 0.1s after the first. The
+    # first request itself may go out late, so measure from the start.
+    assert calls[-1] - started[0] >= 0.1
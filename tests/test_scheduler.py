@@ -0,0 +1,165 @@
+"""Tests for adaptive refresh scheduling under a request budget."""
+
+import asyncio
+import json
+import time
+from typing import Callable
+
+import httpx
+
+from oddsblaze import (
+    AsyncOddsblazeClient,
+    AsyncRefreshScheduler,
+    OddsblazeClient,
+    RefreshScheduler,
+)
+from oddsblaze.settings import OddsblazeSettings
+
+PAIRS = [("draftkings", "nba"), ("fanduel", "nba"), ("circa", "nba")]
+
+
+class Upstream:
+    """Mock API with per-book poll times, `last` values and live flags."""
+
+    def __init__(self, payload: Callable[[str], bytes]):
+        self.payload = payload
+        start = int(time.time() * 1000) - 60_000
+        self.polled = {book: start for book, _ in PAIRS}
+        self.last = {book: 1 for book, _ in PAIRS}
+        self.live = {"draftkings"}
+        self.fetched: list[str] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.host == "polled.oddsblaze.com":
+            books = [
+                {"id": book, "name": book, "timestamp": ms, "last": self.last[book]}
+                for book, ms in self.polled.items()
+            ]
+            body = {
+                "updated": "2024-01-01T00:00:00Z",
+                "leagues": [{"id": "nba", "name": "NBA", "sportsbooks": books}],
+            }
+            return httpx.Response(200, json=body)
+        sportsbook = request.url.params["sportsbook"]
+        self.fetched.append(sportsbook)
+        data = json.loads(self.payload("odds"))
+        data["sportsbook"] = {"id": sportsbook, "name": sportsbook}
+        for event in data["events"]:
+            event["live"] = sportsbook in self.live
+        return httpx.Response(200, json=data)
+
+    async def async_handler(self, request: httpx.Request) -> httpx.Response:
+        return self.handler(request)
+
+
+def test_scheduler_stays_within_budget(
+    offline_settings: OddsblazeSettings, payload: Callable[[str], bytes]
+) -> None:
+    """One cycle should never spend more than the budget allows."""
+    upstream = Upstream(payload)
+    client = OddsblazeClient(
+        settings=offline_settings, transport=httpx.MockTransport(upstream.handler)
+    )
+    scheduler = RefreshScheduler(client, PAIRS, budget=3.0)
+
+    # Three tokens: one for get_last_polled, two for odds.
+    assert len(scheduler.poll()) == 2
+    assert scheduler.poll() == []  # budget spent
+    assert len(upstream.fetched) == 2
+
+
+def test_scheduler_weights_live_active_boards(
+    offline_settings: OddsblazeSettings, payload: Callable[[str], bytes]
+) -> None:
+    """Live boards get shorter intervals; quiet upstream boards longer ones."""
+    upstream = Upstream(payload)
+    upstream.last["circa"] = 600
+    client = OddsblazeClient(
+        settings=offline_settings, transport=httpx.MockTransport(upstream.handler)
+    )
+    scheduler = RefreshScheduler(client, PAIRS, budget=100.0, min_interval=0.0)
+    assert len(scheduler.poll()) == 3
+    scheduler.poll()  # nothing moved upstream: no refreshes
+    assert len(upstream.fetched) == 3
+
+    stats = scheduler.stats
+    assert stats[("draftkings", "nba")].live
+    draftkings, fanduel, circa = (stats[pair].interval for pair in PAIRS)
+    assert draftkings < fanduel < circa
+    assert draftkings == fanduel / 4
+
+
+def test_scheduler_reports_staleness(
+    offline_settings: OddsblazeSettings, payload: Callable[[str], bytes]
+) -> None:
+    """A board should count as stale from the upstream poll that passed it."""
+    upstream = Upstream(payload)
+    client = OddsblazeClient(
+        settings=offline_settings, transport=httpx.MockTransport(upstream.handler)
+    )
+    scheduler = RefreshScheduler(client, PAIRS, budget=1000.0, min_interval=30.0)
+    scheduler.poll()
+    assert set(scheduler.staleness().values()) == {0.0}
+
+    # Upstream polled fanduel 10s ago; its interval has not elapsed yet.
+    upstream.polled["fanduel"] = int(time.time() * 1000) - 10_000
+    assert scheduler.poll() == []
+    lag = scheduler.staleness()
+    assert 9.5 < lag[("fanduel", "nba")] < 15 and lag[("circa", "nba")] == 0.0
+
+    scheduler.state.min_interval = 0.0
+    time.sleep(0.02)
+    refreshed = scheduler.poll()
+    assert [r.sportsbook for r in refreshed] == ["fanduel"]
+    fanduel = scheduler.stats[("fanduel", "nba")]
+    assert fanduel.fetches == 2 and 9.5 < fanduel.max_staleness < 15
+    assert scheduler.staleness()[("fanduel", "nba")] == 0.0
+
+
+def test_scheduler_tracks_pairs_reported_after_first_fetch(
+    offline_settings: OddsblazeSettings, payload: Callable[[str], bytes]
+) -> None:
+    """A pair missing from last-polled at its first fetch must not go quiet."""
+    upstream = Upstream(payload)
+    circa = upstream.polled.pop("circa")
+    client = OddsblazeClient(
+        settings=offline_settings, transport=httpx.MockTransport(upstream.handler)
+    )
+    scheduler = RefreshScheduler(client, PAIRS, budget=1000.0, min_interval=30.0)
+    assert len(scheduler.poll()) == 3
+    assert scheduler.stats[("circa", "nba")].fetched_upstream is None
+
+    # Upstream starts reporting circa; our board's freshness is unknown.
+    upstream.polled["circa"] = circa
+    assert scheduler.poll() == []
+    assert scheduler.staleness()[("circa", "nba")] > 50
+
+    scheduler.state.min_interval = 0.0
+    time.sleep(0.02)
+    assert [r.sportsbook for r in scheduler.poll()] == ["circa"]
+    stats = scheduler.stats[("circa", "nba")]
+    assert stats.fetched_upstream is not None and stats.max_staleness > 50
+    assert scheduler.poll() == []  # now current with upstream
+
+
+def test_async_scheduler_refreshes_advanced_pairs(
+    offline_settings: OddsblazeSettings, payload: Callable[[str], bytes]
+) -> None:
+    """The async scheduler should refresh only pairs upstream moved."""
+    upstream = Upstream(payload)
+
+    async def main() -> None:
+        async with AsyncOddsblazeClient(
+            settings=offline_settings,
+            transport=httpx.MockTransport(upstream.async_handler),
+        ) as client:
+            scheduler = AsyncRefreshScheduler(
+                client, PAIRS, budget=1000.0, min_interval=0.0
+            )
+            assert len(await scheduler.poll()) == 3
+            upstream.polled["circa"] += 1_000
+            await asyncio.sleep(0.02)
+            refreshed = await scheduler.poll()
+            assert [r.sportsbook for r in refreshed] == ["circa"]
+
+    asyncio.run(main())
@@ -0,0 +1,80 @@
+"""Tests for streaming odds one event at a time."""
+
+import asyncio
+from typing import Callable, Iterator
+
+import httpx
+import pytest
+
+from oddsblaze import AsyncOddsblazeClient, InvalidMarketError, OddsblazeClient
+from oddsblaze.models import Event, OddsResponse
+from oddsblaze.settings import OddsblazeSettings
+from oddsblaze.streaming import EventStreamParser
+
+
+def chunks(body: bytes, size: int) -> Iterator[bytes]:
+    for i in range(0, len(body), size):
+        yield body[i : i + size]
+
+
+@pytest.mark.parametrize("size", [1, 7, 4096])
+def test_parser_splits_events_across_any_chunking(
+    payload: Callable[[str], bytes], size: int
+) -> None:
+    """Events should come out whole regardless of where chunks are cut."""
+    body = payload("odds")
+    parser = EventStreamParser()
+
+    events = [
+        Event.model_validate_json(raw)
+        for chunk in chunks(body, size)
+        for raw in parser.feed(chunk)
+    ]
+    top = parser.close()
+
+    assert events == OddsResponse.model_validate_json(body).events
+    assert top["sportsbook"]["id"] == "draftkings"
+    assert top["events"] == []
+
+
+def test_parser_ignores_structure_inside_strings() -> None:
+    """Braces, brackets and escaped quotes in strings must not confuse depth."""
+    body = (
+        b'{"note": "events [", "events": [{"id": "a } \\" [", "x": {"events": []}},'
+        b' {"id": "b"}], "updated": "\\\\"}'
+    )
+    parser = EventStreamParser()
+
+    events = [raw for chunk in chunks(body, 3) for raw in parser.feed(chunk)]
+
+    assert events == [b'{"id": "a } \\" [", "x": {"events": []}}', b'{"id": "b"}']
+    assert parser.close() == {"note": "events [", "events": [], "updated": "\\"}
+
+
+def test_iter_odds_streams_events_and_raises_api_errors(
+    offline_settings: OddsblazeSettings, payload: Callable[[str], bytes]
+) -> None:
+    """Both clients should yield validated events and surface error payloads."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params.get("market") == "bogus":
+            return httpx.Response(200, json={"message": "Invalid market"})
+        return httpx.Response(200, content=payload("odds"))
+
+    client = OddsblazeClient(
+        settings=offline_settings, transport=httpx.MockTransport(handler)
+    )
+    events = list(client.iter_odds("draftkings", "nba"))
+    assert [event.id[-1] for event in events] == ["1", "2"]
+    assert events[0].odds[0].price == "-180"
+
+    with pytest.raises(InvalidMarketError):
+        list(client.iter_odds("draftkings", "nba", market="bogus"))
+
+    async def run() -> list[Event]:
+        async with AsyncOddsblazeClient(
+            settings=offline_settings, transport=httpx.MockTransport(handler)
+        ) as async_client:
+            return [e async for e in async_client.iter_odds("draftkings", "nba")]
+
+    assert asyncio.run(run()) == events
@@ -0,0 +1,144 @@
+"""Tests for tiered refresh of live and starting events."""
+
+import asyncio
+import copy
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+import httpx
+
+from oddsblaze import (
+    AsyncOddsblazeClient,
+    AsyncTieredRefresher,
+    OddsblazeClient,
+    TieredRefresher,
+)
+from oddsblaze.settings import OddsblazeSettings
+
+
+class Board:
+    """Mock odds host: one live, one starting and one later event."""
+
+    def __init__(self, payload: Callable[[str], bytes]):
+        data = json.loads(payload("odds"))
+        template = data["events"][0]
+        now = datetime.now(timezone.utc)
+        self.events: dict[str, dict[str, Any]] = {}
+        for name, start, live in (
+            ("live", now - timedelta(hours=1), True),
+            ("starting", now + timedelta(minutes=5), False),
+            ("later", now + timedelta(hours=5), False),
+        ):
+            event = copy.deepcopy(template)
+            event.update(id=name, date=start.isoformat(), live=live)
+            self.events[name] = event
+        self.base = {k: v for k, v in data.items() if k != "events"}
+        self.requests: list[dict[str, str]] = []
+
+    def set_price(self, event_id: str, price: str) -> None:
+        self.events[event_id]["odds"][0]["price"] = price
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        params = dict(request.url.params)
+        params.pop("key", None)
+        self.requests.append(params)
+        events = list(self.events.values())
+        if "event" in params:
+            wanted = params["event"].split(",")
+            events = [e for e in events if e["id"] in wanted]
+        if params.get("live") == "true":
+            events = [e for e in events if e["live"]]
+        return httpx.Response(200, json={**self.base, "events": events})
+
+    async def async_handler(self, request: httpx.Request) -> httpx.Response:
+        return self.handler(request)
+
+
+def test_hot_events_are_refreshed_and_merged(
+    offline_settings: OddsblazeSettings, payload: Callable[[str], bytes]
+) -> None:
+    """Partial fetches should update only hot events in a new snapshot."""
+    board = Board(payload)
+    client = OddsblazeClient(
+        settings=offline_settings, transport=httpx.MockTransport(board.handler)
+    )
+    refresher = TieredRefresher(
+        client, "draftkings", "nba", hot_interval=0.0, full_interval=3600.0
+    )
+
+    first = refresher.refresh()
+    assert first is not None and [e.id for e in first.events] == [
+        "live",
+        "starting",
+        "later",
+    ]
+    assert "event" not in board.requests[0] and "live" not in board.requests[0]
+
+    board.set_price("live", "+500")
+    board.set_price("later", "+900")
+    second = refresher.refresh()
+    assert second is not None and second is not first
+    assert board.requests[-1]["event"] == "live,starting"
+    by_id = {e.id: e for e in second.events}
+    assert by_id["live"].odds[0].price == "+500"
+    assert by_id["later"] is first.events[2]  # untouched, not refetched
+    assert first.events[0].odds[0].price != "+500"  # old snapshot unchanged
+
+    # Once the only hot events are live, `live=True` is enough; events that
+    # drop off the live board leave the snapshot.
+    board.events["starting"]["live"] = True
+    refresher.refresh()
+    board.events["live"]["live"] = False
+    third = refresher.refresh()
+    assert board.requests[-1].get("live") == "true"
+    assert third is not None
+    assert [e.id for e in third.events] == ["starting", "later"]
+    assert refresher.state.full_refreshes == 1
+    assert refresher.state.hot_refreshes == 3
+
+
+def test_full_board_is_refreshed_on_its_own_cadence(
+    offline_settings: OddsblazeSettings, payload: Callable[[str], bytes]
+) -> None:
+    """Nothing is fetched between cadences; full refreshes replace the board."""
+    board = Board(payload)
+    client = OddsblazeClient(
+        settings=offline_settings, transport=httpx.MockTransport(board.handler)
+    )
+    refresher = TieredRefresher(
+        client, "draftkings", "nba", hot_interval=3600.0, full_interval=3600.0
+    )
+    assert refresher.refresh() is not None
+    assert refresher.refresh() is None
+    assert len(board.requests) == 1
+
+    refresher.state.full_interval = 0.0
+    board.set_price("later", "+900")
+    snapshot = refresher.refresh()
+    assert snapshot is not None and snapshot.events[2].odds[0].price == "+900"
+    assert refresher.snapshot is snapshot
+
+
+def test_async_refresher_merges_partial_boards(
+    offline_settings: OddsblazeSettings, payload: Callable[[str], bytes]
+) -> None:
+    """The async refresher should plan and merge the same way."""
+    board = Board(payload)
+
+    async def main() -> None:
+        async with AsyncOddsblazeClient(
+            settings=offline_settings,
+            transport=httpx.MockTransport(board.async_handler),
+        ) as client:
+            refresher = AsyncTieredRefresher(
+                client, "draftkings", "nba", hot_interval=0.0
+            )
+            await refresher.refresh()
+            board.set_price("starting", "+250")
+            snapshot = await refresher.refresh()
+            assert snapshot is not None
+            assert snapshot.events[1].odds[0].price == "+250"
+            assert len(snapshot.events) == 3
+
+    asyncio.run(main())
@@ -0,0 +1,217 @@
+"""Tests for epoch-millisecond timestamps and the lazy timestamp models."""
+
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+import httpx
+from pydantic import BaseModel
+
+from oddsblaze import HistoricalStore, OddsblazeClient
+from oddsblaze.historical import historical_key
+from oddsblaze.models import (
+    HistoricalResponse,
+    LazyConsensusResponse,
+    LazyHistoricalResponse,
+    LazyPolledResponse,
+    LazyPolledSportsbook,
+    LazyPricePoint,
+    LazySportsbookPrice,
+    LazyTimeSeriesEntry,
+    LazyTimestampModel,
+    PolledResponse,
+    PricePoint,
+    TimeSeriesEntry,
+)
+from oddsblaze.models.base import ms_to_datetime
+from oddsblaze.settings import OddsblazeSettings
+
+CLOSE = datetime(2025, 1, 15, 23, 58, 41, 512000, tzinfo=timezone.utc)
+
+POLLED: dict[str, Any] = {
+    "updated": "2025-01-16T04:00:00Z",
+    "leagues": [
+        {
+            "id": "nba",
+            "name": "NBA",
+            "sportsbooks": [
+                {
+                    "id": "draftkings",
+                    "name": "DraftKings",
+                    "timestamp": 1736985521512,
+                    "last": 3,
+                }
+            ],
+        }
+    ],
+}
+
+CONSENSUS: dict[str, Any] = {
+    "updated": "2025-01-16T04:00:00Z",
+    "league": {"id": "nba", "name": "NBA", "sport": "Basketball"},
+    "sportsbook": {"id": "consensus", "name": "Consensus"},
+    "events": [
+        {
+            "id": "E1",
+            "teams": {
+                "away": {"id": "a", "name": "Away"},
+                "home": {"id": "h", "name": "Home"},
+            },
+            "date": "2025-01-16T00:00:00Z",
+            "live": False,
+            "odds": [
+                {
+                    "id": "C1",
+                    "market": "Moneyline",
+                    "name": "Home",
+                    "price": "-150",
+                    "sportsbooks": [
+                        {
+                            "name": "DraftKings",
+                            "price": "-150",
+                            "timestamp": 1736985521512,
+                        }
+                    ],
+                }
+            ],
+        }
+    ],
+}
+
+
+def historical_body(odds_id: str, clv: Optional[str]) -> dict[str, Any]:
+    body: dict[str, Any] = {
+        "updated": "2025-01-16T04:00:00Z",
+        "id": odds_id,
+        "market": "Moneyline",
+        "name": "Boston Celtics",
+        "olv": {"price": "-150", "timestamp": 1736900000000},
+        "entries": [
+            {"price": "-150", "locked": False, "timestamp": 1736900000000},
+            {"price": None, "locked": True, "timestamp": 1736950000000},
+            {"price": "-180", "locked": False, "timestamp": 1736985521512},
+        ],
+    }
+    if clv is not None:
+        body["clv"] = {"price": clv, "timestamp": 1736985521512}
+    return body
+
+
+def test_ms_timestamps_become_utc_datetimes() -> None:
+    """Epoch ms, ISO strings and datetimes should all read as the same time."""
+    body = historical_body("closed", "-180")
+    response = HistoricalResponse.model_validate(body)
+    assert response.clv is not None and response.clv.timestamp == CLOSE
+    assert response.clv.timestamp.tzinfo is not None
+    assert ms_to_datetime(1736985521512) == CLOSE
+
+    again = HistoricalResponse.model_validate_json(response.model_dump_json())
+    assert again == response
+    assert HistoricalResponse.model_validate(response.model_dump()) == response
+
+    polled = PolledResponse.model_validate(POLLED)
+    assert polled.leagues[0].sportsbooks[0].timestamp == CLOSE
+
+
+def test_small_numbers_are_still_milliseconds() -> None:
+    """Values pydantic would read as seconds should count milliseconds too."""
+    epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+    entry = TimeSeriesEntry.model_validate(
+        {"price": "-110", "locked": False, "timestamp": 1000}
+    )
+    assert entry.timestamp == datetime(1970, 1, 1, 0, 0, 1, tzinfo=timezone.utc)
+    point = PricePoint.model_validate_json('{"price": "-110", "timestamp": 1500.0}')
+    assert point.timestamp == epoch + timedelta(milliseconds=1500)
+    assert PricePoint(price="-110", timestamp=CLOSE.isoformat()).timestamp == CLOSE
+
+
+def test_get_last_polled_lazy(offline_settings: OddsblazeSettings) -> None:
+    """`lazy=True` should keep poll times in ms and agree with the eager model."""
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, content=json.dumps(POLLED))
+    )
+    client = OddsblazeClient(settings=offline_settings, transport=transport)
+    lazy = client.get_last_polled(league="nba", lazy=True)
+    eager = client.get_last_polled(league="nba")
+    assert isinstance(lazy, LazyPolledResponse)
+    (book,) = lazy.leagues[0].sportsbooks
+    assert book.timestamp_ms == 1736985521512 and book.last == 3
+    assert "timestamp" not in book.__dict__
+    assert book.timestamp == eager.leagues[0].sportsbooks[0].timestamp == CLOSE
+
+
+def test_lazy_models_keep_epoch_ms() -> None:
+    """Lazy models should store ints and build the same datetimes on read."""
+    body = historical_body("closed", "-180")
+    lazy = LazyHistoricalResponse.model_validate_json(json.dumps(body))
+    eager = HistoricalResponse.model_validate(body)
+    assert lazy.clv is not None and lazy.clv.timestamp_ms == 1736985521512
+    assert "timestamp" not in lazy.clv.__dict__
+    assert lazy.clv.timestamp == CLOSE
+    assert [e.timestamp for e in lazy.entries] == [e.timestamp for e in eager.entries]
+    assert lazy.entries[-1].price_american == -180.0
+
+    consensus = LazyConsensusResponse.model_validate(CONSENSUS)
+    quote = consensus.events[0].odds[0].sportsbooks[0]
+    assert quote.timestamp_ms == 1736985521512 and quote.timestamp == CLOSE
+
+
+def nested_models(model: BaseModel) -> list[BaseModel]:
+    """`model` and every model nested inside it, depth first."""
+    found = [model]
+    for name in type(model).model_fields:
+        value = getattr(model, name)
+        for item in value if isinstance(value, list) else [value]:
+            if isinstance(item, BaseModel):
+                found += nested_models(item)
+    return found
+
+
+def test_lazy_models_round_trip() -> None:
+    """Every lazy model should validate its own dump back into an equal model."""
+    responses = [
+        LazyHistoricalResponse.model_validate(historical_body("closed", "-180")),
+        LazyConsensusResponse.model_validate(CONSENSUS),
+        LazyPolledResponse.model_validate(POLLED),
+    ]
+    models = [m for response in responses for m in nested_models(response)]
+    lazy = {type(m) for m in models if isinstance(m, LazyTimestampModel)}
+    assert lazy == {
+        LazyPricePoint,
+        LazyTimeSeriesEntry,
+        LazySportsbookPrice,
+        LazyPolledSportsbook,
+    }
+    for model in models:
+        assert type(model).model_validate(model.model_dump()) == model
+        assert type(model).model_validate_json(model.model_dump_json()) == model
+
+
+def test_store_serves_every_response_type(
+    offline_settings: OddsblazeSettings, tmp_path: Path
+) -> None:
+    """A record stored by one call should decode as eager, lazy or raw."""
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.params["id"])
+        return httpx.Response(200, content=json.dumps(historical_body("id", "-180")))
+
+    store = HistoricalStore(tmp_path / "historical.bin")
+    client = OddsblazeClient(
+        settings=offline_settings,
+        historical_store=store,
+        transport=httpx.MockTransport(handler),
+    )
+    lazy = client.get_historical("id", time_series=True, lazy=True)
+    eager = client.get_historical("id", time_series=True)
+    stored_lazy = client.get_historical("id", time_series=True, lazy=True)
+    assert calls == ["id"]
+    assert isinstance(lazy, LazyHistoricalResponse)
+    assert isinstance(eager, HistoricalResponse)
+    assert stored_lazy == lazy
+    assert eager == HistoricalResponse.model_validate(historical_body("id", "-180"))
+
+    raw = store.get(historical_key("id", "american", True), None)
+    assert raw["clv"] == {"price": "-180", "timestamp": 1736985521512}
@@ -0,0 +1,79 @@
+"""Tests for connection pool configuration and warmup."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from oddsblaze import AsyncOddsblazeClient, OddsblazeClient
+from oddsblaze.settings import OddsblazeSettings
+from oddsblaze.transport import DEFAULT_LIMITS, build_mounts, host_of
+
+HOSTS = {
+    "https://api.oddsblaze.com",
+    "https://odds.oddsblaze.com",
+    "https://historical.oddsblaze.com",
+    "https://grader.oddsblaze.com",
+    "https://polled.oddsblaze.com",
+}
+
+
+def test_build_mounts_one_pool_per_host() -> None:
+    """Every API host should get its own transport with its own limits."""
+    odds_limits = httpx.Limits(max_connections=50, keepalive_expiry=120.0)
+    urls = [
+        OddsblazeClient.BASE_URL,
+        OddsblazeClient.ODDS_URL,
+        OddsblazeClient.HISTORICAL_URL,
+        OddsblazeClient.GRADER_URL,
+        OddsblazeClient.POLLED_URL,
+    ]
+    mounts = build_mounts(urls, host_limits={OddsblazeClient.ODDS_URL: odds_limits})
+
+    assert set(mounts) == HOSTS
+    assert host_of(OddsblazeClient.BASE_URL) == "https://api.oddsblaze.com"
+    odds_pool = mounts["https://odds.oddsblaze.com"]._pool
+    api_pool = mounts["https://api.oddsblaze.com"]._pool
+    assert odds_pool._max_connections == 50
+    assert api_pool._keepalive_expiry == DEFAULT_LIMITS.keepalive_expiry
+
+
+def test_warmup_touches_every_host(offline_settings: OddsblazeSettings) -> None:
+    """warmup() should open a connection to each of the five hosts."""
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(f"{request.url.scheme}://{request.url.host}")
+        return httpx.Response(200)
+
+    client = OddsblazeClient(
+        settings=offline_settings, transport=httpx.MockTransport(handler)
+    )
+    result = client.warmup(connections=2)
+
+    assert set(result) == HOSTS
+    assert all(result.values())
+    assert sorted(seen) == sorted(list(HOSTS) * 2)
+
+    with pytest.raises(ValueError):
+        client.warmup(connections=0)
+
+
+def test_async_warmup_reports_failed_hosts(offline_settings: OddsblazeSettings) -> None:
+    """Hosts that fail to connect should be reported, not raised."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "grader.oddsblaze.com":
+            raise httpx.ConnectError("unreachable", request=request)
+        return httpx.Response(200)
+
+    async def run() -> dict[str, bool]:
+        async with AsyncOddsblazeClient(
+            settings=offline_settings, transport=httpx.MockTransport(handler)
+        ) as client:
+            return await client.warmup()
+
+    result = asyncio.run(run())
+
+    assert result.pop("https://grader.oddsblaze.com") is False
+    assert all(result.values())